@@ -21,6 +21,9 @@ from dataclasses import dataclass, asdict
 from datetime import datetime
 import hashlib
 import subprocess
+import zipfile
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 
 @dataclass
 class Vulnerability:
@@ -50,11 +53,338 @@ class Dependency:
         if self.vulnerabilities is None:
             self.vulnerabilities = []
 
+# Version ordering
+#
+# Versions are turned into tuples that sort in the ecosystem's own order, so range checks are
+# plain comparisons. PyPI follows PEP 440; every other ecosystem uses semver-style ordering
+# (numeric release, then pre-release identifiers, build metadata ignored), which also covers
+# RubyGems' "1.0.0.pre1" and Go's "v1.2.3" forms.
+
+_PEP440_RE = re.compile(r"""
+    v?
+    (?:(?P<epoch>[0-9]+)!)?
+    (?P<release>[0-9]+(?:\.[0-9]+)*)
+    (?:[-_.]?(?P<pre_l>alpha|a|beta|b|preview|pre|c|rc)[-_.]?(?P<pre_n>[0-9]+)?)?
+    (?:-(?P<post_n1>[0-9]+)|[-_.]?(?P<post_l>post|rev|r)[-_.]?(?P<post_n2>[0-9]+)?)?
+    (?:[-_.]?(?P<dev_l>dev)[-_.]?(?P<dev_n>[0-9]+)?)?
+    (?:\+(?P<local>[a-z0-9]+(?:[-_.][a-z0-9]+)*))?
+""", re.VERBOSE | re.IGNORECASE)
+
+_SEMVER_RE = re.compile(r'v?(\d+(?:\.\d+)*)(?:[-.]?([0-9A-Za-z][0-9A-Za-z.-]*))?')
+
+_PRE_RANK = {'a': 0, 'alpha': 0, 'b': 1, 'beta': 1, 'c': 2, 'rc': 2, 'pre': 2, 'preview': 2}
+
+# OSV ecosystem names -> the ecosystem names the parsers below emit
+_OSV_ECOSYSTEMS = {'npm': 'npm', 'PyPI': 'pypi', 'Go': 'go', 'crates.io': 'cargo', 'RubyGems': 'rubygems'}
+
+
+def _release(text: str) -> Tuple[int, ...]:
+    parts = [int(x) for x in text.split('.')]
+    while len(parts) > 1 and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+
+def _pep440_key(version: str) -> Optional[tuple]:
+    """PEP 440 sort key: epoch, release, pre, post, dev, local."""
+    match = _PEP440_RE.fullmatch(version)
+    if not match:
+        return None
+    pre_l = match.group('pre_l')
+    post = match.group('post_n1') or match.group('post_n2')
+    has_post = match.group('post_n1') is not None or match.group('post_l') is not None
+    has_dev = match.group('dev_l') is not None
+    if pre_l:
+        pre = (_PRE_RANK[pre_l.lower()], int(match.group('pre_n') or 0))
+    elif has_dev and not has_post:
+        pre = (-1, 0)  # 1.0.dev1 sorts before 1.0a1
+    else:
+        pre = (3, 0)
+    local = tuple((1, int(part), '') if part.isdigit() else (0, 0, part.lower())
+                  for part in re.split(r'[-_.]', match.group('local') or '') if part)
+    return (int(match.group('epoch') or 0), _release(match.group('release')), pre,
+            int(post or 0) if has_post else -1,
+            (0, int(match.group('dev_n') or 0)) if has_dev else (1, 0),
+            local)
+
+
+def _semver_key(version: str) -> Optional[tuple]:
+    """Semver-style sort key: release, then pre-release identifiers (a release sorts last)."""
+    match = _SEMVER_RE.fullmatch(version.split('+', 1)[0])
+    if not match:
+        return None
+    if match.group(2) is None:
+        return (_release(match.group(1)), (1,))
+    identifiers = tuple((0, int(part), '') if part.isdigit() else (1, 0, part)
+                        for part in re.split(r'[.-]', match.group(2)) if part)
+    return (_release(match.group(1)), (0, identifiers))
+
+
+def version_key(version: str, ecosystem: Optional[str]) -> Optional[tuple]:
+    """Sortable key for `version` in `ecosystem`, or None if it is not a concrete version."""
+    version = version.strip().lstrip('=').strip()
+    if not version or re.search(r'(^|\.)[xX*](\.|$)', version):  # "1.x" is a range, not a version
+        return None
+    return _pep440_key(version) if ecosystem == 'pypi' else _semver_key(version)
+
+
+def parse_range(expression: str) -> List[Tuple[Optional[str], bool, Optional[str], bool]]:
+    """
+    Parse an affected-versions expression into (low, low inclusive, high, high inclusive) intervals.
+
+    Comparators (<, <=, >, >=, =, ==) within an alternative are ANDed, separated by spaces or
+    commas; alternatives are separated by "||". A bare version is an exact match and "*" matches
+    everything. None stands for an unbounded end.
+    """
+    intervals = []
+    for alternative in expression.split('||'):
+        low, low_inclusive, high, high_inclusive = None, True, None, False
+        comparators = re.findall(r'(<=|>=|==|=|<|>)?\s*([^\s,<>=|]+)', alternative)
+        if not comparators:
+            continue
+        for operator, version in comparators:
+            if version == '*':
+                continue
+            if operator in ('>', '>='):
+                low, low_inclusive = version, operator == '>='
+            elif operator in ('<', '<='):
+                high, high_inclusive = version, operator == '<='
+            else:
+                low, low_inclusive, high, high_inclusive = version, True, version, True
+        intervals.append((low, low_inclusive, high, high_inclusive))
+    return intervals
+
+
+def format_range(intervals: List[Tuple[Optional[str], bool, Optional[str], bool]]) -> str:
+    """Inverse of parse_range, used to describe OSV ranges."""
+    alternatives = []
+    for low, low_inclusive, high, high_inclusive in intervals:
+        if low is not None and low == high:
+            alternatives.append(f"={low}")
+            continue
+        parts = []
+        if low is not None:
+            parts.append(f"{'>=' if low_inclusive else '>'}{low}")
+        if high is not None:
+            parts.append(f"{'<=' if high_inclusive else '<'}{high}")
+        alternatives.append(' '.join(parts) or '*')
+    return ' || '.join(alternatives)
+
+
+def _normalize_name(name: str, ecosystem: Optional[str]) -> str:
+    return re.sub(r'[-_.]+', '-', name).lower() if ecosystem == 'pypi' else name
+
+
+class VulnerabilityIndex:
+    """
+    Advisories compiled into per-package interval tables, queried by binary search.
+
+    Advisories are stored raw and compiled the first time a package is looked up: every interval
+    endpoint of the package becomes a sorted key, and each of the 2n + 1 slots (the n endpoints
+    and the gaps around them) holds the advisories covering it. A lookup is one bisect, however
+    many advisories the package has. Packages are keyed by (ecosystem, name); the built-in
+    database has no ecosystem and is compiled with the querying dependency's version ordering.
+    """
+    
+    def __init__(self):
+        self._raw: Dict[Tuple[Optional[str], str], List[Tuple[list, Vulnerability]]] = {}
+        self._compiled: Dict[Tuple[Optional[str], str, Optional[str]], Tuple[list, list]] = {}
+        # Lockfiles across a monorepo repeat the same (ecosystem, name, version) many times
+        self._results: Dict[Tuple[Optional[str], str, str], List[Vulnerability]] = {}
+        self.advisory_count = 0
+    
+    def add(self, ecosystem: Optional[str], name: str,
+            intervals: List[Tuple[Optional[str], bool, Optional[str], bool]], vulnerability: Vulnerability):
+        """Register `vulnerability` as affecting `intervals` of package `name`."""
+        if intervals:
+            key = (ecosystem, _normalize_name(name, ecosystem))
+            self._raw.setdefault(key, []).append((intervals, vulnerability))
+            if self._compiled:
+                self._compiled.clear()
+                self._results.clear()
+            self.advisory_count += 1
+    
+    def _compile(self, key: Tuple[Optional[str], str], ecosystem: Optional[str]) -> Tuple[list, list]:
+        entries = []
+        for intervals, vulnerability in self._raw[key]:
+            for low, low_inclusive, high, high_inclusive in intervals:
+                low_key = version_key(low, ecosystem) if low is not None else None
+                high_key = version_key(high, ecosystem) if high is not None else None
+                if (low is not None and low_key is None) or (high is not None and high_key is None):
+                    continue
+                entries.append((low_key, low_inclusive, high_key, high_inclusive, vulnerability))
+        
+        points = sorted({k for e in entries for k in (e[0], e[2]) if k is not None})
+        position = {k: i for i, k in enumerate(points)}
+        slots: List[List[Vulnerability]] = [[] for _ in range(2 * len(points) + 1)]
+        for low_key, low_inclusive, high_key, high_inclusive, vulnerability in entries:
+            # Slot 2i + 1 is exactly points[i]; slot 2i is the gap below it
+            first = 0 if low_key is None else 2 * position[low_key] + (1 if low_inclusive else 2)
+            last = 2 * len(points) if high_key is None else 2 * position[high_key] + (1 if high_inclusive else 0)
+            for slot in range(first, last + 1):
+                # Entries are grouped by advisory, so a repeat can only be the last one added
+                if not slots[slot] or slots[slot][-1] is not vulnerability:
+                    slots[slot].append(vulnerability)
+        return points, slots
+    
+    def lookup(self, ecosystem: Optional[str], name: str, version: str) -> List[Vulnerability]:
+        """Advisories affecting `name` at `version`, in registration order and without repeats."""
+        result_key = (ecosystem, name, version)
+        found = self._results.get(result_key)
+        if found is None:
+            found = self._results[result_key] = self._lookup(ecosystem, name, version)
+        return list(found)
+    
+    def _lookup(self, ecosystem: Optional[str], name: str, version: str) -> List[Vulnerability]:
+        found: List[Vulnerability] = []
+        query = None
+        for index_ecosystem in (ecosystem, None):
+            candidates = dict.fromkeys([name, name.lower(), _normalize_name(name, index_ecosystem)])
+            for candidate in candidates:
+                key = (index_ecosystem, candidate)
+                if key not in self._raw:
+                    continue
+                compiled_key = key + (ecosystem,)
+                table = self._compiled.get(compiled_key)
+                if table is None:
+                    table = self._compiled[compiled_key] = self._compile(key, ecosystem)
+                if query is None:
+                    query = version_key(version, ecosystem)
+                    if query is None:
+                        return found
+                points, slots = table
+                i = bisect_left(points, query)
+                slot = 2 * i + 1 if i < len(points) and points[i] == query else 2 * i
+                for vulnerability in slots[slot]:
+                    if all(v.id != vulnerability.id for v in found):
+                        found.append(vulnerability)
+        return found
+    
+    # OSV loading
+    
+    def load_osv(self, path: str) -> int:
+        """
+        Load advisories from an OSV dump: a directory of .json files, a zip (as published per
+        ecosystem at osv-vulnerabilities.storage.googleapis.com), a .json file holding one advisory
+        or a list of them, or a .jsonl file. Returns the number of advisories added.
+        """
+        before = self.advisory_count
+        for record in self._iter_osv_records(Path(path)):
+            self.add_osv(record)
+        return self.advisory_count - before
+    
+    def _iter_osv_records(self, path: Path):
+        if path.is_dir():
+            for root, dirs, filenames in os.walk(path):
+                dirs.sort()
+                for filename in sorted(filenames):
+                    if filename.endswith('.json'):
+                        yield from self._iter_osv_records(Path(root) / filename)
+        elif path.suffix == '.zip':
+            with zipfile.ZipFile(path) as archive:
+                for member in archive.namelist():
+                    if member.endswith('.json'):
+                        yield json.loads(archive.read(member))
+        elif path.suffix == '.jsonl':
+            with open(path, 'r') as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+        else:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            yield from (data if isinstance(data, list) else [data])
+    
+    def add_osv(self, record: Dict[str, Any]):
+        """Index one OSV advisory record."""
+        if record.get('withdrawn'):
+            return
+        severity = str((record.get('database_specific') or {}).get('severity', 'MEDIUM')).upper()
+        severity = {'MODERATE': 'MEDIUM'}.get(severity, severity)
+        cvss_score = 0.0
+        for entry in record.get('severity') or []:
+            try:
+                cvss_score = float(entry.get('score'))
+            except (TypeError, ValueError):
+                continue
+        references = [ref['url'] for ref in record.get('references') or [] if 'url' in ref]
+        
+        for affected in record.get('affected') or []:
+            package = affected.get('package') or {}
+            if 'name' not in package:
+                continue
+            ecosystem = _OSV_ECOSYSTEMS.get(package.get('ecosystem'), str(package.get('ecosystem', '')).lower())
+            intervals, fixed = [], None
+            for version_range in affected.get('ranges') or []:
+                if version_range.get('type') == 'GIT':
+                    continue
+                low, is_open = None, False
+                for event in version_range.get('events') or []:
+                    if 'introduced' in event:
+                        low = None if event['introduced'] == '0' else event['introduced']
+                        is_open = True
+                    elif is_open and ('fixed' in event or 'limit' in event):
+                        high = event.get('fixed') or event['limit']
+                        fixed = fixed or event.get('fixed')
+                        intervals.append((low, True, high, False))
+                        is_open = False
+                    elif is_open and 'last_affected' in event:
+                        intervals.append((low, True, event['last_affected'], True))
+                        is_open = False
+                if is_open:
+                    intervals.append((low, True, None, False))
+            if not intervals:
+                intervals = [(v, True, v, True) for v in affected.get('versions') or []]
+            
+            self.add(ecosystem, package['name'], intervals, Vulnerability(
+                id=record.get('id', ''),
+                summary=record.get('summary') or (record.get('details') or '')[:120],
+                severity=severity,
+                cvss_score=cvss_score,
+                affected_versions=format_range(intervals),
+                fixed_version=fixed,
+                published_date=(record.get('published') or '')[:10],
+                references=references
+            ))
+
+
+_WORKER = {}
+
+
+def _init_parse_worker():
+    _WORKER['scanner'] = DependencyScanner()
+
+
+def _parse_task(task: Tuple[str, Path]) -> List[Dependency]:
+    filename, file_path = task
+    return _WORKER['scanner'].supported_files[filename](file_path)
+
+
 class DependencyScanner:
     """Main dependency scanner class."""
     
-    def __init__(self):
+    # Directories never searched for dependency files (installed packages, VCS metadata, caches)
+    SKIP_DIRS = {
+        'node_modules', '.git', '.hg', '.svn', '__pycache__', '.venv', 'venv',
+        '.tox', '.mypy_cache', '.pytest_cache'
+    }
+    
+    # Lockfiles can be large; with jobs > 1 these are parsed in worker processes
+    LOCKFILES = {'package-lock.json', 'yarn.lock', 'Pipfile.lock', 'poetry.lock', 'Cargo.lock', 'Gemfile.lock'}
+    
+    CACHE_FILE = '.dep_scanner.cache'
+    
+    def __init__(self, osv_paths: Optional[List[str]] = None, jobs: int = 1,
+                 cache_path: Optional[str] = None):
+        self.jobs = max(1, jobs)
+        self.cache_path = cache_path
         self.known_vulnerabilities = self._load_vulnerability_database()
+        self.vulnerability_index = VulnerabilityIndex()
+        for name, vulnerabilities in self.known_vulnerabilities.items():
+            for vuln in vulnerabilities:
+                self.vulnerability_index.add(None, name, parse_range(vuln.affected_versions), vuln)
+        for osv_path in osv_paths or []:
+            self.vulnerability_index.load_osv(osv_path)
         self.supported_files = {
             'package.json': self._parse_package_json,
             'package-lock.json': self._parse_package_lock,
@@ -213,35 +543,29 @@ class DependencyScanner:
             'recommendations': []
         }
         
-        # Find and parse dependency files
-        for file_pattern, parser in self.supported_files.items():
-            matching_files = list(project_path.rglob(file_pattern))
+        # Find and parse dependency files (one walk, in supported_files order)
+        for dep_file, dependencies in self._parse_files(self._find_dependency_files(project_path)):
+            if isinstance(dependencies, Exception):
+                print(f"Error parsing {dep_file}: {dependencies}")
+                continue
+            scan_results['dependencies'].extend(dependencies)
             
-            for dep_file in matching_files:
-                try:
-                    dependencies = parser(dep_file)
-                    scan_results['dependencies'].extend(dependencies)
-                    
-                    for dep in dependencies:
-                        scan_results['ecosystems'].add(dep.ecosystem)
-                        
-                        # Check for vulnerabilities
-                        vulnerabilities = self._check_vulnerabilities(dep)
-                        dep.vulnerabilities = vulnerabilities
-                        
-                        scan_results['vulnerabilities_found'] += len(vulnerabilities)
-                        
-                        for vuln in vulnerabilities:
-                            if vuln.severity == 'HIGH':
-                                scan_results['high_severity_count'] += 1
-                            elif vuln.severity == 'MEDIUM':
-                                scan_results['medium_severity_count'] += 1
-                            else:
-                                scan_results['low_severity_count'] += 1
+            for dep in dependencies:
+                scan_results['ecosystems'].add(dep.ecosystem)
                 
-                except Exception as e:
-                    print(f"Error parsing {dep_file}: {e}")
-                    continue
+                # Check for vulnerabilities
+                vulnerabilities = self._check_vulnerabilities(dep)
+                dep.vulnerabilities = vulnerabilities
+                
+                scan_results['vulnerabilities_found'] += len(vulnerabilities)
+                
+                for vuln in vulnerabilities:
+                    if vuln.severity in ('CRITICAL', 'HIGH'):
+                        scan_results['high_severity_count'] += 1
+                    elif vuln.severity == 'MEDIUM':
+                        scan_results['medium_severity_count'] += 1
+                    else:
+                        scan_results['low_severity_count'] += 1
         
         scan_results['ecosystems'] = list(scan_results['ecosystems'])
         scan_results['scan_summary'] = self._generate_scan_summary(scan_results)
@@ -249,59 +573,144 @@ class DependencyScanner:
         
         return scan_results
     
-    def _check_vulnerabilities(self, dependency: Dependency) -> List[Vulnerability]:
-        """Check if a dependency has known vulnerabilities."""
-        vulnerabilities = []
+    def _find_dependency_files(self, project_path: Path) -> List[Tuple[str, Path]]:
+        """
+        Walk the project once, skipping SKIP_DIRS, and return (filename, path) pairs for every
+        supported dependency file, ordered by supported_files and then by walk order.
+        """
+        if project_path.is_file():
+            name = project_path.name
+            return [(name, project_path)] if name in self.supported_files else []
         
-        # Check package name (exact match and common variations)
-        package_names = [dependency.name, dependency.name.lower()]
+        order = {name: i for i, name in enumerate(self.supported_files)}
+        found = []
+        stack = [str(project_path)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+            subdirs = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self.SKIP_DIRS:
+                            subdirs.append(entry.path)
+                    elif entry.name in order and entry.is_file():
+                        found.append((entry.name, Path(entry.path)))
+                except OSError:
+                    continue
+            stack.extend(reversed(subdirs))
         
-        for pkg_name in package_names:
-            if pkg_name in self.known_vulnerabilities:
-                for vuln in self.known_vulnerabilities[pkg_name]:
-                    if self._version_matches_vulnerability(dependency.version, vuln.affected_versions):
-                        vulnerabilities.append(vuln)
+        # Stable sort keeps walk order within each file type
+        found.sort(key=lambda item: order[item[0]])
+        return found
+    
+    def _parse_files(self, files: List[Tuple[str, Path]]) -> List[Tuple[Path, Any]]:
+        """
+        Parse dependency files, returning (path, dependencies or the exception raised).
         
-        return vulnerabilities
+        With a cache, files whose contents hash to a cached entry are not parsed again; with
+        jobs > 1, lockfiles are parsed in worker processes while manifests are parsed inline.
+        """
+        cache = self._load_parse_cache() if self.cache_path else None
+        keys: Dict[Path, str] = {}
+        results: Dict[Path, Any] = {}
+        pending = []
+        for filename, file_path in files:
+            if cache is not None:
+                try:
+                    digest = hashlib.blake2b(file_path.read_bytes(), digest_size=16).hexdigest()
+                except OSError as e:
+                    results[file_path] = e
+                    continue
+                keys[file_path] = f"{filename}:{digest}"
+                if keys[file_path] in cache['entries']:
+                    results[file_path] = [Dependency(*fields) for fields in cache['entries'][keys[file_path]]]
+                    continue
+            pending.append((filename, file_path))
+        
+        offload = [task for task in pending if task[0] in self.LOCKFILES] if self.jobs > 1 else []
+        if len(offload) > 1:
+            with ProcessPoolExecutor(min(self.jobs, len(offload)), initializer=_init_parse_worker) as pool:
+                futures = [(task[1], pool.submit(_parse_task, task)) for task in offload]
+                offloaded = set(offload)
+                self._parse_inline([task for task in pending if task not in offloaded], results)
+                for file_path, future in futures:
+                    try:
+                        results[file_path] = future.result()
+                    except Exception as e:
+                        results[file_path] = e
+        else:
+            self._parse_inline(pending, results)
+        
+        if cache is not None and set(keys.values()) != set(cache['entries']):
+            entries = {}
+            for file_path, key in keys.items():
+                dependencies = results.get(file_path)
+                if isinstance(dependencies, list):
+                    entries[key] = [[dep.name, dep.version, dep.ecosystem, dep.direct, dep.license,
+                                     dep.description, dep.homepage] for dep in dependencies]
+            self._save_parse_cache(entries)
+        
+        return [(file_path, results[file_path]) for _, file_path in files]
     
-    def _version_matches_vulnerability(self, version: str, affected_pattern: str) -> bool:
-        """Check if a version matches a vulnerability pattern."""
-        # Simple version matching - in production, use proper semver library
+    def _parse_inline(self, tasks: List[Tuple[str, Path]], results: Dict[Path, Any]):
+        for filename, file_path in tasks:
+            try:
+                results[file_path] = self.supported_files[filename](file_path)
+            except Exception as e:
+                results[file_path] = e
+    
+    def _parser_version(self) -> str:
+        """Cached parses are only valid for this exact scanner source."""
+        try:
+            return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+        except OSError:
+            return 'unknown'
+    
+    def _load_parse_cache(self) -> Dict[str, Any]:
         try:
-            # Handle common patterns like "<4.17.21", ">=1.0.0 <1.6.0"
-            if '<' in affected_pattern and '>' not in affected_pattern:
-                # Pattern like "<4.17.21"
-                max_version = affected_pattern.replace('<', '').strip()
-                return self._compare_versions(version, max_version) < 0
-            elif '>=' in affected_pattern and '<' in affected_pattern:
-                # Pattern like ">=1.0.0 <1.6.0"
-                parts = affected_pattern.split('<')
-                min_part = parts[0].replace('>=', '').strip()
-                max_part = parts[1].strip()
-                return (self._compare_versions(version, min_part) >= 0 and 
-                       self._compare_versions(version, max_part) < 0)
-        except:
+            with open(self.cache_path, 'r') as f:
+                cache = json.load(f)
+            if cache.get('version') == self._parser_version():
+                return cache
+        except (OSError, ValueError, AttributeError):
             pass
-        
-        return False
+        return {'version': self._parser_version(), 'entries': {}}
     
-    def _compare_versions(self, v1: str, v2: str) -> int:
-        """Simple version comparison. Returns -1, 0, or 1."""
+    def _save_parse_cache(self, entries: Dict[str, List]):
+        """Write only entries for files seen this run, so removed lockfiles age out."""
+        tmp_path = f"{self.cache_path}.tmp"
         try:
-            def normalize(v):
-                return [int(x) for x in re.sub(r'(\.0+)*$','', v).split('.')]
-            
-            v1_parts = normalize(v1)
-            v2_parts = normalize(v2)
-            
-            if v1_parts < v2_parts:
-                return -1
-            elif v1_parts > v2_parts:
-                return 1
-            else:
-                return 0
-        except:
-            return 0
+            with open(tmp_path, 'w') as f:
+                json.dump({'version': self._parser_version(), 'entries': entries}, f, separators=(',', ':'))
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"Warning: could not write cache {self.cache_path}: {e}", file=sys.stderr)
+    
+    def _check_vulnerabilities(self, dependency: Dependency) -> List[Vulnerability]:
+        """Check if a dependency has known vulnerabilities."""
+        return self.vulnerability_index.lookup(dependency.ecosystem, dependency.name, dependency.version)
+    
+    def _version_matches_vulnerability(self, version: str, affected_pattern: str,
+                                       ecosystem: Optional[str] = None) -> bool:
+        """Check if a version matches a vulnerability pattern."""
+        key = version_key(version, ecosystem)
+        if key is None:
+            return False
+        for low, low_inclusive, high, high_inclusive in parse_range(affected_pattern):
+            low_key = version_key(low, ecosystem) if low is not None else None
+            high_key = version_key(high, ecosystem) if high is not None else None
+            if (low is not None and low_key is None) or (high is not None and high_key is None):
+                continue
+            if low_key is not None and (key < low_key or (key == low_key and not low_inclusive)):
+                continue
+            if high_key is not None and (key > high_key or (key == high_key and not high_inclusive)):
+                continue
+            return True
+        return False
     
     # Package file parsers
     
@@ -754,6 +1163,8 @@ Examples:
   python dep_scanner.py /path/to/project
   python dep_scanner.py . --format json --output results.json
   python dep_scanner.py /app --fail-on-high
+  python dep_scanner.py . --osv ~/osv/npm.zip --osv ~/osv/PyPI.zip
+  python dep_scanner.py /monorepo --jobs 8 --cache
         """
     )
     
@@ -767,11 +1178,21 @@ Examples:
                        help='Exit with error code if high-severity vulnerabilities found')
     parser.add_argument('--quick-scan', action='store_true',
                        help='Perform quick scan (skip transitive dependencies)')
+    parser.add_argument('--osv', action='append', metavar='PATH',
+                       help='Also match against an OSV advisory dump (zip, directory, .json or .jsonl); repeatable')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Parse lockfiles across N processes (default: 1)')
+    parser.add_argument('--cache', nargs='?', const=DependencyScanner.CACHE_FILE, metavar='PATH',
+                       help=f'Reuse parsed dependencies for unchanged files (default: <project>/{DependencyScanner.CACHE_FILE})')
     
     args = parser.parse_args()
     
     try:
-        scanner = DependencyScanner()
+        cache_path = args.cache
+        if cache_path == DependencyScanner.CACHE_FILE and os.path.isdir(args.project_path):
+            cache_path = os.path.join(args.project_path, DependencyScanner.CACHE_FILE)
+        scanner = DependencyScanner(osv_paths=args.osv, jobs=args.jobs or os.cpu_count() or 1,
+                                    cache_path=cache_path)
         results = scanner.scan_project(args.project_path)
         report = scanner.generate_report(results, args.format)
         
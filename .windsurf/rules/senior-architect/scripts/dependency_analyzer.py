@@ -4,7 +4,7 @@ Dependency Analyzer
 
 Analyzes project dependencies for:
 - Dependency tree (direct and transitive)
-- Circular dependencies between modules
+- Circular dependencies between modules (strongly connected components of the import graph)
 - Coupling score (0-100)
 - Outdated packages (basic detection)
 
@@ -20,11 +20,155 @@ import sys
 import json
 import argparse
 import re
+import posixpath
+from array import array
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional
 from collections import defaultdict
 
 
+# Import statements, per language. Python imports are only taken at module level: an import
+# inside a function is the usual way to break an import-time cycle.
+PY_FROM_RE = re.compile(r'^from[ \t]+(\.*)([\w.]*)[ \t]+import[ \t]+(\([^)]*\)|[^\n#;]*)', re.MULTILINE)
+PY_IMPORT_RE = re.compile(r'^import[ \t]+([^\n#;]+)', re.MULTILINE)
+# TypeScript type-only imports/exports are erased at compile time and cannot form a runtime cycle
+JS_TYPE_IMPORT_RE = re.compile(r'\b(?:import|export)\s+type\b[^;\'"]*?from\s*[\'"][^\'"]+[\'"]')
+JS_IMPORT_RE = re.compile(r'(?:\bfrom|\bimport|\brequire)\s*\(?\s*[\'"]([^\'"\s]+)[\'"]')
+GO_IMPORT_BLOCK_RE = re.compile(r'^import\s*\(([^)]*)\)', re.MULTILINE)
+GO_IMPORT_LINE_RE = re.compile(r'^import\s+(?:[\w.]+\s+)?"([^"]+)"', re.MULTILINE)
+GO_MODULE_RE = re.compile(r'^module\s+(\S+)', re.MULTILINE)
+
+JS_EXTENSIONS = ('.js', '.ts', '.jsx', '.tsx', '.mjs', '.cjs')
+
+
+class ImportGraph:
+    """
+    Module import graph with integer node ids and adjacency stored as compact arrays.
+
+    Edges are collected into two int arrays and frozen into CSR form (offsets/targets), so a
+    graph of 50k modules and a few hundred thousand imports stays small and is walked without
+    per-node containers. Cycles are reported as strongly connected components found with an
+    iterative Tarjan pass, which is linear and has no recursion limit.
+    """
+
+    def __init__(self):
+        self.names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._sources = array('i')
+        self._targets = array('i')
+        self.offsets = array('i', [0])
+        self.targets = array('i')
+
+    def node(self, name: str) -> int:
+        """Id for `name`, adding the node if needed."""
+        node_id = self._ids.get(name)
+        if node_id is None:
+            node_id = self._ids[name] = len(self.names)
+            self.names.append(name)
+        return node_id
+
+    def add_edge(self, source: int, target: int):
+        if source != target:
+            self._sources.append(source)
+            self._targets.append(target)
+
+    def freeze(self):
+        """Build the CSR arrays (targets sorted and de-duplicated per node)."""
+        n = len(self.names)
+        counts = [0] * (n + 1)
+        for source in self._sources:
+            counts[source + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+        position = counts[:-1]
+        flat = array('i', bytes(4 * len(self._targets)))
+        for source, target in zip(self._sources, self._targets):
+            flat[position[source]] = target
+            position[source] += 1
+
+        self.offsets = array('i', [0])
+        self.targets = array('i')
+        for i in range(n):
+            self.targets.extend(sorted(set(flat[counts[i]:counts[i + 1]])))
+            self.offsets.append(len(self.targets))
+        self._sources = array('i')
+        self._targets = array('i')
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def strongly_connected_components(self) -> List[List[int]]:
+        """Tarjan's algorithm with an explicit stack; returns components of two or more nodes."""
+        n = len(self.names)
+        offsets, targets = self.offsets, self.targets
+        index = [-1] * n
+        low = [0] * n
+        on_stack = [False] * n
+        stack: List[int] = []
+        components = []
+        counter = 0
+
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [[root, offsets[root]]]
+            while work:
+                frame = work[-1]
+                v, i = frame
+                if i < offsets[v + 1]:
+                    frame[1] = i + 1
+                    w = targets[i]
+                    if index[w] == -1:
+                        index[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = True
+                        work.append([w, offsets[w]])
+                    elif on_stack[w] and index[w] < low[v]:
+                        low[v] = index[w]
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[v] < low[parent]:
+                        low[parent] = low[v]
+                if low[v] == index[v]:
+                    component = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component.append(w)
+                        if w == v:
+                            break
+                    if len(component) > 1:
+                        components.append(component)
+        return components
+
+    def example_cycle(self, component: List[int]) -> List[int]:
+        """A shortest cycle through the component's first-named node (breadth-first search)."""
+        members = set(component)
+        start = min(component, key=lambda v: self.names[v])
+        parent = {start: -1}
+        queue = [start]
+        for v in queue:
+            for w in self.targets[self.offsets[v]:self.offsets[v + 1]]:
+                if w == start:
+                    path = [v]
+                    while parent[path[-1]] != -1:
+                        path.append(parent[path[-1]])
+                    return path[::-1] + [start]
+                if w in members and w not in parent:
+                    parent[w] = v
+                    queue.append(w)
+        return [start]
+
+
 class DependencyAnalyzer:
     """Analyzes project dependencies and module coupling."""
 
@@ -36,7 +180,12 @@ class DependencyAnalyzer:
         self.direct_deps: Dict[str, str] = {}  # name -> version
         self.dev_deps: Dict[str, str] = {}
         self.internal_modules: Dict[str, Set[str]] = defaultdict(set)  # module -> imports
-        self.circular_deps: List[List[str]] = []
+        self.circular_deps: List[Dict] = []
+        self.import_graph = ImportGraph()
+        # Per source file: (relative posix path, extension, import specs)
+        self._source_imports: List[Tuple[str, str, list]] = []
+        self._package_dirs: Set[str] = set()  # directories holding an __init__.py
+        self._go_modules: Dict[str, str] = {}  # go.mod module path -> directory
         self.coupling_score: float = 0
         self.issues: List[Dict] = []
         self.recommendations: List[str] = []
@@ -280,23 +429,30 @@ class DependencyAnalyzer:
         ignore_dirs = {'.git', 'node_modules', '__pycache__', '.venv', 'venv',
                        'dist', 'build', '.next', 'coverage'}
 
-        # Find all code files
-        extensions = ['.py', '.js', '.ts', '.jsx', '.tsx', '.go', '.rs']
-
-        for ext in extensions:
-            for file_path in self.project_path.rglob(f'*{ext}'):
-                # Skip ignored directories
-                if any(ignored in file_path.parts for ignored in ignore_dirs):
+        # Find all code files (one walk, ignored directories pruned)
+        extensions = {'.py', '.js', '.ts', '.jsx', '.tsx', '.go', '.rs'}
+
+        for root, dirs, filenames in os.walk(self.project_path):
+            dirs[:] = sorted(d for d in dirs if d not in ignore_dirs)
+            rel_dir = Path(root).relative_to(self.project_path).as_posix()
+            for filename in sorted(filenames):
+                ext = os.path.splitext(filename)[1]
+                if filename == '__init__.py':
+                    self._package_dirs.add(rel_dir)
+                if filename == 'go.mod':
+                    self._read_go_module(Path(root) / filename, rel_dir)
+                if ext not in extensions:
                     continue
 
                 # Get module name (directory relative to project root)
                 try:
-                    rel_path = file_path.relative_to(self.project_path)
-                    module = rel_path.parts[0] if len(rel_path.parts) > 1 else 'root'
+                    module = rel_dir.split('/')[0] if rel_dir != '.' else 'root'
+                    content = (Path(root) / filename).read_text(encoding='utf-8', errors='ignore')
 
                     # Extract imports
-                    imports = self._extract_imports(file_path)
-                    self.internal_modules[module].update(imports)
+                    self.internal_modules[module].update(self._extract_imports(content))
+                    rel_path = filename if rel_dir == '.' else f"{rel_dir}/{filename}"
+                    self._source_imports.append((rel_path, ext, self._extract_import_specs(content, ext)))
 
                 except Exception:
                     continue
@@ -304,79 +460,204 @@ class DependencyAnalyzer:
         if self.verbose:
             print(f"Scanned {len(self.internal_modules)} internal modules")
 
-    def _extract_imports(self, file_path: Path) -> Set[str]:
-        """Extract import statements from a file."""
-        imports = set()
+    def _read_go_module(self, go_mod: Path, rel_dir: str):
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            match = GO_MODULE_RE.search(go_mod.read_text(encoding='utf-8', errors='ignore'))
+        except OSError:
+            return
+        if match:
+            self._go_modules[match.group(1)] = rel_dir
 
-            # Python imports
-            for match in re.finditer(r'^(?:from|import)\s+([\w.]+)', content, re.MULTILINE):
-                imports.add(match.group(1).split('.')[0])
+    def _extract_imports(self, content: str) -> Set[str]:
+        """Extract top-level import names from a file's content."""
+        imports = set()
 
-            # JS/TS imports
-            for match in re.finditer(r'(?:import|require)\s*\(?[\'"]([^\'"\s]+)[\'"]', content):
-                imp = match.group(1)
-                if imp.startswith('.') or imp.startswith('@/') or imp.startswith('~/'):
-                    # Relative import - extract first path component
-                    parts = imp.lstrip('./~@').split('/')
-                    if parts:
-                        imports.add(parts[0])
+        # Python imports
+        for match in re.finditer(r'^(?:from|import)\s+([\w.]+)', content, re.MULTILINE):
+            imports.add(match.group(1).split('.')[0])
 
-        except Exception:
-            pass
+        # JS/TS imports
+        for match in re.finditer(r'(?:import|require)\s*\(?[\'"]([^\'"\s]+)[\'"]', content):
+            imp = match.group(1)
+            if imp.startswith('.') or imp.startswith('@/') or imp.startswith('~/'):
+                # Relative import - extract first path component
+                parts = imp.lstrip('./~@').split('/')
+                if parts:
+                    imports.add(parts[0])
 
         return imports
 
+    def _extract_import_specs(self, content: str, ext: str) -> list:
+        """
+        Extract full import specifiers for the import graph.
+
+        Python: (dots, module, [imported names]); JS/TS: relative or @/ / ~/ paths; Go: import paths.
+        """
+        if ext == '.py':
+            specs = []
+            for match in PY_FROM_RE.finditer(content):
+                names = [name.split(' as ')[0].strip() for name in match.group(3).strip('()').split(',')]
+                specs.append((len(match.group(1)), match.group(2), [n for n in names if n and n != '*']))
+            for match in PY_IMPORT_RE.finditer(content):
+                for name in match.group(1).split(','):
+                    name = name.split(' as ')[0].strip()
+                    if name:
+                        specs.append((0, name, []))
+            return specs
+        if ext in JS_EXTENSIONS:
+            return [spec for spec in JS_IMPORT_RE.findall(JS_TYPE_IMPORT_RE.sub('', content))
+                    if spec.startswith(('.', '@/', '~/'))]
+        if ext == '.go':
+            specs = GO_IMPORT_LINE_RE.findall(content)
+            for block in GO_IMPORT_BLOCK_RE.findall(content):
+                specs.extend(re.findall(r'"([^"]+)"', block))
+            return specs
+        return []  # Rust module cycles are legal within a crate; not graphed
+
+    def _build_import_graph(self):
+        """
+        Resolve every import exactly (module path -> node id) and fill the import graph.
+
+        Nodes are source files (Go: package directories). Python modules are indexed by their
+        dotted name under the nearest non-package directory and by their full dotted path from
+        the project root; a name claimed by several files only resolves to one in the
+        importer's own directory. JS/TS paths resolve like Node (extension optional, directory
+        index files), with "@/" and "~/" tried under src/ and the project root. Imports that do
+        not resolve to a project file are external and ignored.
+        """
+        graph = self.import_graph
+        py_index: Dict[str, List[int]] = defaultdict(list)
+        py_package: Dict[int, List[str]] = {}
+        js_files: Dict[str, int] = {}
+        js_dirs: Dict[str, int] = {}
+        go_dirs: Dict[str, int] = {}
+        node_dirs: Dict[int, str] = {}
+
+        for rel_path, ext, _ in self._source_imports:
+            rel_dir, filename = posixpath.split(rel_path)
+            stem = os.path.splitext(filename)[0]
+            if ext == '.py':
+                node_id = graph.node(rel_path)
+                dir_parts = rel_dir.split('/') if rel_dir else []
+                first = len(dir_parts)
+                while first > 0 and '/'.join(dir_parts[:first]) in self._package_dirs:
+                    first -= 1
+                package = dir_parts[first:]
+                module = package if stem == '__init__' else package + [stem]
+                py_package[node_id] = module if stem == '__init__' else package
+                for name in dict.fromkeys(['.'.join(module), '.'.join(dir_parts + ([] if stem == '__init__' else [stem]))]):
+                    if name:
+                        py_index[name].append(node_id)
+            elif ext in JS_EXTENSIONS:
+                node_id = graph.node(rel_path)
+                key = posixpath.join(rel_dir, stem)
+                js_files.setdefault(key, node_id)
+                if stem == 'index':
+                    js_dirs.setdefault(rel_dir, node_id)
+            elif ext == '.go':
+                node_id = go_dirs.get(rel_dir)
+                if node_id is None:
+                    node_id = go_dirs[rel_dir] = graph.node(f"{rel_dir or '.'}/")
+            else:
+                continue
+            node_dirs[node_id] = rel_dir
+
+        def resolve_python(name: str, importer: int) -> Optional[int]:
+            candidates = py_index.get(name)
+            if not candidates:
+                return None
+            if len(candidates) == 1:
+                return candidates[0]
+            local = [c for c in candidates if node_dirs[c] == node_dirs[importer]]
+            return local[0] if len(local) == 1 else None
+
+        def resolve_js(path: str) -> Optional[int]:
+            path = posixpath.normpath(path)
+            if path.startswith('..'):
+                return None
+            stem, ext = posixpath.splitext(path)
+            if ext in JS_EXTENSIONS:
+                path = stem
+            path = '' if path == '.' else path
+            found = js_files.get(path)
+            return found if found is not None else js_dirs.get(path)
+
+        go_modules = sorted(self._go_modules.items(), key=lambda item: -len(item[0]))
+        for rel_path, ext, specs in self._source_imports:
+            if ext == '.py':
+                importer = graph.node(rel_path)
+                for level, module, names in specs:
+                    if level:
+                        # Relative import: climb (level - 1) packages from the importer's package
+                        package = py_package[importer]
+                        if level - 1 > len(package):
+                            continue
+                        base = package[:len(package) - (level - 1)]
+                        module = '.'.join(base + ([module] if module else []))
+                    # from X import a, b: a and b may be submodules of X
+                    submodules = [resolve_python(f"{module}.{n}" if module else n, importer) for n in names]
+                    submodules = [t for t in submodules if t is not None]
+                    for target in submodules:
+                        graph.add_edge(importer, target)
+                    if submodules or not module:
+                        continue
+                    parts = module.split('.')
+                    while parts:
+                        target = resolve_python('.'.join(parts), importer)
+                        if target is not None:
+                            graph.add_edge(importer, target)
+                            break
+                        parts.pop()
+            elif ext in JS_EXTENSIONS:
+                importer = graph.node(rel_path)
+                rel_dir = node_dirs[importer]
+                for spec in specs:
+                    if spec.startswith('.'):
+                        candidates = [posixpath.join(rel_dir, spec)]
+                    else:
+                        candidates = ['src/' + spec[2:], spec[2:]]
+                    for candidate in candidates:
+                        target = resolve_js(candidate)
+                        if target is not None:
+                            graph.add_edge(importer, target)
+                            break
+            elif ext == '.go':
+                importer = go_dirs[posixpath.dirname(rel_path)]
+                for spec in specs:
+                    for module_path, module_dir in go_modules:
+                        if spec == module_path or spec.startswith(module_path + '/'):
+                            target_dir = posixpath.normpath(posixpath.join(module_dir, spec[len(module_path) + 1:]))
+                            target = go_dirs.get('' if target_dir == '.' else target_dir)
+                            if target is not None:
+                                graph.add_edge(importer, target)
+                            break
+
+        graph.freeze()
+        if self.verbose:
+            print(f"Import graph: {len(graph.names)} modules, {graph.edge_count} imports")
+
     def _detect_circular_dependencies(self):
-        """Detect circular dependencies between internal modules."""
-        # Build dependency graph
-        graph = defaultdict(set)
-        modules = set(self.internal_modules.keys())
+        """Detect circular dependencies: strongly connected components of the import graph."""
+        self._build_import_graph()
+        graph = self.import_graph
+
+        components = []
+        for component in graph.strongly_connected_components():
+            components.append({
+                'size': len(component),
+                'modules': sorted(graph.names[v] for v in component),
+                'example_cycle': [graph.names[v] for v in graph.example_cycle(component)],
+            })
+        components.sort(key=lambda c: (-c['size'], c['modules'][0]))
+        self.circular_deps = components
 
-        for module, imports in self.internal_modules.items():
-            for imp in imports:
-                # Check if import is an internal module
-                for internal_module in modules:
-                    if internal_module.lower() in imp.lower() and internal_module != module:
-                        graph[module].add(internal_module)
-
-        # Find cycles using DFS
-        visited = set()
-        rec_stack = set()
-        cycles = []
-
-        def find_cycles(node: str, path: List[str]):
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-
-            for neighbor in graph.get(node, []):
-                if neighbor not in visited:
-                    find_cycles(neighbor, path)
-                elif neighbor in rec_stack:
-                    # Found cycle
-                    cycle_start = path.index(neighbor)
-                    cycle = path[cycle_start:] + [neighbor]
-                    if cycle not in cycles:
-                        cycles.append(cycle)
-
-            path.pop()
-            rec_stack.remove(node)
-
-        for module in modules:
-            if module not in visited:
-                find_cycles(module, [])
-
-        self.circular_deps = cycles
-
-        if cycles:
-            for cycle in cycles:
-                self.issues.append({
-                    'type': 'circular_dependency',
-                    'severity': 'warning',
-                    'message': f"Circular dependency: {' -> '.join(cycle)}"
-                })
+        for component in components:
+            self.issues.append({
+                'type': 'circular_dependency',
+                'severity': 'warning',
+                'message': (f"Circular dependency among {component['size']} modules: "
+                            f"{' -> '.join(component['example_cycle'])}")
+            })
 
         if self.verbose:
             print(f"Found {len(self.circular_deps)} circular dependencies")
@@ -456,6 +737,10 @@ class DependencyAnalyzer:
                 'circular_dependencies': len(self.circular_deps),
                 'issues': len(self.issues),
             },
+            'import_graph': {
+                'modules': len(self.import_graph.names),
+                'imports': self.import_graph.edge_count,
+            },
             'dependencies': {
                 'direct': self.direct_deps,
                 'dev': self.dev_deps,
@@ -467,6 +752,15 @@ class DependencyAnalyzer:
         }
 
 
+def print_component(component: Dict):
+    """Print one strongly connected component: an example cycle, then its other members."""
+    print(f"  [{component['size']} modules] {' -> '.join(component['example_cycle'])}")
+    others = [m for m in component['modules'] if m not in component['example_cycle']]
+    if others:
+        more = f" ... and {len(others) - 5} more" if len(others) > 5 else ""
+        print(f"      also: {', '.join(others[:5])}{more}")
+
+
 def print_human_report(report: Dict):
     """Print human-readable report."""
     print("\n" + "=" * 60)
@@ -491,8 +785,8 @@ def print_human_report(report: Dict):
 
     if report['circular_dependencies']:
         print(f"\n--- Circular Dependencies ({len(report['circular_dependencies'])}) ---")
-        for cycle in report['circular_dependencies']:
-            print(f"  {' -> '.join(cycle)}")
+        for component in report['circular_dependencies']:
+            print_component(component)
 
     if report['issues']:
         print(f"\n--- Issues ({len(report['issues'])}) ---")
@@ -582,8 +876,8 @@ Supported package managers:
     if args.check == 'circular':
         if report['circular_dependencies']:
             print("Circular dependencies found:")
-            for cycle in report['circular_dependencies']:
-                print(f"  {' -> '.join(cycle)}")
+            for component in report['circular_dependencies']:
+                print_component(component)
             sys.exit(1)
         else:
             print("No circular dependencies found.")
@@ -5,27 +5,62 @@ API Load Tester
 Performs HTTP load testing with configurable concurrency, measuring latency
 percentiles, throughput, and error rates.
 
+By default each worker holds one persistent keep-alive connection (http.client),
+so latency reflects the service rather than TCP/TLS handshakes; connect, TLS and
+time-to-first-byte are reported separately. Use --no-keep-alive to open a fresh
+connection per request (the old urlopen behaviour).
+
+With --rate or --rate-profile the test runs open-loop: an asyncio scheduler issues
+requests at the target arrival rate whether or not earlier ones have completed,
+and latency is measured from each request's intended send time, so a stalling
+server shows up in the percentiles instead of silently lowering the offered load
+(coordinated omission).
+
+Latencies stream into per-worker log-bucketed histograms (~1% precision) that are
+merged at the end, so memory stays flat however long the test runs; --verbose
+also prints a per-second time series. --processes N shards the load across N
+worker processes and merges their histograms, so the generator is not held back
+by a single interpreter's GIL.
+
+--scenario drives a weighted mix of endpoints (each with its own method, body and
+headers) and --replay re-issues a recorded access log on its original timeline
+(scaled by --speed); both report a per-endpoint breakdown.
+
 Usage:
     python api_load_tester.py https://api.example.com/users --concurrency 50 --duration 30
     python api_load_tester.py https://api.example.com/orders --method POST --body '{"item": 1}'
     python api_load_tester.py https://api.example.com/v1/users https://api.example.com/v2/users --compare
+    python api_load_tester.py https://api.example.com/users --rate 500 --duration 60 --concurrency 200
+    python api_load_tester.py https://api.example.com/users --rate-profile "30s:50-500,60s:500"
+    python api_load_tester.py https://api.example.com/users --concurrency 400 --processes 8
+    python api_load_tester.py https://api.example.com --scenario checkout_mix.json --rate 200
+    python api_load_tester.py https://staging.example.com --replay access.log --speed 2
 """
 
 import os
 import sys
 import json
 import argparse
+import asyncio
+import bisect
+import itertools
+import math
+import multiprocessing
+import re
 import time
-import statistics
 import threading
 import queue
+import random
+import socket
+import http.client
+from array import array
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field, asdict, replace
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 from urllib.request import Request, urlopen
 from urllib.error import URLError, HTTPError
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urlsplit
 import ssl
 
 
@@ -38,6 +73,14 @@ class RequestResult:
     error: Optional[str] = None
     response_size: int = 0
 
+    # Phase timings (milliseconds); latency_ms is the total
+    connect_ms: float = 0.0
+    tls_ms: float = 0.0
+    ttfb_ms: float = 0.0
+    new_connection: bool = True
+    # Open-loop only: delay between intended and actual send (included in latency_ms)
+    queue_ms: float = 0.0
+
 
 @dataclass
 class LoadTestResults:
@@ -68,6 +111,36 @@ class LoadTestResults:
     total_bytes_received: int = 0
     throughput_mbps: float = 0.0
 
+    # Load generator processes whose results were merged
+    processes: int = 1
+
+    # Connection metrics
+    keep_alive: bool = False
+    connections_opened: int = 0
+    connect_avg: float = 0.0
+    tls_avg: float = 0.0
+    ttfb_avg: float = 0.0
+    ttfb_p50: float = 0.0
+    ttfb_p99: float = 0.0
+
+    # Arrival-rate metrics (open-loop mode only)
+    load_model: str = 'closed'
+    target_rps: float = 0.0
+    sent_rps: float = 0.0
+    completed_rps: float = 0.0  # requests that finished (either way) before shutdown
+    cut_off_requests: int = 0   # still in flight at shutdown; counted as failed
+    queue_avg: float = 0.0
+    queue_max: float = 0.0
+    service_p50: float = 0.0
+    service_p99: float = 0.0
+
+    # Per-second snapshots: second, requests, errors, latency_p50/p99/max
+    timeseries: List[Dict] = field(default_factory=list)
+
+    # Scenario mode: description and per-endpoint breakdown (busiest first)
+    scenario: Optional[str] = None
+    endpoints: List[Dict] = field(default_factory=list)
+
     def success_rate(self) -> float:
         """Calculate success rate percentage."""
         if self.total_requests == 0:
@@ -75,16 +148,263 @@ class LoadTestResults:
         return (self.successful_requests / self.total_requests) * 100
 
 
-def calculate_percentile(data: List[float], percentile: float) -> float:
-    """Calculate percentile from sorted data."""
-    if not data:
-        return 0.0
-    k = (len(data) - 1) * (percentile / 100)
-    f = int(k)
-    c = f + 1 if f + 1 < len(data) else f
-    return data[f] + (data[c] - data[f]) * (k - f)
+@dataclass
+class RateStage:
+    """One segment of a rate profile; the rate moves linearly from start to end."""
+    duration: float
+    start_rps: float
+    end_rps: float
+
+
+class RateProfile:
+    """Target arrival rate over time: constant, or a sequence of linear ramp stages."""
+
+    def __init__(self, stages: List[RateStage]):
+        if not stages:
+            raise ValueError("Rate profile needs at least one stage")
+        for stage in stages:
+            if stage.duration <= 0 or stage.start_rps < 0 or stage.end_rps < 0:
+                raise ValueError("Rate stages need a positive duration and non-negative rates")
+        self.stages = stages
+
+    @classmethod
+    def constant(cls, rps: float, duration: float) -> 'RateProfile':
+        return cls([RateStage(duration, rps, rps)])
+
+    @classmethod
+    def parse(cls, spec: str) -> 'RateProfile':
+        """Parse "30s:100,60s:100-1000,30s:1000" (DURATION:RPS or DURATION:FROM-TO per stage)."""
+        stages = []
+        for part in spec.split(','):
+            try:
+                duration, rates = part.strip().split(':', 1)
+                start, _, end = rates.partition('-')
+                stages.append(RateStage(float(duration.rstrip('s')), float(start), float(end or start)))
+            except ValueError as e:
+                raise ValueError(f"Invalid rate stage '{part}' (expected e.g. 30s:100 or 60s:100-1000)") from e
+        return cls(stages)
+
+    @property
+    def duration(self) -> float:
+        return sum(stage.duration for stage in self.stages)
+
+    def expected_requests(self) -> float:
+        """Requests the profile asks for (area under the rate curve)."""
+        return sum(stage.duration * (stage.start_rps + stage.end_rps) / 2 for stage in self.stages)
+
+    def schedule(self) -> Iterator[float]:
+        """Yield intended send offsets (seconds from test start).
+
+        The k-th request is due when the cumulative rate integral reaches k; within
+        a linear stage that integral is quadratic in t, so each send time is exact
+        even where the rate is near zero.
+        """
+        base = 0.0   # stage start offset
+        due = 0.0    # requests due before this stage
+        k = 0
+        for stage in self.stages:
+            a, d = stage.start_rps, stage.duration
+            c = (stage.end_rps - a) / (2 * d)
+            area = d * (a + stage.end_rps) / 2
+            # The epsilon keeps float drift from adding one send past the stage end
+            while k < due + area - 1e-9:
+                n = k - due
+                t = n / a if c == 0 else (-a + math.sqrt(max(a * a + 4 * c * n, 0.0))) / (2 * c)
+                yield base + t
+                k += 1
+            due += area
+            base += d
+
+    def describe(self) -> str:
+        return ', '.join(
+            f"{stage.duration:g}s@{stage.start_rps:g}" +
+            (f"-{stage.end_rps:g}" if stage.end_rps != stage.start_rps else '') + " rps"
+            for stage in self.stages
+        )
 
 
+@dataclass
+class Endpoint:
+    """One request shape in a scenario; `target` is a path (or absolute URL) resolved by Scenario.bind."""
+    name: str
+    target: str
+    method: str = 'GET'
+    body: Optional[bytes] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    weight: float = 1.0
+    url: str = ''
+
+
+# Access log line in Common or Combined Log Format
+ACCESS_LOG_PATTERN = re.compile(
+    r'^\S+ \S+ \S+ \[(?P<time>[^\]]+)\] "(?P<method>[A-Z]+) (?P<target>\S+)[^"]*" (?P<status>\d{3}|-)'
+)
+# Path segments that are ids rather than routes, folded together in per-endpoint labels
+ID_SEGMENT_PATTERN = re.compile(r'^(\d+|[0-9a-fA-F]{8,}|[0-9a-fA-F-]{36})$')
+
+
+def route_label(method: str, target: str) -> str:
+    """'GET /users/123?x=1' -> 'GET /users/:id' so replayed traffic groups by route."""
+    path = urlsplit(target).path or '/'
+    segments = [':id' if ID_SEGMENT_PATTERN.match(seg) else seg for seg in path.split('/')]
+    return f"{method} {'/'.join(segments)}"
+
+
+def _encode_body(body) -> Optional[bytes]:
+    if body is None:
+        return None
+    if isinstance(body, str):
+        return body.encode()
+    return json.dumps(body).encode()
+
+
+class Scenario:
+    """A weighted endpoint mix, or a recorded access log replayed on its original timeline."""
+
+    # Weighted picks follow a golden-ratio sequence: deterministic per request number (so
+    # process shards agree), exact long-run proportions, and endpoints stay interleaved.
+    GOLDEN = (math.sqrt(5) - 1) / 2
+
+    def __init__(self, endpoints: List[Endpoint], base_url: Optional[str] = None,
+                 offsets: Optional[array] = None, picks: Optional[array] = None,
+                 speed: float = 1.0, source: str = ''):
+        if not endpoints:
+            raise ValueError("Scenario has no endpoints")
+        self.endpoints = endpoints
+        self.base_url = base_url
+        # Replay only: arrival offsets (seconds, sorted) and the endpoint index of each arrival
+        self.offsets = offsets
+        self.picks = picks
+        self.speed = speed
+        self.source = source
+        self.cumulative = list(itertools.accumulate(max(e.weight, 0.0) for e in endpoints))
+        if self.cumulative[-1] <= 0:
+            raise ValueError("Scenario endpoint weights must add up to more than zero")
+
+    @property
+    def is_replay(self) -> bool:
+        return self.offsets is not None
+
+    def pick(self, k: int) -> int:
+        """Endpoint index for the k-th request."""
+        if self.picks is not None:
+            return self.picks[k % len(self.picks)]
+        position = (k * self.GOLDEN) % 1.0 * self.cumulative[-1]
+        return min(bisect.bisect_right(self.cumulative, position), len(self.endpoints) - 1)
+
+    def arrivals(self) -> Iterator[float]:
+        """Replay send offsets, scaled by speed (2.0 replays twice as fast)."""
+        return (offset / self.speed for offset in self.offsets)
+
+    def replay_duration(self) -> float:
+        n = len(self.offsets)
+        span = self.offsets[-1] if n else 0.0
+        # Leave one mean inter-arrival gap after the last request
+        return max(span + (span / (n - 1) if n > 1 and span > 0 else 1.0), 1e-3) / self.speed
+
+    def bind(self, base_url: str) -> 'Scenario':
+        """Copy with every endpoint's URL resolved against base_url."""
+        base = base_url.rstrip('/')
+        endpoints = []
+        for endpoint in self.endpoints:
+            target = endpoint.target
+            if not target.startswith(('http://', 'https://')):
+                target = base + (target if target.startswith('/') else '/' + target)
+            endpoints.append(replace(endpoint, url=target))
+        return Scenario(endpoints, base_url, self.offsets, self.picks, self.speed, self.source)
+
+    def describe(self) -> str:
+        if self.is_replay:
+            speed = f", {self.speed:g}x speed" if self.speed != 1.0 else ''
+            return (f"replay of {self.source} ({len(self.offsets):,} requests, "
+                    f"{len({e.name for e in self.endpoints})} routes{speed})")
+        return f"{self.source} ({len(self.endpoints)} weighted endpoints)"
+
+    @classmethod
+    def from_file(cls, path: str) -> 'Scenario':
+        """Load a weighted endpoint list (JSON):
+
+        {"base_url": "...", "headers": {...},
+         "endpoints": [{"name": "...", "method": "POST", "path": "/orders", "weight": 5,
+                        "body": {...}, "headers": {...}}, ...]}
+        """
+        with open(path) as f:
+            spec = json.load(f)
+        shared_headers = spec.get('headers', {})
+        endpoints = []
+        for i, item in enumerate(spec.get('endpoints', [])):
+            method = item.get('method', 'GET').upper()
+            target = item.get('path') or item.get('url')
+            if not target:
+                raise ValueError(f"{path}: endpoint {i + 1} needs a 'path' or 'url'")
+            endpoints.append(Endpoint(
+                name=item.get('name') or f"{method} {target}",
+                target=target,
+                method=method,
+                body=_encode_body(item.get('body')),
+                headers={**shared_headers, **item.get('headers', {})},
+                weight=float(item.get('weight', 1.0)),
+            ))
+        return cls(endpoints, base_url=spec.get('base_url'), source=os.path.basename(path))
+
+    @classmethod
+    def from_access_log(cls, path: str, speed: float = 1.0) -> 'Scenario':
+        """Load a recorded access log for replay.
+
+        Accepts Common/Combined Log Format lines, or JSON lines with "time" (epoch seconds
+        or ISO 8601), "method", "path" or "url", and optional "body" and "headers".
+        Requests that share a one-second log timestamp are spread evenly across it.
+        """
+        if speed <= 0:
+            raise ValueError("Replay speed must be positive")
+        records: List[Tuple[float, Tuple]] = []
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                if line.startswith('{'):
+                    item = json.loads(line)
+                    stamp = item.get('time', item.get('timestamp', item.get('ts')))
+                    when = (float(stamp) if isinstance(stamp, (int, float))
+                            else datetime.fromisoformat(str(stamp).replace('Z', '+00:00')).timestamp())
+                    body = _encode_body(item.get('body'))
+                    key = (item.get('method', 'GET').upper(), item.get('path') or item.get('url'),
+                           body, tuple(sorted(item.get('headers', {}).items())))
+                else:
+                    match = ACCESS_LOG_PATTERN.match(line)
+                    if not match:
+                        continue
+                    when = datetime.strptime(match['time'], '%d/%b/%Y:%H:%M:%S %z').timestamp()
+                    key = (match['method'], match['target'], None, ())
+                if key[1]:
+                    records.append((when, key))
+        if not records:
+            raise ValueError(f"No requests found in access log {path}")
+
+        records.sort(key=lambda r: r[0])
+        start = records[0][0]
+        index: Dict[Tuple, int] = {}
+        endpoints: List[Endpoint] = []
+        offsets, picks = array('d'), array('I')
+        i = 0
+        while i < len(records):
+            # Group requests logged with the same timestamp and spread them across one second
+            j = i
+            while j < len(records) and records[j][0] == records[i][0]:
+                j += 1
+            spread = 1.0 if records[i][0] == int(records[i][0]) else 0.0
+            for n in range(i, j):
+                when, key = records[n]
+                if key not in index:
+                    method, target, body, headers = key
+                    index[key] = len(endpoints)
+                    endpoints.append(Endpoint(route_label(method, target), target, method, body, dict(headers)))
+                offsets.append(when - start + spread * (n - i) / (j - i))
+                picks.append(index[key])
+            i = j
+        return cls(endpoints, offsets=offsets, picks=picks, speed=speed, source=os.path.basename(path))
+
 class HTTPClient:
     """HTTP client with configurable settings."""
 
@@ -102,24 +422,27 @@ class HTTPClient:
         else:
             self.ssl_context = None
 
-    def request(self, url: str, method: str = 'GET', body: Optional[bytes] = None) -> RequestResult:
+    def request(self, url: str, method: str = 'GET', body: Optional[bytes] = None,
+                headers: Optional[Dict[str, str]] = None) -> RequestResult:
         """Execute HTTP request and return result."""
         start_time = time.perf_counter()
 
         try:
             request = Request(url, data=body, method=method)
+            request_headers = {**self.headers, **(headers or {})}
 
             # Add headers
-            for key, value in self.headers.items():
+            for key, value in request_headers.items():
                 request.add_header(key, value)
 
             # Add content-type for POST/PUT
             if body and method in ['POST', 'PUT', 'PATCH']:
-                if 'Content-Type' not in self.headers:
+                if 'Content-Type' not in request_headers:
                     request.add_header('Content-Type', 'application/json')
 
             # Execute request
             with urlopen(request, timeout=self.timeout, context=self.ssl_context) as response:
+                ttfb = (time.perf_counter() - start_time) * 1000
                 response_data = response.read()
                 elapsed = (time.perf_counter() - start_time) * 1000
 
@@ -128,6 +451,7 @@ class HTTPClient:
                     status_code=response.status,
                     latency_ms=elapsed,
                     response_size=len(response_data),
+                    ttfb_ms=ttfb,
                 )
 
         except HTTPError as e:
@@ -167,12 +491,611 @@ class HTTPClient:
             )
 
 
+class KeepAliveHTTPClient:
+    """HTTP client holding one persistent connection per origin, reopened when the server closes it.
+
+    Not thread-safe: each worker owns its own instance, which is the whole pool.
+    """
+
+    # Exceptions meaning a reused connection went stale between requests
+    STALE_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                    ConnectionResetError, BrokenPipeError)
+
+    def __init__(self, timeout: float = 30.0, headers: Optional[Dict[str, str]] = None,
+                 verify_ssl: bool = True):
+        self.timeout = timeout
+        self.headers = headers or {}
+        self.verify_ssl = verify_ssl
+        self.ssl_context = ssl.create_default_context()
+        if not verify_ssl:
+            self.ssl_context.check_hostname = False
+            self.ssl_context.verify_mode = ssl.CERT_NONE
+
+        self.conns: Dict[Tuple[str, str, int], http.client.HTTPConnection] = {}
+        self.connections_opened = 0
+
+    def close(self, origin: Optional[Tuple[str, str, int]] = None):
+        """Close the pooled connection to one origin, or all of them."""
+        for key in ([origin] if origin else list(self.conns)):
+            conn = self.conns.pop(key, None)
+            if conn is not None:
+                conn.close()
+
+    def _connect(self, scheme: str, host: str, port: int) -> Tuple[float, float]:
+        """Open the connection by hand so TCP connect and TLS handshake are timed apart."""
+        self.close((scheme, host, port))
+        start = time.perf_counter()
+        sock = socket.create_connection((host, port), timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        connected = time.perf_counter()
+        tls_ms = 0.0
+        if scheme == 'https':
+            try:
+                sock = self.ssl_context.wrap_socket(sock, server_hostname=host)
+            except BaseException:
+                sock.close()
+                raise
+            tls_ms = (time.perf_counter() - connected) * 1000
+            conn = http.client.HTTPSConnection(host, port, timeout=self.timeout,
+                                               context=self.ssl_context)
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=self.timeout)
+        # A pre-set socket makes http.client skip its own connect()
+        conn.sock = sock
+        self.conns[(scheme, host, port)] = conn
+        self.connections_opened += 1
+        return (connected - start) * 1000, tls_ms
+
+    def request(self, url: str, method: str = 'GET', body: Optional[bytes] = None,
+                headers: Optional[Dict[str, str]] = None) -> RequestResult:
+        """Execute HTTP request over the pooled connection and return result."""
+        start_time = time.perf_counter()
+        connect_ms = tls_ms = 0.0
+        new_connection = False
+        origin = None
+
+        try:
+            parts = urlsplit(url)
+            scheme = parts.scheme.lower()
+            if scheme not in ('http', 'https'):
+                raise ValueError(f"Unsupported URL scheme: {parts.scheme}")
+            host = parts.hostname or ''
+            port = parts.port or (443 if scheme == 'https' else 80)
+            origin = (scheme, host, port)
+            path = parts.path or '/'
+            if parts.query:
+                path += '?' + parts.query
+
+            request_headers = {**self.headers, **(headers or {})}
+            if body and method in ['POST', 'PUT', 'PATCH']:
+                request_headers.setdefault('Content-Type', 'application/json')
+
+            for attempt in range(2):
+                conn = self.conns.get(origin)
+                # http.client drops its socket after a "Connection: close" response
+                if conn is None or conn.sock is None:
+                    connect_ms, tls_ms = self._connect(scheme, host, port)
+                    conn = self.conns[origin]
+                    new_connection = True
+                try:
+                    conn.request(method, path, body=body, headers=request_headers)
+                    response = conn.getresponse()
+                    break
+                except self.STALE_ERRORS:
+                    # Server closed an idle keep-alive connection: retry once on a fresh one
+                    self.close(origin)
+                    if new_connection or attempt:
+                        raise
+
+            ttfb = (time.perf_counter() - start_time) * 1000
+            response_data = response.read()
+            elapsed = (time.perf_counter() - start_time) * 1000
+
+            timings = dict(connect_ms=connect_ms, tls_ms=tls_ms, ttfb_ms=ttfb,
+                           new_connection=new_connection)
+            if response.status >= 400:
+                return RequestResult(
+                    success=False,
+                    status_code=response.status,
+                    latency_ms=elapsed,
+                    error=f"HTTP {response.status}: {response.reason}",
+                    **timings,
+                )
+            return RequestResult(
+                success=True,
+                status_code=response.status,
+                latency_ms=elapsed,
+                response_size=len(response_data),
+                **timings,
+            )
+
+        except TimeoutError:
+            if origin:
+                self.close(origin)
+            elapsed = (time.perf_counter() - start_time) * 1000
+            return RequestResult(
+                success=False,
+                status_code=0,
+                latency_ms=elapsed,
+                error="Connection timeout",
+                new_connection=new_connection,
+            )
+
+        except (OSError, http.client.HTTPException) as e:
+            if origin:
+                self.close(origin)
+            elapsed = (time.perf_counter() - start_time) * 1000
+            return RequestResult(
+                success=False,
+                status_code=0,
+                latency_ms=elapsed,
+                error=f"Connection error: {e}",
+                new_connection=new_connection,
+            )
+
+        except Exception as e:
+            if origin:
+                self.close(origin)
+            elapsed = (time.perf_counter() - start_time) * 1000
+            return RequestResult(
+                success=False,
+                status_code=0,
+                latency_ms=elapsed,
+                error=str(e),
+                new_connection=new_connection,
+            )
+
+
+class AsyncHTTPConnection:
+    """One HTTP/1.1 keep-alive connection on asyncio streams."""
+
+    def __init__(self, scheme: str, host: str, port: int, ssl_context: Optional[ssl.SSLContext]):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.ssl_context = ssl_context
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def open(self) -> Tuple[float, float]:
+        """Connect (and handshake); returns (connect_ms, tls_ms)."""
+        start = time.perf_counter()
+        if self.scheme == 'https' and not hasattr(asyncio.StreamWriter, 'start_tls'):
+            # StreamWriter.start_tls needs Python 3.11+; before that the handshake
+            # happens inside open_connection and is reported as part of connect time
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port, ssl=self.ssl_context, server_hostname=self.host)
+            return (time.perf_counter() - start) * 1000, 0.0
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        connected = time.perf_counter()
+        tls_ms = 0.0
+        if self.scheme == 'https':
+            await self.writer.start_tls(self.ssl_context, server_hostname=self.host)
+            tls_ms = (time.perf_counter() - connected) * 1000
+        return (connected - start) * 1000, tls_ms
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+    async def exchange(self, request: bytes, head_only: bool) -> Tuple[int, str, int, float, bool]:
+        """Send one request; returns (status, reason, body_size, ttfb_perf_time, keep_open)."""
+        self.writer.write(request)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise http.client.RemoteDisconnected("Remote end closed connection without response")
+        ttfb = time.perf_counter()
+        version, _, rest = status_line.decode('latin-1').strip().partition(' ')
+        code, _, reason = rest.partition(' ')
+        status = int(code)
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get('connection', '').lower()
+        keep_open = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+
+        size = 0
+        if head_only or status in (204, 304) or 100 <= status < 200:
+            pass
+        elif 'chunked' in headers.get('transfer-encoding', '').lower():
+            while True:
+                chunk_size = int((await self.reader.readline()).split(b';')[0], 16)
+                if chunk_size == 0:
+                    # Trailers end with a blank line
+                    while (await self.reader.readline()) not in (b'\r\n', b'\n', b''):
+                        pass
+                    break
+                size += len(await self.reader.readexactly(chunk_size + 2)) - 2
+        elif 'content-length' in headers:
+            size = len(await self.reader.readexactly(int(headers['content-length'])))
+        else:
+            size = len(await self.reader.read())
+            keep_open = False
+
+        return status, reason, size, ttfb, keep_open
+
+
+class AsyncHTTPClient:
+    """asyncio HTTP client with a pool of idle keep-alive connections."""
+
+    STALE_ERRORS = (http.client.RemoteDisconnected, asyncio.IncompleteReadError,
+                    ConnectionResetError, BrokenPipeError)
+
+    def __init__(self, url: str, timeout: float = 30.0, headers: Optional[Dict[str, str]] = None,
+                 verify_ssl: bool = True, keep_alive: bool = True):
+        parts = urlsplit(url)
+        self.scheme = parts.scheme.lower()
+        if self.scheme not in ('http', 'https'):
+            raise ValueError(f"Unsupported URL scheme: {parts.scheme}")
+        self.host = parts.hostname or ''
+        self.port = parts.port or (443 if self.scheme == 'https' else 80)
+        self.host_header = parts.netloc.rpartition('@')[2]
+        self.timeout = timeout
+        self.headers = headers or {}
+        self.keep_alive = keep_alive
+
+        self.ssl_context = None
+        if self.scheme == 'https':
+            self.ssl_context = ssl.create_default_context()
+            if not verify_ssl:
+                self.ssl_context.check_hostname = False
+                self.ssl_context.verify_mode = ssl.CERT_NONE
+
+        self.idle: List[AsyncHTTPConnection] = []
+        self.connections_opened = 0
+
+    def close(self):
+        while self.idle:
+            self.idle.pop().close()
+
+    def build_request(self, target: str, method: str, body: Optional[bytes],
+                      extra_headers: Optional[Dict[str, str]] = None) -> bytes:
+        headers = {'Host': self.host_header, 'Accept-Encoding': 'identity'}
+        headers.update(self.headers)
+        headers.update(extra_headers or {})
+        if body and method in ['POST', 'PUT', 'PATCH']:
+            headers.setdefault('Content-Type', 'application/json')
+        if body or method in ['POST', 'PUT', 'PATCH']:
+            headers['Content-Length'] = str(len(body or b''))
+        if not self.keep_alive:
+            headers['Connection'] = 'close'
+        head = f"{method} {target} HTTP/1.1\r\n" + ''.join(f"{k}: {v}\r\n" for k, v in headers.items())
+        return head.encode('latin-1') + b'\r\n' + (body or b'')
+
+    async def request(self, request: bytes, head_only: bool = False) -> RequestResult:
+        """Send a pre-built request over a pooled connection and return result."""
+        start_time = time.perf_counter()
+        connect_ms = tls_ms = 0.0
+        new_connection = False
+        conn = None
+
+        try:
+            for attempt in range(2):
+                if self.idle:
+                    conn = self.idle.pop()
+                else:
+                    conn = AsyncHTTPConnection(self.scheme, self.host, self.port, self.ssl_context)
+                    connect_ms, tls_ms = await asyncio.wait_for(conn.open(), self.timeout)
+                    self.connections_opened += 1
+                    new_connection = True
+                try:
+                    status, reason, size, ttfb, keep_open = await asyncio.wait_for(
+                        conn.exchange(request, head_only), self.timeout)
+                    break
+                except self.STALE_ERRORS:
+                    # Server closed an idle keep-alive connection: retry once on a fresh one
+                    conn.close()
+                    if new_connection or attempt:
+                        raise
+
+            if keep_open and self.keep_alive:
+                self.idle.append(conn)
+            else:
+                conn.close()
+
+            elapsed = (time.perf_counter() - start_time) * 1000
+            timings = dict(connect_ms=connect_ms, tls_ms=tls_ms,
+                           ttfb_ms=(ttfb - start_time) * 1000, new_connection=new_connection)
+            if status >= 400:
+                return RequestResult(
+                    success=False,
+                    status_code=status,
+                    latency_ms=elapsed,
+                    error=f"HTTP {status}: {reason}",
+                    **timings,
+                )
+            return RequestResult(
+                success=True,
+                status_code=status,
+                latency_ms=elapsed,
+                response_size=size,
+                **timings,
+            )
+
+        except (asyncio.TimeoutError, TimeoutError):
+            error = "Connection timeout"
+        except (OSError, http.client.HTTPException, asyncio.IncompleteReadError) as e:
+            error = f"Connection error: {e}"
+        except Exception as e:
+            error = str(e)
+
+        if conn is not None:
+            conn.close()
+        return RequestResult(
+            success=False,
+            status_code=0,
+            latency_ms=(time.perf_counter() - start_time) * 1000,
+            error=error,
+            new_connection=new_connection,
+        )
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram (HDR-style).
+
+    Bucket bounds grow geometrically, so every percentile is within one bucket
+    width (1% by default) of the exact value. Counts live in a sparse dict bounded
+    by the bucket range, so memory is fixed however many values are recorded, and
+    histograms from different workers merge by adding counts. Mean and variance
+    are tracked exactly (Welford) alongside the buckets.
+    """
+
+    MIN_MS = 0.001
+    MAX_MS = 3_600_000.0
+
+    def __init__(self, growth: float = 1.01):
+        self.growth = growth
+        self.log_growth = math.log(growth)
+        self.max_bucket = int(math.log(self.MAX_MS / self.MIN_MS) / self.log_growth) + 1
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def _bucket(self, value_ms: float) -> int:
+        if value_ms <= self.MIN_MS:
+            return 0
+        return min(int(math.log(value_ms / self.MIN_MS) / self.log_growth) + 1, self.max_bucket)
+
+    def record(self, value_ms: float):
+        bucket = self._bucket(value_ms)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        delta = value_ms - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value_ms - self.mean)
+        if value_ms < self.min:
+            self.min = value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def merge(self, other: 'LatencyHistogram'):
+        if not other.count:
+            return
+        for bucket, n in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + n
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def stddev(self) -> float:
+        """Sample standard deviation (matches statistics.stdev)."""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def percentile(self, percentile: float) -> float:
+        """Value at the given percentile, found by walking cumulative bucket counts."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * percentile / 100))
+        seen = 0
+        for bucket in range(self._bucket(self.min), self._bucket(self.max) + 1):
+            seen += self.counts.get(bucket, 0)
+            if seen >= rank:
+                # Geometric midpoint of the bucket, clamped to what was actually seen
+                value = self.MIN_MS * self.growth ** (bucket - 0.5) if bucket else self.MIN_MS
+                return min(max(value, self.min), self.max)
+        return self.max
+
+
+class SecondStats:
+    """Requests completed within one wall-clock second of the test."""
+
+    # Coarser buckets: a per-second p99 within 5% is plenty for a time series
+    GROWTH = 1.05
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.latency = LatencyHistogram(self.GROWTH)
+
+    def merge(self, other: 'SecondStats'):
+        self.requests += other.requests
+        self.errors += other.errors
+        self.latency.merge(other.latency)
+
+
+class TimeSeries:
+    """Per-second snapshots shared by all workers.
+
+    Workers fill a private SecondStats and hand it over once per second, so the
+    lock is taken once per worker per second rather than once per request.
+    """
+
+    def __init__(self):
+        self.seconds: Dict[int, SecondStats] = {}
+        self.lock = threading.Lock()
+
+    def add(self, second: int, snapshot: SecondStats):
+        with self.lock:
+            existing = self.seconds.get(second)
+            if existing is None:
+                self.seconds[second] = snapshot
+            else:
+                existing.merge(snapshot)
+
+    def to_list(self) -> List[Dict]:
+        rows = []
+        if not self.seconds:
+            return rows
+        for second in range(min(self.seconds), max(self.seconds) + 1):
+            snapshot = self.seconds.get(second) or SecondStats()
+            rows.append({
+                'second': second,
+                'requests': snapshot.requests,
+                'errors': snapshot.errors,
+                'latency_p50': round(snapshot.latency.percentile(50), 1),
+                'latency_p99': round(snapshot.latency.percentile(99), 1),
+                'latency_max': round(snapshot.latency.max, 1),
+            })
+        return rows
+
+
+class EndpointStats:
+    """Streaming totals for one scenario endpoint (or replayed route)."""
+
+    def __init__(self):
+        self.total = 0
+        self.failed = 0
+        self.bytes_received = 0
+        self.errors_by_type: Dict[str, int] = {}
+        self.latency = LatencyHistogram()
+
+    def record(self, result: RequestResult):
+        self.total += 1
+        if result.success:
+            self.latency.record(result.latency_ms)
+            self.bytes_received += result.response_size
+        else:
+            self.failed += 1
+            error_type = result.error or 'Unknown'
+            self.errors_by_type[error_type] = self.errors_by_type.get(error_type, 0) + 1
+
+    def merge(self, other: 'EndpointStats'):
+        self.total += other.total
+        self.failed += other.failed
+        self.bytes_received += other.bytes_received
+        for error_type, count in other.errors_by_type.items():
+            self.errors_by_type[error_type] = self.errors_by_type.get(error_type, 0) + count
+        self.latency.merge(other.latency)
+
+    def summary(self, name: str, elapsed_time: float) -> Dict:
+        return {
+            'name': name,
+            'requests': self.total,
+            'failed': self.failed,
+            'success_rate': (self.total - self.failed) / self.total * 100 if self.total else 0.0,
+            'requests_per_second': self.total / elapsed_time if elapsed_time > 0 else 0.0,
+            'latency_avg': self.latency.mean,
+            'latency_p50': self.latency.percentile(50),
+            'latency_p95': self.latency.percentile(95),
+            'latency_p99': self.latency.percentile(99),
+            'errors_by_type': self.errors_by_type,
+        }
+
+
+class LoadStats:
+    """Streaming totals for one worker; fixed memory regardless of request count."""
+
+    def __init__(self, origin: float, series: Optional[TimeSeries] = None):
+        self.origin = origin
+        self.series = series
+        self.total = 0
+        self.failed = 0
+        self.bytes_received = 0
+        self.errors_by_type: Dict[str, int] = {}
+        self.latency = LatencyHistogram()
+        self.ttfb = LatencyHistogram()
+        self.service = LatencyHistogram()
+        self.connections_opened = 0
+        self.connect_total = 0.0
+        self.tls_total = 0.0
+        self.queue_total = 0.0
+        self.queue_max = 0.0
+        self.cut_off = 0
+        self.second = -1
+        self.current = SecondStats()
+        self.endpoints: Dict[str, EndpointStats] = {}
+
+    def record(self, result: RequestResult, endpoint: Optional[str] = None):
+        """Fold one request into the running totals (the result is not kept)."""
+        second = int(time.monotonic() - self.origin)
+        if second != self.second:
+            self.flush()
+            self.second = second
+
+        self.total += 1
+        self.current.requests += 1
+        if result.new_connection:
+            self.connections_opened += 1
+            self.connect_total += result.connect_ms
+            self.tls_total += result.tls_ms
+        self.queue_total += result.queue_ms
+        self.queue_max = max(self.queue_max, result.queue_ms)
+        if endpoint is not None:
+            endpoint_stats = self.endpoints.get(endpoint)
+            if endpoint_stats is None:
+                endpoint_stats = self.endpoints[endpoint] = EndpointStats()
+            endpoint_stats.record(result)
+
+        if result.success:
+            self.latency.record(result.latency_ms)
+            self.ttfb.record(result.ttfb_ms)
+            self.service.record(result.latency_ms - result.queue_ms)
+            self.current.latency.record(result.latency_ms)
+            self.bytes_received += result.response_size
+        else:
+            self.failed += 1
+            self.current.errors += 1
+            error_type = result.error or 'Unknown'
+            self.errors_by_type[error_type] = self.errors_by_type.get(error_type, 0) + 1
+
+    def flush(self):
+        """Hand the in-progress second to the shared time series."""
+        if self.current.requests and self.series is not None:
+            self.series.add(self.second, self.current)
+        self.current = SecondStats()
+
+    def merge(self, other: 'LoadStats'):
+        self.total += other.total
+        self.failed += other.failed
+        self.bytes_received += other.bytes_received
+        for error_type, count in other.errors_by_type.items():
+            self.errors_by_type[error_type] = self.errors_by_type.get(error_type, 0) + count
+        self.latency.merge(other.latency)
+        self.ttfb.merge(other.ttfb)
+        self.service.merge(other.service)
+        self.connections_opened += other.connections_opened
+        self.connect_total += other.connect_total
+        self.tls_total += other.tls_total
+        self.queue_total += other.queue_total
+        self.queue_max = max(self.queue_max, other.queue_max)
+        self.cut_off += other.cut_off
+        for name, endpoint_stats in other.endpoints.items():
+            self.endpoints.setdefault(name, EndpointStats()).merge(endpoint_stats)
+
+
 class LoadTester:
     """HTTP load testing engine."""
 
     def __init__(self, url: str, method: str = 'GET', body: Optional[str] = None,
                  headers: Optional[Dict[str, str]] = None, concurrency: int = 10,
-                 duration: float = 10.0, timeout: float = 30.0, verify_ssl: bool = True):
+                 duration: float = 10.0, timeout: float = 30.0, verify_ssl: bool = True,
+                 keep_alive: bool = True, scenario: Optional[Scenario] = None):
         self.url = url
         self.method = method.upper()
         self.body = body.encode() if body else None
@@ -181,23 +1104,41 @@ class LoadTester:
         self.duration = duration
         self.timeout = timeout
         self.verify_ssl = verify_ssl
+        self.keep_alive = keep_alive
+        # Bound scenario: each request picks one of its endpoints instead of url/method/body
+        self.scenario = scenario
 
-        self.results: List[RequestResult] = []
+        self.origin = time.monotonic()
+        self.series = TimeSeries()
+        self.worker_stats: List[LoadStats] = []
         self.stop_event = threading.Event()
-        self.results_lock = threading.Lock()
+        self.stats_lock = threading.Lock()
 
     def run(self) -> LoadTestResults:
         """Execute load test and return results."""
+        self.print_header()
+        print("-" * 50)
+        elapsed_time = self.execute()
+        return self._aggregate_results(elapsed_time)
+
+    def print_header(self):
         print(f"Load Testing: {self.url}")
-        print(f"Method: {self.method}")
+        if self.scenario:
+            print(f"Scenario: {self.scenario.describe()}")
+        else:
+            print(f"Method: {self.method}")
         print(f"Concurrency: {self.concurrency}")
         print(f"Duration: {self.duration}s")
-        print("-" * 50)
+        print(f"Connections: {'keep-alive (1 per worker)' if self.keep_alive else 'new per request'}")
 
-        self.results = []
+    def execute(self) -> float:
+        """Drive the workers for the test duration; returns elapsed seconds."""
+        self.worker_stats = []
+        self.series = TimeSeries()
         self.stop_event.clear()
 
         start_time = time.time()
+        self.origin = time.monotonic()
 
         # Start worker threads
         with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
@@ -217,86 +1158,360 @@ class LoadTester:
                 except Exception as e:
                     print(f"Worker error: {e}")
 
-        elapsed_time = time.time() - start_time
-
-        return self._aggregate_results(elapsed_time)
+        return time.time() - start_time
 
     def _worker(self):
-        """Worker thread that continuously sends requests."""
-        client = HTTPClient(
+        """Worker thread that continuously sends requests into its own stats."""
+        client_class = KeepAliveHTTPClient if self.keep_alive else HTTPClient
+        client = client_class(
             timeout=self.timeout,
             headers=self.headers,
             verify_ssl=self.verify_ssl,
         )
+        stats = LoadStats(self.origin, self.series)
+        scenario = self.scenario
+        # Workers start at different points of the endpoint mix
+        k = random.randrange(1 << 30)
 
-        while not self.stop_event.is_set():
-            result = client.request(self.url, self.method, self.body)
-
-            with self.results_lock:
-                self.results.append(result)
+        try:
+            while not self.stop_event.is_set():
+                if scenario is None:
+                    stats.record(client.request(self.url, self.method, self.body))
+                    continue
+                endpoint = scenario.endpoints[scenario.pick(k)]
+                k += 1
+                result = client.request(endpoint.url, endpoint.method, endpoint.body, endpoint.headers)
+                stats.record(result, endpoint.name)
+        finally:
+            if self.keep_alive:
+                client.close()
+            stats.flush()
+            with self.stats_lock:
+                self.worker_stats.append(stats)
+
+    def _merged_stats(self) -> LoadStats:
+        merged = LoadStats(self.origin)
+        for stats in self.worker_stats:
+            merged.merge(stats)
+        return merged
 
     def _aggregate_results(self, elapsed_time: float) -> LoadTestResults:
-        """Aggregate individual results into summary."""
-        if not self.results:
-            return LoadTestResults(
-                target_url=self.url,
-                method=self.method,
-                duration_seconds=elapsed_time,
-                concurrency=self.concurrency,
-                total_requests=0,
-                successful_requests=0,
-                failed_requests=0,
-                requests_per_second=0,
-                latency_min=0,
-                latency_max=0,
-                latency_avg=0,
-                latency_p50=0,
-                latency_p90=0,
-                latency_p95=0,
-                latency_p99=0,
-                latency_stddev=0,
-            )
-
-        # Separate successful and failed
-        successful = [r for r in self.results if r.success]
-        failed = [r for r in self.results if not r.success]
-
-        # Latency calculations (from successful requests)
-        latencies = sorted([r.latency_ms for r in successful]) if successful else [0]
-
-        # Error breakdown
-        errors_by_type: Dict[str, int] = {}
-        for r in failed:
-            error_type = r.error or 'Unknown'
-            errors_by_type[error_type] = errors_by_type.get(error_type, 0) + 1
-
-        # Calculate throughput
-        total_bytes = sum(r.response_size for r in successful)
-        throughput_mbps = (total_bytes * 8) / (elapsed_time * 1_000_000) if elapsed_time > 0 else 0
+        """Merge per-worker histograms into a summary."""
+        stats = self._merged_stats()
+        latency = stats.latency
+        opened = stats.connections_opened
+        throughput_mbps = (stats.bytes_received * 8) / (elapsed_time * 1_000_000) if elapsed_time > 0 else 0
 
         return LoadTestResults(
             target_url=self.url,
             method=self.method,
             duration_seconds=elapsed_time,
             concurrency=self.concurrency,
-            total_requests=len(self.results),
-            successful_requests=len(successful),
-            failed_requests=len(failed),
-            requests_per_second=len(self.results) / elapsed_time if elapsed_time > 0 else 0,
-            latency_min=min(latencies),
-            latency_max=max(latencies),
-            latency_avg=statistics.mean(latencies) if latencies else 0,
-            latency_p50=calculate_percentile(latencies, 50),
-            latency_p90=calculate_percentile(latencies, 90),
-            latency_p95=calculate_percentile(latencies, 95),
-            latency_p99=calculate_percentile(latencies, 99),
-            latency_stddev=statistics.stdev(latencies) if len(latencies) > 1 else 0,
-            errors_by_type=errors_by_type,
-            total_bytes_received=total_bytes,
+            total_requests=stats.total,
+            successful_requests=stats.total - stats.failed,
+            failed_requests=stats.failed,
+            requests_per_second=stats.total / elapsed_time if elapsed_time > 0 else 0,
+            latency_min=latency.min if latency.count else 0,
+            latency_max=latency.max,
+            latency_avg=latency.mean,
+            latency_p50=latency.percentile(50),
+            latency_p90=latency.percentile(90),
+            latency_p95=latency.percentile(95),
+            latency_p99=latency.percentile(99),
+            latency_stddev=latency.stddev(),
+            errors_by_type=stats.errors_by_type,
+            total_bytes_received=stats.bytes_received,
             throughput_mbps=throughput_mbps,
+            keep_alive=self.keep_alive,
+            connections_opened=opened,
+            connect_avg=stats.connect_total / opened if opened else 0,
+            tls_avg=stats.tls_total / opened if opened else 0,
+            ttfb_avg=stats.ttfb.mean,
+            ttfb_p50=stats.ttfb.percentile(50),
+            ttfb_p99=stats.ttfb.percentile(99),
+            timeseries=self.series.to_list(),
+            scenario=self.scenario.describe() if self.scenario else None,
+            endpoints=sorted(
+                (endpoint_stats.summary(name, elapsed_time) for name, endpoint_stats in stats.endpoints.items()),
+                key=lambda e: -e['requests'],
+            ),
         )
 
 
+class OpenLoopLoadTester(LoadTester):
+    """Constant-arrival-rate load test driven by an asyncio scheduler.
+
+    Requests are issued on the profile's schedule regardless of completions; at
+    most `concurrency` are in flight, and any that must wait for a connection
+    carry that wait in their latency (measured from the intended send time).
+    """
+
+    def __init__(self, url: str, profile: Optional[RateProfile] = None, shard: Tuple[int, int] = (0, 1),
+                 **kwargs):
+        scenario = kwargs.get('scenario')
+        if profile is not None:
+            kwargs['duration'] = profile.duration
+        elif scenario is not None and scenario.is_replay:
+            # No rate given: follow the recorded timeline
+            kwargs['duration'] = scenario.replay_duration()
+        else:
+            raise ValueError("Open-loop mode needs a rate profile or an access log to replay")
+        super().__init__(url, **kwargs)
+        self.profile = profile
+        # (index, count): this tester sends every count-th request of the schedule
+        self.shard = shard
+        self.sent = 0
+        self.send_window = 0.0
+
+    def print_header(self):
+        print(f"Load Testing: {self.url}")
+        if self.scenario:
+            print(f"Scenario: {self.scenario.describe()}")
+        else:
+            print(f"Method: {self.method}")
+        if self.profile:
+            print(f"Rate profile: {self.profile.describe()}")
+        else:
+            print("Rate: recorded inter-arrival times")
+        print(f"Max in-flight: {self.concurrency}")
+        print(f"Duration: {self.duration:g}s")
+
+    def execute(self) -> float:
+        """Run the schedule to completion; returns elapsed seconds."""
+        self.series = TimeSeries()
+        start_time = time.time()
+        self.origin = time.monotonic()
+        # A single event loop, so one stats object needs no locking
+        stats = LoadStats(self.origin, self.series)
+        asyncio.run(self._run_schedule(stats))
+        stats.flush()
+        self.worker_stats = [stats]
+        return time.time() - start_time
+
+    def _arrivals(self) -> Iterator[Tuple[int, float]]:
+        """(request number, intended send offset) for the whole test, before sharding."""
+        if self.profile is None:
+            return enumerate(self.scenario.arrivals())
+        return enumerate(self.profile.schedule())
+
+    def expected_requests(self) -> float:
+        if self.profile is None:
+            return len(self.scenario.offsets)
+        return self.profile.expected_requests()
+
+    async def _run_schedule(self, stats: LoadStats):
+        scenario = self.scenario
+        endpoints = scenario.endpoints if scenario else [
+            Endpoint(self.url, self.url, self.method, self.body, url=self.url)]
+        # One connection pool per origin; each endpoint's request bytes are built once
+        clients: Dict[Tuple[str, str], AsyncHTTPClient] = {}
+        prepared: Dict[int, Tuple[AsyncHTTPClient, bytes]] = {}
+
+        def prepare(i: int) -> Tuple[AsyncHTTPClient, bytes]:
+            endpoint = endpoints[i]
+            parts = urlsplit(endpoint.url)
+            origin_key = (parts.scheme.lower(), parts.netloc)
+            client = clients.get(origin_key)
+            if client is None:
+                client = clients[origin_key] = AsyncHTTPClient(
+                    endpoint.url, timeout=self.timeout, headers=self.headers,
+                    verify_ssl=self.verify_ssl, keep_alive=self.keep_alive)
+            target = (parts.path or '/') + ('?' + parts.query if parts.query else '')
+            prepared[i] = (client, client.build_request(target, endpoint.method, endpoint.body,
+                                                        endpoint.headers))
+            return prepared[i]
+
+        slots = asyncio.Semaphore(self.concurrency)
+        loop = asyncio.get_running_loop()
+        # Task -> (intended send time, endpoint name) until the task finishes
+        in_flight: Dict[asyncio.Task, Tuple[float, Optional[str]]] = {}
+
+        async def fire(intended: float, i: int):
+            client, request = prepared.get(i) or prepare(i)
+            endpoint = endpoints[i]
+            name = endpoint.name if scenario else None
+            # Waiting for a free connection is bounded by the request timeout too
+            try:
+                await asyncio.wait_for(slots.acquire(), timeout=self.timeout)
+            except asyncio.TimeoutError:
+                waited_ms = (loop.time() - intended) * 1000
+                stats.record(RequestResult(False, 0, waited_ms, error='queue timeout',
+                                           new_connection=False, queue_ms=waited_ms), name)
+                return
+            try:
+                sent = loop.time()
+                result = await client.request(request, head_only=endpoint.method == 'HEAD')
+            finally:
+                slots.release()
+            done = loop.time()
+            result.queue_ms = (sent - intended) * 1000
+            result.latency_ms = (done - intended) * 1000
+            stats.record(result, name)
+
+        origin = loop.time()
+        self.sent = 0
+        index, count = self.shard
+        for k, offset in itertools.islice(self._arrivals(), index, None, count):
+            delay = origin + offset - loop.time()
+            # When behind schedule, fire immediately but still let responses be processed
+            await asyncio.sleep(max(delay, 0))
+            i = scenario.pick(k) if scenario else 0
+            self.sent += 1
+            try:
+                prepared.get(i) or prepare(i)
+            except ValueError as e:
+                # Unusable endpoint (e.g. unsupported scheme): count it as a failed request
+                stats.record(RequestResult(False, 0, 0.0, error=str(e)), endpoints[i].name if scenario else None)
+                continue
+            task = loop.create_task(fire(origin + offset, i))
+            in_flight[task] = (origin + offset, endpoints[i].name if scenario else None)
+            task.add_done_callback(lambda t: in_flight.pop(t, None))
+        self.send_window = max(loop.time() - origin, self.duration)
+
+        if in_flight:
+            # Outstanding requests get at most one timeout (plus queueing) to finish
+            done, pending = await asyncio.wait(list(in_flight), timeout=self.timeout)
+            # Cancelled requests never reach stats.record: count each as a failure
+            # whose latency runs from its intended send time to the cutoff
+            cutoff = loop.time()
+            for task in pending:
+                intended, name = in_flight[task]
+                task.cancel()
+                stats.record(RequestResult(False, 0, (cutoff - intended) * 1000, error='not completed',
+                                           new_connection=False), name)
+                stats.cut_off += 1
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        for client in clients.values():
+            client.close()
+        if stats.total != self.sent:
+            raise RuntimeError(f"Open-loop accounting mismatch: sent {self.sent} requests "
+                               f"but recorded {stats.total - stats.failed} completed + {stats.failed} failed")
+
+    def _aggregate_results(self, elapsed_time: float) -> LoadTestResults:
+        results = super()._aggregate_results(elapsed_time)
+        stats = self._merged_stats()
+
+        results.load_model = 'open'
+        results.target_rps = self.expected_requests() / self.duration
+        results.sent_rps = self.sent / self.send_window if self.send_window > 0 else 0
+        results.cut_off_requests = stats.cut_off
+        results.completed_rps = (stats.total - stats.cut_off) / elapsed_time if elapsed_time > 0 else 0
+        results.queue_avg = stats.queue_total / stats.total if stats.total else 0
+        results.queue_max = stats.queue_max
+        results.service_p50 = stats.service.percentile(50)
+        results.service_p99 = stats.service.percentile(99)
+        return results
+
+
+def _build_tester(url: str, profile: Optional[RateProfile], shard: Tuple[int, int],
+                  options: Dict) -> LoadTester:
+    scenario = options.get('scenario')
+    if profile is not None or (scenario is not None and scenario.is_replay):
+        return OpenLoopLoadTester(url, profile, shard=shard, **options)
+    return LoadTester(url, **options)
+
+
+def _run_shard(url: str, profile: Optional[RateProfile], shard: Tuple[int, int], options: Dict,
+               barrier, results_queue):
+    """Process entry point: run one shard in lockstep with the others and ship its stats back."""
+    try:
+        tester = _build_tester(url, profile, shard, options)
+        # Every shard starts its clock together, so per-second snapshots line up
+        barrier.wait(timeout=60)
+        elapsed = tester.execute()
+        results_queue.put((shard[0], None, {
+            'elapsed': elapsed,
+            'stats': tester._merged_stats(),
+            'seconds': tester.series.seconds,
+            'sent': getattr(tester, 'sent', 0),
+            'send_window': getattr(tester, 'send_window', 0.0),
+        }))
+    except BaseException as e:
+        barrier.abort()
+        results_queue.put((shard[0], f"{type(e).__name__}: {e}", None))
+
+
+class MultiProcessLoadTester:
+    """Shards one load test across worker processes to get past the GIL.
+
+    Each process runs its own thread pool (or event loop, in open-loop mode)
+    with a slice of the concurrency; open-loop shards take interleaved slices
+    of the same schedule. Their histograms, error counts and time series are
+    merged into a single LoadTestResults.
+    """
+
+    def __init__(self, url: str, processes: int, profile: Optional[RateProfile] = None, **options):
+        if options.get('concurrency', 10) < processes:
+            raise ValueError(f"Concurrency ({options.get('concurrency', 10)}) must be at least --processes ({processes})")
+        self.url = url
+        self.processes = processes
+        self.profile = profile
+        self.options = options
+        # Unsharded tester: prints the header and aggregates the merged shard stats
+        self.tester = _build_tester(url, profile, (0, 1), options)
+
+    def _shard_options(self, index: int) -> Dict:
+        share, extra = divmod(self.tester.concurrency, self.processes)
+        return dict(self.options, concurrency=share + (1 if index < extra else 0))
+
+    def run(self) -> LoadTestResults:
+        """Execute load test across all processes and return merged results."""
+        self.tester.print_header()
+        print(f"Processes: {self.processes}")
+        print("-" * 50)
+
+        ctx = multiprocessing.get_context()
+        barrier = ctx.Barrier(self.processes)
+        results_queue = ctx.Queue()
+        workers = [
+            ctx.Process(
+                target=_run_shard,
+                args=(self.url, self.profile, (i, self.processes), self._shard_options(i),
+                      barrier, results_queue),
+                daemon=True,
+            )
+            for i in range(self.processes)
+        ]
+        for worker in workers:
+            worker.start()
+
+        payloads, errors = [], []
+        deadline = self.tester.duration + self.tester.timeout + 60
+        try:
+            for _ in workers:
+                index, error, payload = results_queue.get(timeout=deadline)
+                if error:
+                    errors.append(f"process {index}: {error}")
+                else:
+                    payloads.append(payload)
+        except queue.Empty:
+            errors.append("a load generator process stopped without reporting results")
+        finally:
+            for worker in workers:
+                worker.join(timeout=5)
+                if worker.is_alive():
+                    worker.terminate()
+
+        if errors:
+            # A failing shard aborts the start barrier; report the cause, not the echoes
+            causes = [e for e in errors if 'BrokenBarrierError' not in e] or errors
+            raise RuntimeError('; '.join(causes))
+
+        tester = self.tester
+        tester.worker_stats = [p['stats'] for p in payloads]
+        tester.series = TimeSeries()
+        for payload in payloads:
+            for second, snapshot in payload['seconds'].items():
+                tester.series.add(second, snapshot)
+        if isinstance(tester, OpenLoopLoadTester):
+            tester.sent = sum(p['sent'] for p in payloads)
+            tester.send_window = max(p['send_window'] for p in payloads)
+
+        results = tester._aggregate_results(max(p['elapsed'] for p in payloads))
+        results.processes = self.processes
+        return results
+
 def print_results(results: LoadTestResults, verbose: bool = False):
     """Print formatted load test results."""
     print("\n" + "=" * 60)
@@ -304,17 +1519,33 @@ def print_results(results: LoadTestResults, verbose: bool = False):
     print("=" * 60)
 
     print(f"\nTarget: {results.target_url}")
-    print(f"Method: {results.method}")
+    if results.scenario:
+        print(f"Scenario: {results.scenario}")
+    else:
+        print(f"Method: {results.method}")
     print(f"Duration: {results.duration_seconds:.1f}s")
     print(f"Concurrency: {results.concurrency}")
+    if results.processes > 1:
+        print(f"Processes: {results.processes}")
 
-    print(f"\nTHROUGHPUT:")
+    print("\nTHROUGHPUT:")
     print(f"  Total requests: {results.total_requests:,}")
     print(f"  Requests/sec: {results.requests_per_second:.1f}")
     print(f"  Successful: {results.successful_requests:,} ({results.success_rate():.1f}%)")
     print(f"  Failed: {results.failed_requests:,}")
 
-    print(f"\nLATENCY (ms):")
+    if results.load_model == 'open':
+        print("\nARRIVAL RATE (open-loop):")
+        print(f"  Target rate: {results.target_rps:.1f} req/s")
+        print(f"  Sent rate: {results.sent_rps:.1f} req/s ({results.sent_rps / results.target_rps * 100 if results.target_rps else 0:.1f}% of target)")
+        print(f"  Completed: {results.completed_rps:.1f} req/s")
+        if results.cut_off_requests:
+            print(f"  Cut off at shutdown: {results.cut_off_requests:,} (counted as failed)")
+        print(f"  Queued for a connection avg/max (ms): {results.queue_avg:.1f} / {results.queue_max:.1f}")
+        print(f"  Service time P50/P99 (ms): {results.service_p50:.1f} / {results.service_p99:.1f}")
+        print("  (latency below is measured from the intended send time)")
+
+    print("\nLATENCY (ms):")
     print(f"  Min: {results.latency_min:.1f}")
     print(f"  Avg: {results.latency_avg:.1f}")
     print(f"  P50: {results.latency_p50:.1f}")
@@ -324,36 +1555,73 @@ def print_results(results: LoadTestResults, verbose: bool = False):
     print(f"  Max: {results.latency_max:.1f}")
     print(f"  StdDev: {results.latency_stddev:.1f}")
 
+    print("\nCONNECTIONS:")
+    print(f"  Mode: {'keep-alive' if results.keep_alive else 'new per request'}")
+    print(f"  Opened: {results.connections_opened:,}")
+    if results.keep_alive:
+        print(f"  Connect avg (ms): {results.connect_avg:.1f}")
+        print(f"  TLS avg (ms): {results.tls_avg:.1f}")
+    print(f"  TTFB avg/p50/p99 (ms): {results.ttfb_avg:.1f} / {results.ttfb_p50:.1f} / {results.ttfb_p99:.1f}")
+
+    if results.endpoints:
+        shown = results.endpoints if verbose else results.endpoints[:20]
+        width = max(len('Endpoint'), *(len(e['name']) for e in shown))
+        print("\nENDPOINTS:")
+        print(f"  {'Endpoint':<{width}} {'Requests':>9} {'Req/s':>8} {'Success':>8} "
+              f"{'P50 (ms)':>9} {'P95 (ms)':>9} {'P99 (ms)':>9}")
+        for e in shown:
+            print(f"  {e['name']:<{width}} {e['requests']:>9,} {e['requests_per_second']:>8.1f} "
+                  f"{e['success_rate']:>7.1f}% {e['latency_p50']:>9.1f} {e['latency_p95']:>9.1f} "
+                  f"{e['latency_p99']:>9.1f}")
+        if len(shown) < len(results.endpoints):
+            print(f"  ... {len(results.endpoints) - len(shown)} more (use --verbose for all)")
+
     if results.errors_by_type:
-        print(f"\nERRORS:")
+        print("\nERRORS:")
         for error_type, count in sorted(results.errors_by_type.items(), key=lambda x: -x[1]):
             print(f"  {error_type}: {count}")
 
     if verbose:
-        print(f"\nTRANSFER:")
+        print("\nTRANSFER:")
         print(f"  Total bytes: {results.total_bytes_received:,}")
         print(f"  Throughput: {results.throughput_mbps:.2f} Mbps")
 
+    if verbose and results.timeseries:
+        print("\nTIME SERIES (per second):")
+        print(f"  {'Second':>6} {'Requests':>9} {'Errors':>7} {'P50 (ms)':>9} {'P99 (ms)':>9} {'Max (ms)':>9}")
+        for row in results.timeseries:
+            print(f"  {row['second']:>6} {row['requests']:>9,} {row['errors']:>7,} "
+                  f"{row['latency_p50']:>9.1f} {row['latency_p99']:>9.1f} {row['latency_max']:>9.1f}")
+
     # Recommendations
-    print(f"\nRECOMMENDATIONS:")
+    print("\nRECOMMENDATIONS:")
 
     if results.latency_p99 > 500:
         print(f"  Warning: P99 latency ({results.latency_p99:.0f}ms) exceeds 500ms")
-        print(f"    Consider: Connection pooling, query optimization, caching")
+        print("    Consider: Connection pooling, query optimization, caching")
 
     if results.latency_p95 > 200:
         print(f"  Warning: P95 latency ({results.latency_p95:.0f}ms) exceeds 200ms target")
 
+    if results.load_model == 'open' and results.target_rps and results.sent_rps < results.target_rps * 0.95:
+        print(f"  Warning: Sent rate ({results.sent_rps:.0f}/s) fell short of target ({results.target_rps:.0f}/s)")
+        print("    The load generator itself is saturated; results understate the target load")
+
+    # Only flag queueing that is both large in absolute terms and a big share of the worst latency
+    if results.load_model == 'open' and results.queue_max >= 100 and results.queue_max > 0.5 * results.latency_max:
+        print(f"  Warning: Requests waited up to {results.queue_max:.0f}ms for a free connection")
+        print(f"    Server cannot keep up with the arrival rate at concurrency {results.concurrency}")
+
     if results.success_rate() < 99.0:
         print(f"  Warning: Success rate ({results.success_rate():.1f}%) below 99%")
-        print(f"    Check server capacity and error logs")
+        print("    Check server capacity and error logs")
 
     if results.latency_stddev > results.latency_avg:
-        print(f"  Warning: High latency variance (stddev > avg)")
-        print(f"    Indicates inconsistent performance")
+        print("  Warning: High latency variance (stddev > avg)")
+        print("    Indicates inconsistent performance")
 
     if results.success_rate() >= 99.0 and results.latency_p95 <= 200:
-        print(f"  Performance looks good for this load level")
+        print("  Performance looks good for this load level")
 
     print("=" * 60)
 
@@ -424,7 +1692,9 @@ class APILoadTester:
     def __init__(self, urls: List[str], method: str = 'GET', body: Optional[str] = None,
                  headers: Optional[Dict[str, str]] = None, concurrency: int = 10,
                  duration: float = 10.0, timeout: float = 30.0, compare: bool = False,
-                 verbose: bool = False, verify_ssl: bool = True):
+                 verbose: bool = False, verify_ssl: bool = True, keep_alive: bool = True,
+                 rate_profile: Optional[RateProfile] = None, processes: int = 1,
+                 scenario: Optional[Scenario] = None):
         self.urls = urls
         self.method = method
         self.body = body
@@ -435,22 +1705,36 @@ class APILoadTester:
         self.compare = compare
         self.verbose = verbose
         self.verify_ssl = verify_ssl
+        self.keep_alive = keep_alive
+        self.rate_profile = rate_profile
+        self.processes = processes
+        # With a scenario, each URL is a base URL the scenario's paths resolve against
+        self.scenario = scenario
 
     def run(self) -> Dict:
         """Execute load test(s) and return results."""
         results = []
 
         for url in self.urls:
-            tester = LoadTester(
-                url=url,
+            options = dict(
                 method=self.method,
                 body=self.body,
                 headers=self.headers,
                 concurrency=self.concurrency,
-                duration=self.duration,
                 timeout=self.timeout,
                 verify_ssl=self.verify_ssl,
+                keep_alive=self.keep_alive,
+                scenario=self.scenario.bind(url) if self.scenario else None,
             )
+            replay = self.scenario is not None and self.scenario.is_replay
+            if self.processes > 1:
+                if not (self.rate_profile or replay):
+                    options['duration'] = self.duration
+                tester = MultiProcessLoadTester(url, self.processes, self.rate_profile, **options)
+            elif self.rate_profile or replay:
+                tester = OpenLoopLoadTester(url, self.rate_profile, **options)
+            else:
+                tester = LoadTester(url, duration=self.duration, **options)
 
             result = tester.run()
             results.append(result)
@@ -489,13 +1773,19 @@ Examples:
   %(prog)s https://api.example.com/orders --method POST --body '{"item": 1}'
   %(prog)s https://api.example.com/v1 https://api.example.com/v2 --compare
   %(prog)s https://api.example.com/health --header "Authorization: Bearer token"
+  %(prog)s https://api.example.com/health --no-keep-alive
+  %(prog)s https://api.example.com/users --rate 500 --duration 60 --concurrency 200
+  %(prog)s https://api.example.com/users --rate-profile "30s:50-500,60s:500"
+  %(prog)s https://api.example.com/users --concurrency 400 --processes 8
+  %(prog)s https://api.example.com --scenario checkout_mix.json --rate 200
+  %(prog)s https://staging.example.com --replay access.log --speed 2
         '''
     )
 
     parser.add_argument(
         'urls',
-        nargs='+',
-        help='URL(s) to test'
+        nargs='*',
+        help='URL(s) to test; base URL(s) with --scenario/--replay'
     )
     parser.add_argument(
         '--method', '-m',
@@ -517,7 +1807,7 @@ Examples:
         '--concurrency', '-c',
         type=int,
         default=10,
-        help='Number of concurrent requests (default: 10)'
+        help='Number of concurrent requests; max in flight with --rate (default: 10)'
     )
     parser.add_argument(
         '--duration', '-d',
@@ -525,6 +1815,35 @@ Examples:
         default=10.0,
         help='Test duration in seconds (default: 10)'
     )
+    parser.add_argument(
+        '--scenario',
+        help='Weighted endpoint mix (JSON) with per-endpoint method, body and headers'
+    )
+    parser.add_argument(
+        '--replay',
+        help='Access log to replay (Common/Combined Log Format or JSON lines)'
+    )
+    parser.add_argument(
+        '--speed',
+        type=float,
+        default=1.0,
+        help='Replay time scale: 2 replays twice as fast (default: 1, recorded timing)'
+    )
+    parser.add_argument(
+        '--processes', '-p',
+        type=int,
+        default=1,
+        help='Shard --concurrency across this many load generator processes (default: 1)'
+    )
+    parser.add_argument(
+        '--rate', '-r',
+        type=float,
+        help='Open-loop mode: send this many requests/sec for --duration, regardless of responses'
+    )
+    parser.add_argument(
+        '--rate-profile',
+        help='Open-loop ramp, e.g. "30s:50-500,60s:500" (DURATION:RPS or DURATION:FROM-TO per stage)'
+    )
     parser.add_argument(
         '--timeout', '-t',
         type=float,
@@ -541,6 +1860,11 @@ Examples:
         action='store_true',
         help='Disable SSL certificate verification'
     )
+    parser.add_argument(
+        '--no-keep-alive',
+        action='store_true',
+        help='Open a new connection per request instead of one persistent connection per worker'
+    )
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -559,10 +1883,44 @@ Examples:
     args = parser.parse_args()
 
     # Validate
+    if args.scenario and args.replay:
+        print("Error: use either --scenario or --replay, not both", file=sys.stderr)
+        sys.exit(1)
+
+    scenario = None
+    try:
+        if args.scenario:
+            scenario = Scenario.from_file(args.scenario)
+        elif args.replay:
+            scenario = Scenario.from_access_log(args.replay, args.speed)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if not args.urls and scenario and scenario.base_url:
+        args.urls = [scenario.base_url]
+    if not args.urls:
+        print("Error: give at least one URL (the base URL with --scenario/--replay)", file=sys.stderr)
+        sys.exit(1)
+
     if args.compare and len(args.urls) < 2:
         print("Error: --compare requires two URLs", file=sys.stderr)
         sys.exit(1)
 
+    if args.processes < 1 or args.concurrency < args.processes:
+        print("Error: --processes must be between 1 and --concurrency", file=sys.stderr)
+        sys.exit(1)
+
+    rate_profile = None
+    try:
+        if args.rate_profile:
+            rate_profile = RateProfile.parse(args.rate_profile)
+        elif args.rate is not None:
+            rate_profile = RateProfile.constant(args.rate, args.duration)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
     # Parse headers
     headers = parse_headers(args.headers)
 
@@ -578,6 +1936,10 @@ Examples:
             compare=args.compare,
             verbose=args.verbose,
             verify_ssl=not args.no_verify_ssl,
+            keep_alive=not args.no_keep_alive,
+            rate_profile=rate_profile,
+            processes=args.processes,
+            scenario=scenario,
         )
 
         results = tester.run()
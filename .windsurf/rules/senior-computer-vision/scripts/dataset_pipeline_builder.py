@@ -15,8 +15,10 @@ Usage:
     python dataset_pipeline_builder.py analyze --input /path/to/dataset
     python dataset_pipeline_builder.py convert --input /path/to/coco --output /path/to/yolo --format yolo
     python dataset_pipeline_builder.py split --input /path/to/dataset --train 0.8 --val 0.1 --test 0.1
+    python dataset_pipeline_builder.py split --input /path/to/dataset --output /path/to/splits --manifest
     python dataset_pipeline_builder.py augment-config --task detection --output augmentations.yaml
     python dataset_pipeline_builder.py validate --input /path/to/dataset --format coco
+    python dataset_pipeline_builder.py validate --input /path/to/dataset --near-duplicates dhash
 """
 
 import os
@@ -27,12 +29,22 @@ import shutil
 import logging
 import argparse
 import hashlib
+import math
+import time
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set, Any
+from typing import Dict, List, Optional, Tuple, Set, Any, Iterator
 from datetime import datetime
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import xml.etree.ElementTree as ET
 
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -510,6 +522,158 @@ class DatasetAnalyzer:
         return checks
 
 
+# ============================================================================
+# Streaming COCO Reader
+# ============================================================================
+
+class CocoStreamReader:
+    """Incrementally parse a COCO JSON file without loading it whole.
+
+    Elements of the top-level arrays named in `sections` are yielded one at a time as
+    (key, item); other top-level values are decoded whole and yielded as (key, value).
+    `keys` records every top-level key seen, so empty arrays are still detectable.
+    """
+
+    def __init__(self, path: Path, sections: Set[str], chunk_size: int = 1 << 20):
+        self.path = path
+        self.sections = sections
+        self.chunk_size = chunk_size
+        self.keys: Set[str] = set()
+        self.chars_read = 0
+        self._decoder = json.JSONDecoder()
+        self._file = None
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int):
+        chunk = self._file.read(size)
+        self.chars_read += len(chunk)
+        self._eof = not chunk
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+
+    def _peek(self) -> str:
+        """Next non-whitespace character ('' at end of file), without consuming it."""
+        while True:
+            buf = self._buf
+            while self._pos < len(buf) and buf[self._pos] in ' \t\r\n':
+                self._pos += 1
+            if self._pos < len(buf) or self._eof:
+                return buf[self._pos] if self._pos < len(buf) else ''
+            self._fill(self.chunk_size)
+
+    def _decode(self) -> Any:
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+                # A number ending exactly at the buffer boundary may be truncated
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            # Grow geometrically so a large skipped value is not re-decoded once per chunk
+            self._fill(max(self.chunk_size, len(self._buf) - self._pos))
+
+    def _expect(self, char: str):
+        if self._peek() != char:
+            raise ValueError(f"{self.path}: expected '{char}' at offset ~{self.chars_read}")
+        self._pos += 1
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        with open(self.path, 'r', encoding='utf-8') as self._file:
+            if self._peek() != '{':
+                return  # Not a COCO document (e.g. a top-level list)
+            self._pos += 1
+            while True:
+                char = self._peek()
+                if char == '}' or char == '':
+                    return
+                if char == ',':
+                    self._pos += 1
+                    continue
+                key = self._decode()
+                self._expect(':')
+                self.keys.add(key)
+                if self._peek() == '[' and key in self.sections:
+                    self._pos += 1
+                    while True:
+                        char = self._peek()
+                        if char == ']':
+                            self._pos += 1
+                            break
+                        if char == ',':
+                            self._pos += 1
+                            continue
+                        if char == '':
+                            raise ValueError(f"{self.path}: truncated '{key}' array")
+                        yield key, self._decode()
+                else:
+                    yield key, self._decode()
+
+
+class AnnotationSpill:
+    """Annotations grouped by image: in memory up to a budget, then hash-partitioned to temp files."""
+
+    def __init__(self, max_in_memory: int = 2_000_000, partitions: int = 64):
+        self.max_in_memory = max_in_memory
+        self.partitions = partitions
+        self.count = 0
+        self._groups: Dict[Any, List] = defaultdict(list)
+        self._buffered = 0
+        self._tmpdir = None
+
+    def add(self, image_id: Any, record: List):
+        self._groups[image_id].append(record)
+        self.count += 1
+        self._buffered += 1
+        if self._buffered >= self.max_in_memory:
+            self._spill()
+
+    def _spill(self):
+        if self._tmpdir is None:
+            self._tmpdir = tempfile.TemporaryDirectory(prefix='coco_spill_')
+            logger.info(f"Annotation count exceeds {self.max_in_memory:,}; spilling to {self._tmpdir.name}")
+        handles = {}
+        try:
+            for image_id, records in self._groups.items():
+                part = hash(image_id) % self.partitions
+                f = handles.get(part)
+                if f is None:
+                    f = handles[part] = open(Path(self._tmpdir.name) / f'{part}.jsonl', 'a')
+                for record in records:
+                    f.write(json.dumps([image_id, record], separators=(',', ':')) + '\n')
+        finally:
+            for f in handles.values():
+                f.close()
+        self._groups = defaultdict(list)
+        self._buffered = 0
+
+    def groups(self) -> Iterator[Dict[Any, List]]:
+        """Yield {image_id: records} dicts; each image appears in exactly one, records in input order."""
+        if self._tmpdir is None:
+            yield self._groups
+            return
+        self._spill()
+        for part in range(self.partitions):
+            path = Path(self._tmpdir.name) / f'{part}.jsonl'
+            if not path.exists():
+                continue
+            group = defaultdict(list)
+            with open(path) as f:
+                for line in f:
+                    image_id, record = json.loads(line)
+                    group[image_id].append(record)
+            yield group
+
+    def close(self):
+        if self._tmpdir is not None:
+            self._tmpdir.cleanup()
+            self._tmpdir = None
+
+
 # ============================================================================
 # Format Conversion
 # ============================================================================
@@ -517,9 +681,16 @@ class DatasetAnalyzer:
 class FormatConverter:
     """Convert between dataset formats."""
 
-    def __init__(self, input_path: str, output_path: str):
+    # Label files handed to a writer thread at a time
+    WRITE_BATCH = 256
+    PROGRESS_INTERVAL = 5.0
+
+    def __init__(self, input_path: str, output_path: str, workers: int = 0,
+                 max_in_memory: int = 2_000_000):
         self.input_path = Path(input_path)
         self.output_path = Path(output_path)
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        self.max_in_memory = max_in_memory
 
     def convert(self, target_format: str, source_format: str = None) -> Dict:
         """Convert dataset to target format."""
@@ -546,75 +717,126 @@ class FormatConverter:
 
         return converters[conversion_key]()
 
+    def _read_coco(self, coco_file: Path) -> Optional[Tuple[Dict, List[Dict], AnnotationSpill]]:
+        """Stream a COCO file into (images by id, categories, per-image annotation store)."""
+        reader = CocoStreamReader(coco_file, {'images', 'annotations', 'categories'})
+        size = coco_file.stat().st_size
+        images = {}
+        categories = []
+        spill = AnnotationSpill(self.max_in_memory)
+        start = last_report = time.monotonic()
+        try:
+            for key, item in reader:
+                if key == 'annotations':
+                    spill.add(item['image_id'], [item.get('category_id'), item.get('bbox')])
+                    if spill.count % 100_000 == 0 and time.monotonic() - last_report > self.PROGRESS_INTERVAL:
+                        last_report = time.monotonic()
+                        mb = reader.chars_read / (1024 * 1024)
+                        logger.info(f"{coco_file.name}: parsed {mb:.0f}/{size / (1024 * 1024):.0f} MB, "
+                                    f"{spill.count:,} annotations ({mb / (last_report - start):.1f} MB/s)")
+                elif key == 'images':
+                    images[item['id']] = (item['file_name'], item['width'], item['height'])
+                elif key == 'categories':
+                    categories.append(item)
+        except Exception:
+            spill.close()
+            raise
+        if 'annotations' not in reader.keys:
+            spill.close()
+            return None
+        logger.info(f"{coco_file.name}: {len(images):,} images, {spill.count:,} annotations "
+                    f"parsed in {time.monotonic() - start:.1f}s")
+        return images, categories, spill
+
+    def _write_files(self, files: Iterator[Tuple[Path, bytes]]):
+        """Write (path, content) pairs from a thread pool, bounding in-flight batches."""
+        def write_batch(batch: List[Tuple[Path, bytes]]):
+            for path, content in batch:
+                with open(path, 'wb') as f:
+                    f.write(content)
+
+        start = last_report = time.monotonic()
+        written = 0
+        pending = []
+        batch = []
+        with ThreadPoolExecutor(self.workers) as pool:
+            for item in files:
+                batch.append(item)
+                if len(batch) < self.WRITE_BATCH:
+                    continue
+                pending.append(pool.submit(write_batch, batch))
+                written += len(batch)
+                batch = []
+                if len(pending) >= self.workers * 4:
+                    pending.pop(0).result()
+                if time.monotonic() - last_report > self.PROGRESS_INTERVAL:
+                    last_report = time.monotonic()
+                    logger.info(f"Wrote {written:,} label files ({written / (last_report - start):,.0f} files/s)")
+            if batch:
+                pending.append(pool.submit(write_batch, batch))
+                written += len(batch)
+            for future in pending:
+                future.result()
+        elapsed = time.monotonic() - start
+        logger.info(f"Wrote {written:,} label files in {elapsed:.1f}s "
+                    f"({written / elapsed if elapsed else 0:,.0f} files/s)")
+        return written
+
     def _coco_to_yolo(self) -> Dict:
         """Convert COCO format to YOLO format."""
         results = {'converted_images': 0, 'converted_annotations': 0}
+        start = time.monotonic()
 
         # Find COCO JSON
         coco_files = list(self.input_path.rglob('*.json'))
 
         for coco_file in coco_files:
+            spill = None
             try:
-                with open(coco_file) as f:
-                    coco_data = json.load(f)
-
-                if 'annotations' not in coco_data:
+                coco = self._read_coco(coco_file)
+                if coco is None:
                     continue
+                img_map, categories, spill = coco
 
-                # Create output directories
+                # Create output directories once; every label file lands in labels/
                 self.output_path.mkdir(parents=True, exist_ok=True)
                 labels_dir = self.output_path / 'labels'
                 labels_dir.mkdir(exist_ok=True)
 
-                # Build category and image mappings
+                # Build category mapping
                 cat_map = {}
-                for i, cat in enumerate(coco_data.get('categories', [])):
+                for i, cat in enumerate(categories):
                     cat_map[cat['id']] = i
 
-                img_map = {}
-                for img in coco_data.get('images', []):
-                    img_map[img['id']] = {
-                        'file_name': img['file_name'],
-                        'width': img['width'],
-                        'height': img['height']
-                    }
-
-                # Group annotations by image
-                annotations_by_image = defaultdict(list)
-                for ann in coco_data['annotations']:
-                    annotations_by_image[ann['image_id']].append(ann)
-
-                # Write YOLO format labels
-                for img_id, annotations in annotations_by_image.items():
-                    if img_id not in img_map:
-                        continue
-
-                    img_info = img_map[img_id]
-                    label_name = Path(img_info['file_name']).stem + '.txt'
-                    label_path = labels_dir / label_name
-
-                    with open(label_path, 'w') as f:
-                        for ann in annotations:
-                            if 'bbox' not in ann:
+                def label_files(spill, img_map, cat_map, labels_dir):
+                    for group in spill.groups():
+                        for img_id, annotations in group.items():
+                            if img_id not in img_map:
                                 continue
 
-                            bbox = ann['bbox']  # [x, y, width, height]
-                            cat_id = cat_map.get(ann['category_id'], 0)
+                            file_name, width, height = img_map[img_id]
+                            lines = []
+                            for category_id, bbox in annotations:
+                                if bbox is None:
+                                    continue
 
-                            # Convert to YOLO format (normalized x_center, y_center, width, height)
-                            x_center = (bbox[0] + bbox[2] / 2) / img_info['width']
-                            y_center = (bbox[1] + bbox[3] / 2) / img_info['height']
-                            w = bbox[2] / img_info['width']
-                            h = bbox[3] / img_info['height']
+                                # [x, y, width, height] -> normalized x_center, y_center, width, height
+                                cat_id = cat_map.get(category_id, 0)
+                                x_center = (bbox[0] + bbox[2] / 2) / width
+                                y_center = (bbox[1] + bbox[3] / 2) / height
+                                w = bbox[2] / width
+                                h = bbox[3] / height
+                                lines.append(f"{cat_id} {x_center:.6f} {y_center:.6f} {w:.6f} {h:.6f}\n")
 
-                            f.write(f"{cat_id} {x_center:.6f} {y_center:.6f} {w:.6f} {h:.6f}\n")
-                            results['converted_annotations'] += 1
+                            results['converted_annotations'] += len(lines)
+                            results['converted_images'] += 1
+                            yield labels_dir / (Path(file_name).stem + '.txt'), ''.join(lines).encode()
 
-                    results['converted_images'] += 1
+                self._write_files(label_files(spill, img_map, cat_map, labels_dir))
 
                 # Write classes.txt
                 classes = [None] * len(cat_map)
-                for cat in coco_data.get('categories', []):
+                for cat in categories:
                     idx = cat_map[cat['id']]
                     classes[idx] = cat['name']
 
@@ -636,9 +858,19 @@ class FormatConverter:
 
             except Exception as e:
                 logger.error(f"Error converting {coco_file}: {e}")
+            finally:
+                if spill is not None:
+                    spill.close()
 
+        self._add_throughput(results, start)
         return results
 
+    @staticmethod
+    def _add_throughput(results: Dict, start: float):
+        elapsed = time.monotonic() - start
+        results['elapsed_seconds'] = round(elapsed, 2)
+        results['images_per_second'] = round(results['converted_images'] / elapsed, 1) if elapsed else None
+
     def _yolo_to_coco(self) -> Dict:
         """Convert YOLO format to COCO format."""
         results = {'converted_images': 0, 'converted_annotations': 0}
@@ -816,68 +1048,69 @@ class FormatConverter:
     def _coco_to_voc(self) -> Dict:
         """Convert COCO format to Pascal VOC format."""
         results = {'converted_images': 0, 'converted_annotations': 0}
+        start = time.monotonic()
 
         self.output_path.mkdir(parents=True, exist_ok=True)
         annotations_dir = self.output_path / 'Annotations'
         annotations_dir.mkdir(exist_ok=True)
 
         for coco_file in self.input_path.rglob('*.json'):
+            spill = None
             try:
-                with open(coco_file) as f:
-                    coco_data = json.load(f)
-
-                if 'annotations' not in coco_data:
+                coco = self._read_coco(coco_file)
+                if coco is None:
                     continue
+                img_map, categories, spill = coco
 
                 # Build mappings
-                cat_map = {cat['id']: cat['name'] for cat in coco_data.get('categories', [])}
-                img_map = {img['id']: img for img in coco_data.get('images', [])}
+                cat_map = {cat['id']: cat['name'] for cat in categories}
 
-                # Group by image
-                ann_by_image = defaultdict(list)
-                for ann in coco_data['annotations']:
-                    ann_by_image[ann['image_id']].append(ann)
+                def xml_files(spill, img_map, cat_map):
+                    for group in spill.groups():
+                        for img_id, annotations in group.items():
+                            if img_id not in img_map:
+                                continue
 
-                for img_id, annotations in ann_by_image.items():
-                    if img_id not in img_map:
-                        continue
+                            file_name, width, height = img_map[img_id]
 
-                    img_info = img_map[img_id]
+                            # Create VOC XML
+                            annotation = ET.Element('annotation')
 
-                    # Create VOC XML
-                    annotation = ET.Element('annotation')
+                            ET.SubElement(annotation, 'folder').text = 'images'
+                            ET.SubElement(annotation, 'filename').text = file_name
 
-                    ET.SubElement(annotation, 'folder').text = 'images'
-                    ET.SubElement(annotation, 'filename').text = img_info['file_name']
+                            size = ET.SubElement(annotation, 'size')
+                            ET.SubElement(size, 'width').text = str(width)
+                            ET.SubElement(size, 'height').text = str(height)
+                            ET.SubElement(size, 'depth').text = '3'
 
-                    size = ET.SubElement(annotation, 'size')
-                    ET.SubElement(size, 'width').text = str(img_info['width'])
-                    ET.SubElement(size, 'height').text = str(img_info['height'])
-                    ET.SubElement(size, 'depth').text = '3'
+                            for category_id, bbox in annotations:
+                                if bbox is None:
+                                    continue
+                                obj = ET.SubElement(annotation, 'object')
+                                ET.SubElement(obj, 'name').text = cat_map.get(category_id, 'unknown')
+                                ET.SubElement(obj, 'difficult').text = '0'
 
-                    for ann in annotations:
-                        obj = ET.SubElement(annotation, 'object')
-                        ET.SubElement(obj, 'name').text = cat_map.get(ann['category_id'], 'unknown')
-                        ET.SubElement(obj, 'difficult').text = '0'
+                                bndbox = ET.SubElement(obj, 'bndbox')
+                                ET.SubElement(bndbox, 'xmin').text = str(int(bbox[0]))
+                                ET.SubElement(bndbox, 'ymin').text = str(int(bbox[1]))
+                                ET.SubElement(bndbox, 'xmax').text = str(int(bbox[0] + bbox[2]))
+                                ET.SubElement(bndbox, 'ymax').text = str(int(bbox[1] + bbox[3]))
 
-                        bbox = ann['bbox']
-                        bndbox = ET.SubElement(obj, 'bndbox')
-                        ET.SubElement(bndbox, 'xmin').text = str(int(bbox[0]))
-                        ET.SubElement(bndbox, 'ymin').text = str(int(bbox[1]))
-                        ET.SubElement(bndbox, 'xmax').text = str(int(bbox[0] + bbox[2]))
-                        ET.SubElement(bndbox, 'ymax').text = str(int(bbox[1] + bbox[3]))
+                                results['converted_annotations'] += 1
 
-                        results['converted_annotations'] += 1
+                            results['converted_images'] += 1
+                            yield annotations_dir / (Path(file_name).stem + '.xml'), ET.tostring(annotation)
 
-                    # Write XML
-                    xml_name = Path(img_info['file_name']).stem + '.xml'
-                    tree = ET.ElementTree(annotation)
-                    tree.write(annotations_dir / xml_name)
-                    results['converted_images'] += 1
+                self._write_files(xml_files(spill, img_map, cat_map))
 
             except Exception as e:
                 logger.error(f"Error converting {coco_file}: {e}")
+            finally:
+                if spill is not None:
+                    spill.close()
 
+        self._add_throughput(results, start)
         return results
 
 
@@ -886,14 +1119,22 @@ class FormatConverter:
 # ============================================================================
 
 class DatasetSplitter:
-    """Split dataset into train/val/test sets."""
+    """Split dataset into train/val/test sets.
+
+    By default each split is materialized as images/<split> and labels/<split> directories of
+    symlinks. With manifest=True nothing is linked or copied: each split becomes a list of image
+    paths plus an index of offsets into one packed label file, written sequentially.
+    """
+
+    PACK_FILE = 'labels.pack'
+    MANIFEST_FILE = 'split_manifest.json'
 
     def __init__(self, dataset_path: str, output_path: str = None):
         self.dataset_path = Path(dataset_path)
         self.output_path = Path(output_path) if output_path else self.dataset_path
 
     def split(self, train: float = 0.8, val: float = 0.1, test: float = 0.1,
-              stratify: bool = True, seed: int = 42) -> Dict:
+              stratify: bool = True, seed: int = 42, manifest: bool = False) -> Dict:
         """Split dataset with optional stratification."""
 
         if abs(train + val + test - 1.0) > 0.001:
@@ -915,16 +1156,94 @@ class DatasetSplitter:
             return {'error': 'No images found'}
 
         # Stratify if requested and we have class info
-        if stratify and detected_format in ['coco', 'yolo']:
-            splits = self._stratified_split(images, detected_format, train, val, test)
+        stratified = stratify and detected_format in ['coco', 'yolo']
+
+        # One pass over the annotations yields each image's primary class and, for
+        # manifests, its label bytes appended to the packed label file; a plain
+        # random split needs neither, so the scan is skipped
+        labels: Dict[Path, List[int]] = {}
+        if stratified or manifest:
+            pack = None
+            if manifest:
+                self.output_path.mkdir(parents=True, exist_ok=True)
+                pack = open(self.output_path / self.PACK_FILE, 'wb')
+            try:
+                labels = self._scan_annotations(images, detected_format, pack)
+            finally:
+                if pack is not None:
+                    pack.close()
+
+        if stratified:
+            splits = self._stratified_split(images, labels, train, val, test)
         else:
             splits = self._random_split(images, train, val, test)
 
+        if manifest:
+            return self._write_manifest(splits, labels, detected_format, seed, (train, val, test))
+
         # Create output directories and copy/link files
         results = self._create_split_directories(splits, detected_format)
 
         return results
 
+    @staticmethod
+    def _yolo_label_path(img: Path) -> Path:
+        label_path = img.with_suffix('.txt')
+        if not label_path.exists():
+            label_path = img.parent.parent / 'labels' / (img.stem + '.txt')
+        return label_path
+
+    def _scan_annotations(self, images: List[Path], format: str, pack=None) -> Dict[Path, List[int]]:
+        """Map each image to [primary class, label offset, label length] in one annotation scan.
+
+        The primary class is the first labelled class (-1 when unlabelled). Offsets point into
+        `pack` when given (-1 when the image has no label); without a pack they are left at -1.
+        """
+        labels = {img: [-1, -1, 0] for img in images}
+
+        if format == 'yolo':
+            for img in images:
+                label_path = self._yolo_label_path(img)
+                if not label_path.exists():
+                    continue
+                with open(label_path, 'rb') as f:
+                    content = f.read() if pack else f.readline()
+                first = content.split(b'\n', 1)[0].split()
+                if first:
+                    labels[img][0] = int(first[0])
+                if pack:
+                    labels[img][1:] = [pack.tell(), len(content)]
+                    pack.write(content)
+
+        elif format == 'coco':
+            by_name = {img.name: img for img in images}
+            for coco_file in self.dataset_path.rglob('*.json'):
+                reader = CocoStreamReader(coco_file, {'images', 'annotations'})
+                image_files = {}
+                spill = AnnotationSpill()
+                try:
+                    for key, item in reader:
+                        if key == 'images':
+                            image_files[item['id']] = Path(item['file_name']).name
+                        elif key == 'annotations':
+                            spill.add(item['image_id'], item)
+                    for group in spill.groups():
+                        for image_id, annotations in group.items():
+                            img = by_name.get(image_files.get(image_id))
+                            if img is None:
+                                continue
+                            labels[img][0] = annotations[0].get('category_id', -1)
+                            if pack:
+                                content = json.dumps(annotations, separators=(',', ':')).encode() + b'\n'
+                                labels[img][1:] = [pack.tell(), len(content)]
+                                pack.write(content)
+                except (ValueError, KeyError) as e:
+                    logger.warning(f"Skipping {coco_file}: {e}")
+                finally:
+                    spill.close()
+
+        return labels
+
     def _random_split(self, images: List[Path], train: float, val: float, test: float) -> Dict:
         """Perform random split."""
         images = list(images)
@@ -940,34 +1259,14 @@ class DatasetSplitter:
             'test': images[val_end:]
         }
 
-    def _stratified_split(self, images: List[Path], format: str,
+    def _stratified_split(self, images: List[Path], labels: Dict[Path, List[int]],
                          train: float, val: float, test: float) -> Dict:
         """Perform stratified split based on class distribution."""
 
         # Group images by their primary class
-        image_classes = {}
-
-        for img in images:
-            if format == 'yolo':
-                label_path = img.with_suffix('.txt')
-                if not label_path.exists():
-                    label_path = img.parent.parent / 'labels' / (img.stem + '.txt')
-
-                if label_path.exists():
-                    with open(label_path) as f:
-                        line = f.readline()
-                    if line:
-                        class_id = int(line.split()[0])
-                        image_classes[img] = class_id
-                else:
-                    image_classes[img] = -1  # No annotation
-            else:
-                image_classes[img] = -1  # Default for other formats
-
-        # Group by class
         class_images = defaultdict(list)
-        for img, class_id in image_classes.items():
-            class_images[class_id].append(img)
+        for img in images:
+            class_images[labels[img][0]].append(img)
 
         # Split each class proportionally
         splits = {'train': [], 'val': [], 'test': []}
@@ -988,6 +1287,67 @@ class DatasetSplitter:
 
         return splits
 
+    def _write_manifest(self, splits: Dict, labels: Dict[Path, List[int]], format: str,
+                        seed: int, ratios: Tuple[float, float, float]) -> Dict:
+        """Write <split>.list (image paths) and <split>.idx (path, offset, length, class) per split."""
+        results = {
+            'train_count': len(splits['train']),
+            'val_count': len(splits['val']),
+            'test_count': len(splits['test']),
+            'output_path': str(self.output_path),
+            'mode': 'manifest'
+        }
+        # .list/.idx rather than .txt so the files are never mistaken for YOLO labels
+        manifest = {
+            'format': format,
+            'dataset_path': str(self.dataset_path.absolute()),
+            'seed': seed,
+            'ratios': dict(zip(['train', 'val', 'test'], ratios)),
+            'labels': self.PACK_FILE,
+            'index_columns': ['path', 'label_offset', 'label_length', 'class'],
+            'splits': {}
+        }
+        for split_name in ['train', 'val', 'test']:
+            list_file = self.output_path / f'{split_name}.list'
+            index_file = self.output_path / f'{split_name}.idx'
+            with open(list_file, 'w') as paths, open(index_file, 'w') as index:
+                for img in splits[split_name]:
+                    path = str(img.absolute())
+                    class_id, offset, length = labels[img]
+                    paths.write(path + '\n')
+                    index.write(f"{path}\t{offset}\t{length}\t{class_id}\n")
+            manifest['splits'][split_name] = {
+                'count': len(splits[split_name]), 'paths': list_file.name, 'index': index_file.name
+            }
+
+        with open(self.output_path / self.MANIFEST_FILE, 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+        # YOLO trainers accept a file of image paths wherever a directory is expected
+        if format == 'yolo':
+            self._write_data_yaml('train.list', 'val.list', 'test.list')
+
+        return results
+
+    def _write_data_yaml(self, train_path: str, val_path: str, test_path: str):
+        # Read classes
+        classes_file = self.dataset_path / 'classes.txt'
+        class_names = []
+        if classes_file.exists():
+            with open(classes_file) as f:
+                class_names = [line.strip() for line in f.readlines()]
+
+        yaml_content = YOLO_DATA_YAML_TEMPLATE.format(
+            dataset_path=str(self.output_path.absolute()),
+            train_path=train_path,
+            val_path=val_path,
+            test_path=test_path,
+            num_classes=len(class_names),
+            class_names=class_names
+        )
+        with open(self.output_path / 'data.yaml', 'w') as f:
+            f.write(yaml_content)
+
     def _create_split_directories(self, splits: Dict, format: str) -> Dict:
         """Create split directories and organize files."""
         results = {
@@ -1016,9 +1376,7 @@ class DatasetSplitter:
 
                 # Handle label file
                 if format == 'yolo':
-                    label_path = img_path.with_suffix('.txt')
-                    if not label_path.exists():
-                        label_path = img_path.parent.parent / 'labels' / (img_path.stem + '.txt')
+                    label_path = self._yolo_label_path(img_path)
 
                     if label_path.exists():
                         dst_label = labels_dir / (img_path.stem + '.txt')
@@ -1030,23 +1388,7 @@ class DatasetSplitter:
 
         # Generate data.yaml for YOLO
         if format == 'yolo':
-            # Read classes
-            classes_file = self.dataset_path / 'classes.txt'
-            class_names = []
-            if classes_file.exists():
-                with open(classes_file) as f:
-                    class_names = [line.strip() for line in f.readlines()]
-
-            yaml_content = YOLO_DATA_YAML_TEMPLATE.format(
-                dataset_path=str(self.output_path.absolute()),
-                train_path='images/train',
-                val_path='images/val',
-                test_path='images/test',
-                num_classes=len(class_names),
-                class_names=class_names
-            )
-            with open(self.output_path / 'data.yaml', 'w') as f:
-                f.write(yaml_content)
+            self._write_data_yaml('images/train', 'images/val', 'images/test')
 
         return results
 
@@ -1253,6 +1595,185 @@ transform = A.Compose([
         }
 
 
+# ============================================================================
+# Image Inventory & Duplicate Detection
+# ============================================================================
+
+HASH_CHUNK_SIZE = 1 << 20
+INVENTORY_CACHE = Path('.pipeline_cache') / 'inventory.v1'
+SPLIT_NAMES = {'train', 'val', 'valid', 'validation', 'test'}
+
+
+def _dhash(img) -> int:
+    """64-bit difference hash: sign of horizontal gradients on a 9x8 grayscale thumbnail."""
+    pixels = img.convert('L').resize((9, 8), Image.BILINEAR).tobytes()
+    bits = 0
+    for row in range(8):
+        offset = row * 9
+        for col in range(8):
+            bits = (bits << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return bits
+
+
+_DCT_COS = [[math.cos((2 * x + 1) * u * math.pi / 64) for x in range(32)] for u in range(8)]
+
+
+def _phash(img) -> int:
+    """64-bit perceptual hash: low 8x8 DCT coefficients of a 32x32 thumbnail vs their median."""
+    pixels = img.convert('L').resize((32, 32), Image.BILINEAR).tobytes()
+    rows = [pixels[y * 32:(y + 1) * 32] for y in range(32)]
+    # Separable DCT-II, keeping only the 8 lowest frequencies in each direction
+    row_dct = [[sum(c * v for c, v in zip(_DCT_COS[u], row)) for u in range(8)] for row in rows]
+    coeffs = [sum(_DCT_COS[v][y] * row_dct[y][u] for y in range(32)) for v in range(8) for u in range(8)]
+    median = sorted(coeffs[1:])[31]  # skip the DC term, which only encodes brightness
+    bits = 0
+    for value in coeffs:
+        bits = (bits << 1) | (value > median)
+    return bits
+
+
+PERCEPTUAL_HASHES = {'dhash': _dhash, 'phash': _phash}
+
+
+def _inventory_task(task: Tuple[str, Optional[str], bool]) -> Tuple[str, Optional[str], Optional[int]]:
+    """Worker: chunked content digest and/or perceptual hash for one image."""
+    path, perceptual, need_digest = task
+    digest = None
+    phash = None
+    try:
+        if need_digest:
+            h = hashlib.blake2b(digest_size=16)
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                    h.update(chunk)
+            digest = h.hexdigest()
+        if perceptual:
+            with Image.open(path) as img:
+                img.draft('L', (64, 64))  # let JPEG decode at reduced scale
+                phash = PERCEPTUAL_HASHES[perceptual](img)
+    except Exception as e:
+        logger.debug(f"Could not hash {path}: {e}")
+    return path, digest, phash
+
+
+class ImageInventory:
+    """Content digests (and optional perceptual hashes) for every image, cached by path+mtime+size.
+
+    Only files that are new or changed since the last run are read; hashing is chunked and
+    spread over a process pool.
+    """
+
+    def __init__(self, dataset_path: Path, workers: int = 0, perceptual: Optional[str] = None,
+                 use_cache: bool = True):
+        self.dataset_path = dataset_path
+        self.workers = workers or os.cpu_count() or 1
+        self.perceptual = perceptual
+        self.cache_path = dataset_path / INVENTORY_CACHE if use_cache else None
+        self.stats = {'cached': 0, 'hashed': 0}
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        if self.cache_path is None or not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self, entries: Dict[str, Dict]):
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_path.with_suffix('.tmp')
+            with open(tmp, 'w') as f:
+                json.dump(entries, f, separators=(',', ':'))
+            os.replace(tmp, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write inventory cache: {e}")
+
+    def scan(self, images: List[Path]) -> Dict[str, Dict]:
+        """Return {relative path: {'digest', 'size', optional perceptual hash}} for `images`."""
+        cached = self._load_cache()
+        entries = {}
+        pending = []
+        for img in images:
+            rel = img.relative_to(self.dataset_path).as_posix()
+            try:
+                st = img.stat()
+            except OSError:
+                continue
+            entry = cached.get(rel)
+            if entry is None or entry['mtime_ns'] != st.st_mtime_ns or entry['size'] != st.st_size:
+                entry = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size}
+            entries[rel] = entry
+            need_digest = 'digest' not in entry
+            need_perceptual = self.perceptual if self.perceptual and self.perceptual not in entry else None
+            if need_digest or need_perceptual:
+                pending.append((str(img), need_perceptual, need_digest))
+            else:
+                self.stats['cached'] += 1
+
+        if pending:
+            if self.workers > 1 and len(pending) > 1:
+                with ProcessPoolExecutor(self.workers) as pool:
+                    results = list(pool.map(_inventory_task, pending,
+                                            chunksize=max(1, len(pending) // (self.workers * 8))))
+            else:
+                results = [_inventory_task(task) for task in pending]
+            for path, digest, phash in results:
+                entry = entries[Path(path).relative_to(self.dataset_path).as_posix()]
+                if digest is not None:
+                    entry['digest'] = digest
+                if phash is not None:
+                    entry[self.perceptual] = phash
+            self.stats['hashed'] = len(pending)
+
+        if self.cache_path is not None and (pending or len(entries) != len(cached)):
+            self._save_cache(entries)
+        return entries
+
+
+class BKTree:
+    """Burkhard-Keller tree over 64-bit hashes for Hamming-radius queries."""
+
+    def __init__(self):
+        self.root = None  # [hash, payload, {distance: child}]
+
+    def add(self, value: int, payload: Any):
+        if self.root is None:
+            self.root = [value, payload, {}]
+            return
+        node = self.root
+        while True:
+            d = bin(node[0] ^ value).count('1')
+            child = node[2].get(d)
+            if child is None:
+                node[2][d] = [value, payload, {}]
+                return
+            node = child
+
+    def query(self, value: int, radius: int) -> List[Tuple[int, Any]]:
+        """All (distance, payload) within `radius` of `value`."""
+        matches = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            d = bin(node[0] ^ value).count('1')
+            if d <= radius:
+                matches.append((d, node[1]))
+            for dist, child in node[2].items():
+                if d - radius <= dist <= d + radius:
+                    stack.append(child)
+        return matches
+
+
+def _split_of(rel_path: str) -> Optional[str]:
+    """Dataset split a relative path belongs to, from its directory names."""
+    for part in rel_path.split('/')[:-1]:
+        if part.lower() in SPLIT_NAMES:
+            return part.lower()
+    return None
+
+
 # ============================================================================
 # Dataset Validation
 # ============================================================================
@@ -1260,9 +1781,15 @@ transform = A.Compose([
 class DatasetValidator:
     """Validate dataset integrity and quality."""
 
-    def __init__(self, dataset_path: str, format: str = None):
+    def __init__(self, dataset_path: str, format: str = None, workers: int = 0,
+                 near_duplicates: Optional[str] = None, max_distance: int = 5, use_cache: bool = True):
         self.dataset_path = Path(dataset_path)
         self.format = format
+        self.workers = workers
+        self.near_duplicates = near_duplicates
+        self.max_distance = max_distance
+        self.use_cache = use_cache
+        self._images = None
 
     def validate(self) -> Dict:
         """Run all validation checks."""
@@ -1455,11 +1982,20 @@ class DatasetValidator:
 
         results['stats']['voc_annotations'] = valid_annotations
 
+    def _find_images(self) -> List[Path]:
+        """Images in the dataset, from one directory walk shared by all checks."""
+        if self._images is None:
+            self._images = [
+                Path(root) / name
+                for root, dirs, files in os.walk(self.dataset_path)
+                for name in files
+                if os.path.splitext(name)[1] in SUPPORTED_IMAGE_EXTENSIONS
+            ]
+        return self._images
+
     def _validate_images(self, results: Dict):
         """Check for image file issues."""
-        images = []
-        for ext in SUPPORTED_IMAGE_EXTENSIONS:
-            images.extend(self.dataset_path.rglob(f'*{ext}'))
+        images = self._find_images()
 
         results['stats']['total_images'] = len(images)
 
@@ -1474,29 +2010,69 @@ class DatasetValidator:
             results['warnings'].append(f"Found {len(small_images)} very small images (<1KB)")
 
     def _check_duplicates(self, results: Dict):
-        """Check for duplicate images by hash."""
-        images = []
-        for ext in SUPPORTED_IMAGE_EXTENSIONS:
-            images.extend(self.dataset_path.rglob(f'*{ext}'))
-
-        hashes = {}
-        duplicates = []
-
-        for img in images:
-            try:
-                with open(img, 'rb') as f:
-                    file_hash = hashlib.md5(f.read()).hexdigest()
-
-                if file_hash in hashes:
-                    duplicates.append((img, hashes[file_hash]))
-                else:
-                    hashes[file_hash] = img
-            except:
-                pass
-
+        """Check for byte-identical images and, optionally, perceptual near-duplicates."""
+        perceptual = self.near_duplicates
+        if perceptual and not HAS_PIL:
+            results['warnings'].append("Near-duplicate detection requires Pillow: pip install Pillow")
+            perceptual = None
+
+        inventory = ImageInventory(self.dataset_path, self.workers, perceptual, self.use_cache)
+        entries = inventory.scan(self._find_images())
+        results['stats']['inventory_cached'] = inventory.stats['cached']
+        results['stats']['inventory_hashed'] = inventory.stats['hashed']
+
+        by_digest = defaultdict(list)
+        for rel, entry in entries.items():
+            if 'digest' in entry:
+                by_digest[entry['digest']].append(rel)
+        exact_groups = [sorted(paths) for paths in by_digest.values() if len(paths) > 1]
+        duplicates = sum(len(group) - 1 for group in exact_groups)
         if duplicates:
-            results['warnings'].append(f"Found {len(duplicates)} duplicate images")
-            results['stats']['duplicate_images'] = len(duplicates)
+            results['warnings'].append(f"Found {duplicates} duplicate images")
+            results['stats']['duplicate_images'] = duplicates
+            results['duplicate_groups'] = exact_groups[:100]
+
+        if perceptual:
+            self._check_near_duplicates(results, entries, by_digest, perceptual)
+
+    def _check_near_duplicates(self, results: Dict, entries: Dict[str, Dict],
+                               by_digest: Dict[str, List[str]], perceptual: str):
+        """Group visually similar images (resized/re-encoded copies) via a BK-tree over perceptual hashes."""
+        tree = BKTree()
+        pairs = []
+        # One representative per distinct content digest; exact copies are reported above
+        for digest in sorted(by_digest):
+            rel = min(by_digest[digest])
+            value = entries[rel].get(perceptual)
+            if value is None:
+                continue
+            for distance, other in tree.query(value, self.max_distance):
+                pairs.append((other, rel, distance))
+            tree.add(value, rel)
+
+        # Exact copies in different splits leak just as much as near-duplicates
+        cross_split = [
+            (a, b, 0) for paths in by_digest.values() if len(paths) > 1
+            for a, b in zip(paths, paths[1:]) if _split_of(a) != _split_of(b)
+        ]
+        cross_split += [(a, b, d) for a, b, d in pairs if _split_of(a) != _split_of(b)]
+
+        results['stats']['near_duplicate_pairs'] = len(pairs)
+        results['stats']['cross_split_duplicates'] = len(cross_split)
+        if pairs:
+            results['warnings'].append(
+                f"Found {len(pairs)} near-duplicate image pairs ({perceptual}, distance <= {self.max_distance})"
+            )
+            results['near_duplicates'] = [
+                {'a': a, 'b': b, 'distance': d} for a, b, d in sorted(pairs, key=lambda p: p[2])[:100]
+            ]
+        if cross_split:
+            results['warnings'].append(
+                f"Found {len(cross_split)} duplicate or near-duplicate pairs across splits (data leakage)"
+            )
+            results['cross_split_duplicates'] = [
+                {'a': a, 'b': b, 'distance': d} for a, b, d in cross_split[:100]
+            ]
 
 
 # ============================================================================
@@ -1518,11 +2094,17 @@ Examples:
   Split dataset:
     python dataset_pipeline_builder.py split --input /path/to/dataset --train 0.8 --val 0.1 --test 0.1
 
+  Split into index files only (no links or copies):
+    python dataset_pipeline_builder.py split --input /path/to/dataset --output /path/to/splits --manifest --stratify
+
   Generate augmentation config:
     python dataset_pipeline_builder.py augment-config --task detection --intensity heavy
 
   Validate dataset:
     python dataset_pipeline_builder.py validate --input /path/to/dataset --format coco
+
+  Find resized duplicates leaking across splits:
+    python dataset_pipeline_builder.py validate --input /path/to/dataset --near-duplicates phash -j 8
         """
     )
 
@@ -1543,6 +2125,10 @@ Examples:
     convert_parser.add_argument('--source-format', '-s',
                                choices=['yolo', 'coco', 'voc'],
                                help='Source format (auto-detected if not specified)')
+    convert_parser.add_argument('--workers', '-j', type=int, default=0,
+                               help='Label-writer threads (default: CPU count + 4, max 32)')
+    convert_parser.add_argument('--max-in-memory', type=int, default=2_000_000,
+                               help='Annotations held in memory before spilling to temp files (COCO input)')
 
     # Split command
     split_parser = subparsers.add_parser('split', help='Split dataset into train/val/test')
@@ -1553,6 +2139,8 @@ Examples:
     split_parser.add_argument('--test', type=float, default=0.1, help='Test split ratio')
     split_parser.add_argument('--stratify', action='store_true', help='Stratify by class')
     split_parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    split_parser.add_argument('--manifest', action='store_true',
+                             help='Write split index files and one packed label file instead of linking files')
 
     # Augmentation config command
     aug_parser = subparsers.add_parser('augment-config', help='Generate augmentation configuration')
@@ -1573,6 +2161,14 @@ Examples:
     validate_parser.add_argument('--format', '-f',
                                 choices=['yolo', 'coco', 'voc'],
                                 help='Dataset format (auto-detected if not specified)')
+    validate_parser.add_argument('--near-duplicates', choices=['dhash', 'phash'],
+                                help='Also find resized/re-encoded duplicates by perceptual hash (needs Pillow)')
+    validate_parser.add_argument('--max-distance', type=int, default=5,
+                                help='Max Hamming distance for near-duplicates (default: 5 of 64 bits)')
+    validate_parser.add_argument('--workers', '-j', type=int, default=0,
+                                help='Hashing processes (default: CPU count)')
+    validate_parser.add_argument('--no-cache', action='store_true',
+                                help='Ignore and do not write the .pipeline_cache inventory')
     validate_parser.add_argument('--json', action='store_true', help='Output as JSON')
 
     args = parser.parse_args()
@@ -1624,7 +2220,8 @@ Examples:
                             print(f"  → {r}")
 
         elif args.command == 'convert':
-            converter = FormatConverter(args.input, args.output)
+            converter = FormatConverter(args.input, args.output, workers=args.workers,
+                                        max_in_memory=args.max_in_memory)
             results = converter.convert(args.format, args.source_format)
             print(json.dumps(results, indent=2))
 
@@ -1636,7 +2233,8 @@ Examples:
                 val=args.val,
                 test=args.test,
                 stratify=args.stratify,
-                seed=args.seed
+                seed=args.seed,
+                manifest=args.manifest
             )
             print(json.dumps(results, indent=2))
 
@@ -1657,7 +2255,9 @@ Examples:
                 print(output)
 
         elif args.command == 'validate':
-            validator = DatasetValidator(args.input, args.format)
+            validator = DatasetValidator(args.input, args.format, workers=args.workers,
+                                         near_duplicates=args.near_duplicates,
+                                         max_distance=args.max_distance, use_cache=not args.no_cache)
             results = validator.validate()
 
             if args.json:
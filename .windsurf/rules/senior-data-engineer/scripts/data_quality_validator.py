@@ -6,16 +6,24 @@ Comprehensive data quality validation tool for data engineering workflows.
 Features:
 - Schema validation (types, nullability, constraints)
 - Data profiling (statistics, distributions, patterns)
+- Streaming single-pass profiling for files larger than RAM
 - Great Expectations suite generation
 - Data contract validation
 - Anomaly detection
+- Exact duplicate detection over 64-bit row fingerprints, spilling to disk when large
+- Parallel per-column profiling and schema validation (--workers)
+- Incremental validate/contract runs on append-only files against a stored baseline
+- Optional columnar NumPy backend for anomaly detection and numeric profiling
 - Quality scoring and reporting
 
 Usage:
     python data_quality_validator.py validate data.csv --schema schema.json
+    python data_quality_validator.py validate wide.csv --schema schema.json --workers 8
     python data_quality_validator.py profile data.csv --output profile.json
+    python data_quality_validator.py profile huge.csv --streaming --chunk-size 100000
     python data_quality_validator.py generate-suite data.csv --output expectations.json
     python data_quality_validator.py contract data.csv --contract contract.yaml
+    python data_quality_validator.py validate events.csv --schema schema.json --baseline-dir .dq_baselines
 """
 
 import os
@@ -25,13 +33,28 @@ import csv
 import re
 import argparse
 import logging
+import base64
+import hashlib
+import io
+import math
+import random
+import shutil
 import statistics
+import tempfile
+import multiprocessing
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple, Set
+from typing import Dict, List, Optional, Any, Tuple, Set, Iterator
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from collections import Counter
 from abc import ABC, abstractmethod
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 logging.basicConfig(
     level=logging.INFO,
@@ -121,6 +144,8 @@ class DataProfile:
     duplicate_rows: int
     memory_size_bytes: int
     profile_timestamp: str
+    # Error bound (+/- rows) when duplicate_rows is a sketch estimate; 0 when exact
+    duplicate_rows_error: int = 0
 
 
 @dataclass
@@ -210,6 +235,58 @@ class TypeDetector:
         return None
 
 
+# =============================================================================
+# Columnar Backend
+# =============================================================================
+
+def _parse_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return math.nan
+
+
+class NumericColumn:
+    """A column parsed once into a float64 array with a null mask (requires NumPy).
+
+    `valid` marks the non-null, finite values; `numbers` is that subset in row order,
+    i.e. the same list the pure-Python paths build with a float() loop.
+    """
+
+    def __init__(self, raw: List[Any]):
+        self.null_mask = np.fromiter((v is None or v == '' for v in raw), dtype=bool, count=len(raw))
+        filled = ['nan' if null else v for v, null in zip(raw, self.null_mask)]
+        try:
+            # NumPy parses numeric strings in C; fall back per value on the first bad one
+            self.values = np.array(filled, dtype=np.float64)
+        except (ValueError, TypeError):
+            self.values = np.fromiter((_parse_float(v) for v in filled), dtype=np.float64, count=len(filled))
+        self.valid = ~self.null_mask & np.isfinite(self.values)
+        self.numbers = self.values[self.valid]
+
+    @staticmethod
+    def looks_numeric(raw: List[Any], sample_size: int = 100) -> bool:
+        """Whether the first `sample_size` non-null values all parse as numbers"""
+        head = []
+        for v in raw:
+            if v is not None and v != '':
+                head.append(v)
+                if len(head) == sample_size:
+                    break
+        try:
+            [float(v) for v in head]
+            return True
+        except (ValueError, TypeError):
+            return False
+
+    def quartiles(self) -> Tuple[float, float]:
+        """Values at sorted positions n//4 and 3n//4, via partial sort"""
+        n = len(self.numbers)
+        q1_idx, q3_idx = n // 4, (3 * n) // 4
+        part = np.partition(self.numbers, [q1_idx, q3_idx])
+        return float(part[q1_idx]), float(part[q3_idx])
+
+
 # =============================================================================
 # Validators
 # =============================================================================
@@ -225,6 +302,9 @@ class BaseValidator(ABC):
 class SchemaValidator(BaseValidator):
     """Validate data against a schema"""
 
+    def __init__(self, workers: int = 1):
+        self.workers = workers
+
     def validate(self, data: List[Dict], schema: DataSchema) -> List[ValidationResult]:
         results = []
 
@@ -240,8 +320,27 @@ class SchemaValidator(BaseValidator):
             ))
             return results
 
-        # Validate row count
-        row_count = len(data)
+        results.extend(self._validate_row_count(len(data), schema))
+        results.extend(self._validate_rows(data, schema))
+        return results
+
+    def validate_appended(self, rows: List[Dict], schema: DataSchema, total_rows: int,
+                          start_row: int) -> List[ValidationResult]:
+        """Validate only rows appended after `start_row`.
+
+        Row-count bounds apply to the whole dataset; failed_rows are absolute row
+        numbers. Primary-key uniqueness is checked among the appended rows only.
+        """
+        results = self._validate_row_count(total_rows, schema)
+        if rows:
+            appended = self._validate_rows(rows, schema)
+            for r in appended:
+                r.failed_rows = [i + start_row for i in r.failed_rows]
+            results.extend(appended)
+        return results
+
+    def _validate_row_count(self, row_count: int, schema: DataSchema) -> List[ValidationResult]:
+        results = []
         if schema.row_count_min and row_count < schema.row_count_min:
             results.append(ValidationResult(
                 check_name="row_count_min",
@@ -263,11 +362,18 @@ class SchemaValidator(BaseValidator):
                 severity="warning",
                 message=f"Row count {row_count} exceeds maximum {schema.row_count_max}"
             ))
+        return results
+
+    def _validate_rows(self, data: List[Dict], schema: DataSchema) -> List[ValidationResult]:
+        results = []
 
         # Validate each column
-        for col_schema in schema.columns:
-            col_results = self._validate_column(data, col_schema)
-            results.extend(col_results)
+        if self.workers > 1 and len(schema.columns) > 1:
+            results.extend(self._validate_columns_parallel(data, schema.columns))
+        else:
+            for col_schema in schema.columns:
+                col_results = self._validate_column(data, col_schema)
+                results.extend(col_results)
 
         # Validate primary key uniqueness
         if schema.primary_key:
@@ -276,6 +382,15 @@ class SchemaValidator(BaseValidator):
 
         return results
 
+    def _validate_columns_parallel(self, data: List[Dict], col_schemas: List[ColumnSchema]) -> List[ValidationResult]:
+        """Validate column groups in a process pool, keeping schema column order"""
+        pool, shared = _column_pool(data, self.workers)
+        with pool:
+            futures = _submit_column_groups(pool, shared, _validate_column_group, data,
+                                            _split_groups(col_schemas, self.workers), lambda cs: cs.name, None)
+            by_name = dict(pair for f in futures for pair in f.result())
+        return [r for cs in col_schemas for r in by_name[cs.name]]
+
     def _validate_column(self, data: List[Dict], col_schema: ColumnSchema) -> List[ValidationResult]:
         results = []
         col_name = col_schema.name
@@ -502,9 +617,11 @@ class SchemaValidator(BaseValidator):
 class AnomalyDetector(BaseValidator):
     """Detect anomalies in data"""
 
-    def __init__(self, z_threshold: float = 3.0, iqr_multiplier: float = 1.5):
+    def __init__(self, z_threshold: float = 3.0, iqr_multiplier: float = 1.5,
+                 use_numpy: Optional[bool] = None):
         self.z_threshold = z_threshold
         self.iqr_multiplier = iqr_multiplier
+        self.use_numpy = HAS_NUMPY if use_numpy is None else use_numpy
 
     def validate(self, data: List[Dict], schema: Optional[DataSchema] = None) -> List[ValidationResult]:
         results = []
@@ -512,6 +629,13 @@ class AnomalyDetector(BaseValidator):
         if not data:
             return results
 
+        if self.use_numpy:
+            for col in data[0].keys():
+                raw = [row.get(col) for row in data]
+                if NumericColumn.looks_numeric(raw):
+                    results.extend(self._detect_numeric_anomalies_columnar(NumericColumn(raw), col))
+            return results
+
         # Get numeric columns
         numeric_columns = []
         for col in data[0].keys():
@@ -594,6 +718,175 @@ class AnomalyDetector(BaseValidator):
 
         return results
 
+    def _detect_numeric_anomalies_columnar(self, column: 'NumericColumn', name: str) -> List[ValidationResult]:
+        """Vectorized z-score and IQR checks; same results as _detect_numeric_anomalies"""
+        results = []
+        values = column.numbers
+
+        if len(values) < 10:
+            return results
+
+        # Z-score method
+        mean = values.mean()
+        std = values.std(ddof=1)
+
+        if std > 0:
+            z_outliers = np.flatnonzero(np.abs((values - mean) / std) > self.z_threshold)
+            if len(z_outliers):
+                results.append(ValidationResult(
+                    check_name="z_score_outlier",
+                    column=name,
+                    passed=False,
+                    expected=f"z-score <= {self.z_threshold}",
+                    actual=f"{len(z_outliers)} outliers",
+                    severity="warning",
+                    message=f"Column '{name}' has {len(z_outliers)} statistical outliers (z-score method)",
+                    failed_rows=z_outliers[:100].tolist()
+                ))
+
+        # IQR method
+        q1, q3 = column.quartiles()
+        iqr = q3 - q1
+
+        lower_bound = q1 - self.iqr_multiplier * iqr
+        upper_bound = q3 + self.iqr_multiplier * iqr
+
+        iqr_outliers = np.flatnonzero((values < lower_bound) | (values > upper_bound))
+
+        if len(iqr_outliers):
+            results.append(ValidationResult(
+                check_name="iqr_outlier",
+                column=name,
+                passed=False,
+                expected=f"value in [{lower_bound:.2f}, {upper_bound:.2f}]",
+                actual=f"{len(iqr_outliers)} outliers",
+                severity="warning",
+                message=f"Column '{name}' has {len(iqr_outliers)} outliers (IQR method)",
+                failed_rows=iqr_outliers[:100].tolist()
+            ))
+
+        return results
+
+
+# =============================================================================
+# Duplicate Detection & Parallel Execution
+# =============================================================================
+
+def _hash64(text: str) -> int:
+    """Stable 64-bit hash (unlike hash(), identical across processes and runs)"""
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def _row_fingerprint(row: Dict) -> int:
+    """64-bit fingerprint of a row, independent of key order"""
+    return _hash64('\x1f'.join(f"{k}\x1e{row[k]!r}" for k in sorted(row)))
+
+
+class DuplicateCounter:
+    """Exact duplicate count over 64-bit row fingerprints.
+
+    Fingerprints live in a set of ints rather than row tuples. Past `spill_threshold`
+    distinct fingerprints the set is flushed to `partitions` temp files keyed by the
+    top bits, and count() deduplicates one partition at a time, so memory is bounded
+    by partition size rather than row count.
+    """
+
+    def __init__(self, spill_threshold: Optional[int] = 5_000_000, partitions: int = 64):
+        self.spill_threshold = spill_threshold
+        self.partitions = partitions
+        self.seen: Set[int] = set()
+        self.duplicates = 0
+        self._spill_dir: Optional[str] = None
+
+    def add(self, fingerprint: int):
+        if fingerprint in self.seen:
+            self.duplicates += 1
+            return
+        self.seen.add(fingerprint)
+        if self.spill_threshold and len(self.seen) >= self.spill_threshold:
+            self._spill()
+
+    def _spill(self):
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix='dq_fingerprints_')
+            logger.debug(f"Spilling row fingerprints to {self._spill_dir}")
+        shift = 64 - (self.partitions.bit_length() - 1)
+        buckets = [array('Q') for _ in range(self.partitions)]
+        for fp in self.seen:
+            buckets[fp >> shift].append(fp)
+        for i, bucket in enumerate(buckets):
+            with open(os.path.join(self._spill_dir, f"{i}.bin"), 'ab') as f:
+                bucket.tofile(f)
+        self.seen = set()
+
+    def count(self) -> int:
+        """Total duplicate rows; consumes any spilled partitions"""
+        if self._spill_dir is None:
+            return self.duplicates
+        self._spill()
+        # Each flush was already distinct, so repeats within a partition span flushes
+        try:
+            for i in range(self.partitions):
+                fps = array('Q')
+                with open(os.path.join(self._spill_dir, f"{i}.bin"), 'rb') as f:
+                    fps.frombytes(f.read())
+                self.duplicates += len(fps) - len(set(fps))
+        finally:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+        return self.duplicates
+
+
+# Rows handed to forked workers copy-on-write instead of being pickled per task
+_WORKER_ROWS: List[Dict] = []
+
+
+def _column_group_task(task: Tuple) -> List:
+    func, rows, group, option = task
+    return func(_WORKER_ROWS if rows is None else rows, group, option)
+
+
+def _column_pool(data: List[Dict], workers: int) -> Tuple[ProcessPoolExecutor, bool]:
+    """Process pool for column groups; rows are shared via fork when the platform has it"""
+    global _WORKER_ROWS
+    if 'fork' in multiprocessing.get_all_start_methods():
+        _WORKER_ROWS = data
+        return ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('fork')), True
+    return ProcessPoolExecutor(workers), False
+
+
+def _submit_column_groups(pool: ProcessPoolExecutor, shared: bool, func, data: List[Dict],
+                          groups: List[List[Any]], column_of, option) -> List:
+    """Submit func(rows, group, option) per column group.
+
+    With fork the workers read the shared rows; otherwise each task is sent only
+    the columns its group touches.
+    """
+    futures = []
+    for group in groups:
+        rows = None
+        if not shared:
+            names = [column_of(item) for item in group]
+            rows = [{c: row.get(c) for c in names} for row in data]
+        futures.append(pool.submit(_column_group_task, (func, rows, group, option)))
+    return futures
+
+
+def _split_groups(items: List[Any], workers: int) -> List[List[Any]]:
+    """Round-robin column groups so wide and narrow columns spread across workers"""
+    return [items[i::workers] for i in range(min(workers, len(items)))]
+
+
+def _profile_column_group(rows: List[Dict], columns: List[str], use_numpy: bool) -> List[ColumnProfile]:
+    profiler = DataProfiler(use_numpy=use_numpy)
+    return [profiler._profile_column(rows, col) for col in columns]
+
+
+def _validate_column_group(rows: List[Dict], col_schemas: List[ColumnSchema],
+                           _option: Any) -> List[Tuple[str, List[ValidationResult]]]:
+    validator = SchemaValidator()
+    return [(cs.name, validator._validate_column(rows, cs)) for cs in col_schemas]
+
 
 # =============================================================================
 # Data Profiler
@@ -602,6 +895,13 @@ class AnomalyDetector(BaseValidator):
 class DataProfiler:
     """Generate statistical profiles of datasets"""
 
+    # Rows sampled for the memory estimate; sizing every value dominated profiling time
+    MEMORY_SAMPLE_ROWS = 1000
+
+    def __init__(self, use_numpy: Optional[bool] = None, workers: int = 1):
+        self.use_numpy = HAS_NUMPY if use_numpy is None else use_numpy
+        self.workers = workers
+
     def profile(self, data: List[Dict], name: str = "dataset") -> DataProfile:
         """Generate a complete profile of the dataset"""
         if not data:
@@ -616,21 +916,25 @@ class DataProfiler:
             )
 
         columns = list(data[0].keys())
-        column_profiles = []
-
-        for col in columns:
-            profile = self._profile_column(data, col)
-            column_profiles.append(profile)
 
-        # Count duplicates
-        row_tuples = [tuple(sorted(row.items())) for row in data]
-        duplicate_count = len(row_tuples) - len(set(row_tuples))
+        if self.workers > 1 and len(columns) > 1:
+            # Workers profile column groups while this process counts duplicates
+            pool, shared = _column_pool(data, self.workers)
+            with pool:
+                futures = _submit_column_groups(pool, shared, _profile_column_group, data,
+                                                _split_groups(columns, self.workers), str, self.use_numpy)
+                duplicate_count = self._count_duplicates(data)
+                by_name = {p.name: p for f in futures for p in f.result()}
+            column_profiles = [by_name[col] for col in columns]
+        else:
+            column_profiles = [self._profile_column(data, col) for col in columns]
+            duplicate_count = self._count_duplicates(data)
 
-        # Estimate memory size
-        memory_size = sys.getsizeof(data) + sum(
-            sys.getsizeof(row) + sum(sys.getsizeof(v) for v in row.values())
-            for row in data
-        )
+        # Estimate memory size from an evenly spaced sample of rows
+        step = max(1, len(data) // self.MEMORY_SAMPLE_ROWS)
+        sample = data[::step]
+        sample_size = sum(sys.getsizeof(row) + sum(sys.getsizeof(v) for v in row.values()) for row in sample)
+        memory_size = sys.getsizeof(data) + int(sample_size * len(data) / len(sample))
 
         return DataProfile(
             name=name,
@@ -642,6 +946,13 @@ class DataProfiler:
             profile_timestamp=datetime.now().isoformat()
         )
 
+    @staticmethod
+    def _count_duplicates(data: List[Dict]) -> int:
+        counter = DuplicateCounter()
+        for row in data:
+            counter.add(_row_fingerprint(row))
+        return counter.count()
+
     def _profile_column(self, data: List[Dict], column: str) -> ColumnProfile:
         """Generate profile for a single column"""
         values = [row.get(column) for row in data]
@@ -677,7 +988,9 @@ class DataProfiler:
         )
 
         # Add numeric stats if applicable
-        if detected_type in ('integer', 'float'):
+        if detected_type in ('integer', 'float') and self.use_numpy:
+            self._add_numeric_stats_columnar(profile, NumericColumn(values))
+        elif detected_type in ('integer', 'float'):
             numeric_values = []
             for v in non_null:
                 try:
@@ -706,6 +1019,701 @@ class DataProfiler:
 
         return profile
 
+    def _add_numeric_stats_columnar(self, profile: ColumnProfile, column: NumericColumn):
+        """Min/max/mean/std and percentiles as vectorized reductions"""
+        numbers = column.numbers
+        if not len(numbers):
+            return
+        n = len(numbers)
+        mid = [n // 2] if n % 2 else [n // 2 - 1, n // 2]
+        part = np.partition(numbers, sorted({n // 4, (3 * n) // 4, *mid}))
+        profile.min_value = float(numbers.min())
+        profile.max_value = float(numbers.max())
+        profile.mean = float(numbers.mean())
+        profile.median = float(part[mid].mean())
+        if n > 1:
+            profile.std_dev = float(numbers.std(ddof=1))
+        profile.percentile_25 = float(part[n // 4])
+        profile.percentile_75 = float(part[(3 * n) // 4])
+
+
+# =============================================================================
+# Streaming Profiler
+# =============================================================================
+
+class HyperLogLog:
+    """HyperLogLog distinct-count sketch; exact until SPARSE_LIMIT distinct values are seen"""
+
+    SPARSE_LIMIT = 2048
+
+    def __init__(self, precision: int = 14):
+        self.precision = precision
+        self.exact: Optional[Set[int]] = set()
+        self.registers: Optional[bytearray] = None
+
+    def add(self, text: str):
+        self.add_hash(_hash64(text))
+
+    def add_hash(self, h: int):
+        if self.exact is not None:
+            self.exact.add(h)
+            if len(self.exact) > self.SPARSE_LIMIT:
+                self._densify()
+            return
+        rest_bits = 64 - self.precision
+        rest = h & ((1 << rest_bits) - 1)
+        rank = rest_bits - rest.bit_length() + 1
+        index = h >> rest_bits
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def _densify(self):
+        hashes, self.exact = self.exact, None
+        self.registers = bytearray(1 << self.precision)
+        for h in hashes:
+            self.add_hash(h)
+
+    def merge(self, other: 'HyperLogLog'):
+        if self.exact is not None and other.exact is not None:
+            self.exact |= other.exact
+            if len(self.exact) > self.SPARSE_LIMIT:
+                self._densify()
+            return
+        if self.exact is not None:
+            self._densify()
+        if other.exact is not None:
+            for h in other.exact:
+                self.add_hash(h)
+        else:
+            self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def count(self) -> int:
+        if self.exact is not None:
+            return len(self.exact)
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Small-range correction (linear counting)
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+    def to_dict(self) -> Dict:
+        if self.exact is not None:
+            packed = b''.join(h.to_bytes(8, 'big') for h in sorted(self.exact))
+            return {'precision': self.precision, 'exact': base64.b64encode(packed).decode('ascii')}
+        return {'precision': self.precision, 'registers': base64.b64encode(bytes(self.registers)).decode('ascii')}
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> 'HyperLogLog':
+        hll = cls(d['precision'])
+        if 'exact' in d:
+            packed = base64.b64decode(d['exact'])
+            hll.exact = {int.from_bytes(packed[i:i + 8], 'big') for i in range(0, len(packed), 8)}
+        else:
+            hll.exact = None
+            hll.registers = bytearray(base64.b64decode(d['registers']))
+        return hll
+
+
+class ReservoirSample:
+    """Uniform fixed-size sample of a stream (Algorithm L: draws random numbers only on replacement)"""
+
+    def __init__(self, size: int = 1000, seed: int = 0):
+        self.size = size
+        self.seed = seed
+        self.items: List[str] = []
+        self.seen = 0
+        self.rng = random.Random(seed)
+        self._w = 1.0
+        self._next = size
+
+    def _skip(self):
+        self._w *= math.exp(math.log(self.rng.random() or 1e-300) / self.size)
+        self._next += int(math.log(self.rng.random() or 1e-300) / math.log1p(-self._w)) + 1
+
+    def add(self, item: str):
+        self.seen += 1
+        if len(self.items) < self.size:
+            self.items.append(item)
+            if self.seen == self.size:
+                self._skip()
+        elif self.seen == self._next:
+            self.items[self.rng.randrange(self.size)] = item
+            self._skip()
+
+    def merge(self, other: 'ReservoirSample'):
+        total = self.seen + other.seen
+        if len(self.items) + len(other.items) <= self.size:
+            self.items = self.items + other.items
+        elif total:
+            # Draw from each side in proportion to how much of the stream it saw
+            take = min(len(self.items), round(self.size * self.seen / total))
+            take = max(take, self.size - len(other.items))
+            self.items = (self.rng.sample(self.items, take) +
+                          self.rng.sample(other.items, min(self.size - take, len(other.items))))
+        self.seen = total
+        self._w, self._next = 1.0, max(total, self.size)
+        if len(self.items) == self.size:
+            self._skip()
+
+    def to_dict(self) -> Dict:
+        return {'size': self.size, 'seed': self.seed, 'seen': self.seen, 'items': self.items,
+                'w': self._w, 'next': self._next}
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> 'ReservoirSample':
+        sample = cls(d['size'], d['seed'])
+        sample.items, sample.seen = d['items'], d['seen']
+        sample._w, sample._next = d['w'], d['next']
+        # Re-seed past the restored position rather than persisting generator state
+        sample.rng = random.Random(d['seed'] + d['seen'])
+        return sample
+
+
+class QuantileSketch:
+    """KLL-style mergeable quantile sketch; exact until `k` values have been added"""
+
+    def __init__(self, k: int = 400, seed: int = 0):
+        self.k = k
+        self.seed = seed
+        self.levels: List[List[float]] = [[]]
+        self.count = 0
+        self.rng = random.Random(seed)
+        self._base_capacity = k
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(8, int(self.k * (2 / 3) ** depth))
+
+    def add(self, value: float):
+        base = self.levels[0]
+        base.append(value)
+        self.count += 1
+        if len(base) >= self._base_capacity:
+            self._compress()
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) >= self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append([])
+                items.sort()
+                # An odd item out stays behind so total weight is preserved exactly
+                keep = [items.pop()] if len(items) % 2 else []
+                self.levels[level + 1].extend(items[self.rng.randrange(2)::2])
+                self.levels[level] = keep
+            level += 1
+        self._base_capacity = self._capacity(0)
+
+    def merge(self, other: 'QuantileSketch'):
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        for level, items in enumerate(other.levels):
+            self.levels[level].extend(items)
+        self.count += other.count
+        self._compress()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Value at rank floor(q * n) of the weighted sample (exact while uncompressed)"""
+        weighted = sorted((v, 1 << level) for level, items in enumerate(self.levels) for v in items)
+        if not weighted:
+            return None
+        total = sum(w for _, w in weighted)
+        target = min(int(q * total), total - 1)
+        seen = 0
+        for value, weight in weighted:
+            seen += weight
+            if seen > target:
+                return value
+        return weighted[-1][0]
+
+    def to_dict(self) -> Dict:
+        return {'k': self.k, 'seed': self.seed, 'count': self.count, 'levels': self.levels}
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> 'QuantileSketch':
+        sketch = cls(d['k'], d['seed'])
+        sketch.levels, sketch.count = d['levels'], d['count']
+        sketch.rng = random.Random(d['seed'] + d['count'])
+        sketch._base_capacity = sketch._capacity(0)
+        return sketch
+
+
+class FrequentValues:
+    """Misra-Gries heavy hitters; counts are exact unless more than `capacity` distinct values appear"""
+
+    def __init__(self, capacity: int = 1024):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+
+    def add(self, item: str):
+        counts = self.counts
+        if item in counts:
+            counts[item] += 1
+        elif len(counts) < self.capacity:
+            counts[item] = 1
+        else:
+            # Decrement everything; each round frees slots, so the cost amortizes to O(1)
+            self.counts = {k: c - 1 for k, c in counts.items() if c > 1}
+
+    def merge(self, other: 'FrequentValues'):
+        for item, count in other.counts.items():
+            self.counts[item] = self.counts.get(item, 0) + count
+        if len(self.counts) > self.capacity:
+            cutoff = sorted(self.counts.values(), reverse=True)[self.capacity]
+            self.counts = {k: c - cutoff for k, c in self.counts.items() if c > cutoff}
+
+    def most_common(self, n: int) -> List[Tuple[str, int]]:
+        return sorted(self.counts.items(), key=lambda kv: (-kv[1], kv[0]))[:n]
+
+    def to_dict(self) -> Dict:
+        return {'capacity': self.capacity, 'counts': self.counts}
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> 'FrequentValues':
+        top = cls(d['capacity'])
+        top.counts = d['counts']
+        return top
+
+
+class ColumnAccumulator:
+    """Mergeable single-pass statistics for one column"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.total = 0
+        self.nulls = 0
+        # Welford running mean/variance over values that parse as numbers
+        self.numeric_count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min_value: Optional[float] = None
+        self.max_value: Optional[float] = None
+        self.min_length: Optional[int] = None
+        self.max_length: Optional[int] = None
+        self.length_total = 0
+        seed = _hash64(name)
+        self.distinct = HyperLogLog()
+        self.sample = ReservoirSample(seed=seed)
+        self.quantiles = QuantileSketch(seed=seed)
+        self.top = FrequentValues()
+
+    def add(self, value: Any):
+        self.total += 1
+        if value is None or value == '':
+            self.nulls += 1
+            return
+
+        text = str(value)
+        self.distinct.add(text)
+        self.sample.add(text)
+        self.top.add(text)
+        length = len(text)
+        self.length_total += length
+        if self.min_length is None or length < self.min_length:
+            self.min_length = length
+        if self.max_length is None or length > self.max_length:
+            self.max_length = length
+
+        try:
+            num = float(value)
+        except (ValueError, TypeError):
+            return
+        if not math.isfinite(num):
+            return
+        self.numeric_count += 1
+        delta = num - self.mean
+        self.mean += delta / self.numeric_count
+        self.m2 += delta * (num - self.mean)
+        if self.min_value is None or num < self.min_value:
+            self.min_value = num
+        if self.max_value is None or num > self.max_value:
+            self.max_value = num
+        self.quantiles.add(num)
+
+    def merge(self, other: 'ColumnAccumulator'):
+        self.total += other.total
+        self.nulls += other.nulls
+        if other.numeric_count:
+            n = self.numeric_count + other.numeric_count
+            delta = other.mean - self.mean
+            self.m2 += other.m2 + delta * delta * self.numeric_count * other.numeric_count / n
+            self.mean += delta * other.numeric_count / n
+            self.numeric_count = n
+            self.min_value = other.min_value if self.min_value is None else min(self.min_value, other.min_value)
+            self.max_value = other.max_value if self.max_value is None else max(self.max_value, other.max_value)
+        if other.min_length is not None:
+            self.min_length = other.min_length if self.min_length is None else min(self.min_length, other.min_length)
+            self.max_length = other.max_length if self.max_length is None else max(self.max_length, other.max_length)
+        self.length_total += other.length_total
+        self.distinct.merge(other.distinct)
+        self.sample.merge(other.sample)
+        self.quantiles.merge(other.quantiles)
+        self.top.merge(other.top)
+
+    SCALARS = ('total', 'nulls', 'numeric_count', 'mean', 'm2', 'min_value', 'max_value',
+               'min_length', 'max_length', 'length_total')
+
+    def to_dict(self) -> Dict:
+        d = {'name': self.name}
+        d.update((attr, getattr(self, attr)) for attr in self.SCALARS)
+        d.update(distinct=self.distinct.to_dict(), sample=self.sample.to_dict(),
+                 quantiles=self.quantiles.to_dict(), top=self.top.to_dict())
+        return d
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> 'ColumnAccumulator':
+        acc = cls(d['name'])
+        for attr in cls.SCALARS:
+            setattr(acc, attr, d[attr])
+        acc.distinct = HyperLogLog.from_dict(d['distinct'])
+        acc.sample = ReservoirSample.from_dict(d['sample'])
+        acc.quantiles = QuantileSketch.from_dict(d['quantiles'])
+        acc.top = FrequentValues.from_dict(d['top'])
+        return acc
+
+    def to_profile(self) -> ColumnProfile:
+        non_null = self.total - self.nulls
+        unique_count = min(self.distinct.count(), non_null)
+        detected_type = TypeDetector.detect_type(self.sample.items)
+
+        profile = ColumnProfile(
+            name=self.name,
+            data_type=detected_type,
+            total_count=self.total,
+            null_count=self.nulls,
+            null_percentage=(self.nulls / self.total * 100) if self.total > 0 else 0,
+            unique_count=unique_count,
+            unique_percentage=(unique_count / non_null * 100) if non_null else 0,
+            detected_pattern=TypeDetector.detect_pattern(self.sample.items),
+            top_values=self.top.most_common(10)
+        )
+
+        if detected_type in ('integer', 'float') and self.numeric_count:
+            profile.min_value = self.min_value
+            profile.max_value = self.max_value
+            profile.mean = self.mean
+            profile.median = self.quantiles.quantile(0.5)
+            if self.numeric_count > 1:
+                profile.std_dev = math.sqrt(self.m2 / (self.numeric_count - 1))
+            profile.percentile_25 = self.quantiles.quantile(0.25)
+            profile.percentile_75 = self.quantiles.quantile(0.75)
+
+        if detected_type == 'string' and non_null:
+            profile.min_length = self.min_length
+            profile.max_length = self.max_length
+            profile.avg_length = self.length_total / non_null
+
+        return profile
+
+
+class StreamingProfiler:
+    """Single-pass chunked profiler; memory is bounded by column count, not row count.
+
+    Counts, nulls, min/max, mean and std dev are exact. Distinct counts, top values and
+    quantiles are exact for small columns and sketched (HyperLogLog, Misra-Gries, KLL)
+    beyond that; type and pattern detection run on a uniform reservoir sample.
+    Duplicate rows are counted exactly by a disk-spilling DuplicateCounter. Profiles
+    restored from a baseline or merged carry only the row HyperLogLog, so there the count
+    is estimated as rows minus distinct fingerprints and reported with its error bound.
+    """
+
+    # Distinct row fingerprints held in memory before the duplicate counter spills
+    DUPLICATE_SPILL_THRESHOLD = 1_000_000
+
+    def __init__(self, name: str = "dataset"):
+        self.name = name
+        self.row_count = 0
+        self.bytes_read = 0
+        self.columns: Dict[str, ColumnAccumulator] = {}
+        self.distinct_rows = HyperLogLog()
+        self.duplicates: Optional[DuplicateCounter] = DuplicateCounter(self.DUPLICATE_SPILL_THRESHOLD)
+
+    def update(self, rows: List[Dict]):
+        """Fold a chunk of rows into the accumulators"""
+        columns = self.columns
+        for row in rows:
+            self.row_count += 1
+            for col, value in row.items():
+                acc = columns.get(col)
+                if acc is None:
+                    acc = columns[col] = ColumnAccumulator(col)
+                acc.add(value)
+            fingerprint = _row_fingerprint(row)
+            self.distinct_rows.add_hash(fingerprint)
+            if self.duplicates is not None:
+                self.duplicates.add(fingerprint)
+
+    def merge(self, other: 'StreamingProfiler'):
+        self.row_count += other.row_count
+        self.bytes_read += other.bytes_read
+        for col, acc in other.columns.items():
+            if col in self.columns:
+                self.columns[col].merge(acc)
+            else:
+                self.columns[col] = acc
+        self.distinct_rows.merge(other.distinct_rows)
+        # Repeats across the two sides are only visible to the merged sketch
+        self.duplicates = None
+
+    def to_dict(self) -> Dict:
+        return {
+            'name': self.name,
+            'row_count': self.row_count,
+            'bytes_read': self.bytes_read,
+            'columns': [acc.to_dict() for acc in self.columns.values()],
+            'distinct_rows': self.distinct_rows.to_dict()
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> 'StreamingProfiler':
+        profiler = cls(d['name'])
+        profiler.row_count = d['row_count']
+        profiler.bytes_read = d['bytes_read']
+        profiler.columns = {c['name']: ColumnAccumulator.from_dict(c) for c in d['columns']}
+        profiler.distinct_rows = HyperLogLog.from_dict(d['distinct_rows'])
+        profiler.duplicates = None
+        return profiler
+
+    def result(self) -> DataProfile:
+        profiles = []
+        for acc in self.columns.values():
+            # Rows that lacked the column entirely (ragged JSONL) count as nulls
+            missing = self.row_count - acc.total
+            acc.total += missing
+            acc.nulls += missing
+            profiles.append(acc.to_profile())
+        duplicates, error = self._count_duplicates()
+        return DataProfile(
+            name=self.name,
+            row_count=self.row_count,
+            column_count=len(self.columns),
+            columns=profiles,
+            duplicate_rows=duplicates,
+            memory_size_bytes=self.bytes_read,
+            profile_timestamp=datetime.now().isoformat(),
+            duplicate_rows_error=error
+        )
+
+    def _count_duplicates(self) -> Tuple[int, int]:
+        """(duplicate rows, error bound); the bound is 0 when the count is exact"""
+        if self.duplicates is not None:
+            return self.duplicates.count(), 0
+        distinct = self.distinct_rows.count()
+        duplicates = max(0, self.row_count - distinct)
+        if self.distinct_rows.exact is not None:
+            return duplicates, 0
+        # Three standard errors of HyperLogLog (1.04 / sqrt(m))
+        error = 3 * 1.04 / math.sqrt(len(self.distinct_rows.registers)) * distinct
+        return duplicates, int(math.ceil(error))
+
+    @classmethod
+    def profile_file(cls, file_path: str, name: Optional[str] = None,
+                     chunk_size: int = 50_000) -> DataProfile:
+        """Profile a file chunk by chunk without materializing it"""
+        profiler = cls(name or Path(file_path).stem)
+        for chunk in DataLoader.iter_chunks(file_path, chunk_size):
+            profiler.update(chunk)
+            logger.debug(f"Profiled {profiler.row_count:,} rows")
+        profiler.bytes_read = Path(file_path).stat().st_size
+        return profiler.result()
+
+# =============================================================================
+# Incremental Baselines
+# =============================================================================
+
+@dataclass
+class IncrementalRun:
+    """Outcome of profiling the rows appended since the stored baseline"""
+    rows: List[Dict]
+    start_row: int
+    total_rows: int
+    resumed: bool
+    profile: DataProfile
+    drift: List[ValidationResult] = field(default_factory=list)
+
+
+class BaselineStore:
+    """Per-dataset baselines for incremental runs on append-only CSV/JSONL files.
+
+    A baseline holds the serialized StreamingProfiler accumulators, the byte offset and
+    row count processed so far, and hashes of the first and last processed blocks.
+    A file that shrank or whose checkpoints no longer match was rewritten rather than
+    appended to, and is profiled from scratch.
+    """
+
+    VERSION = 1
+    CHECKPOINT_BYTES = 65536
+
+    def __init__(self, directory: str = '.dq_baselines'):
+        self.directory = Path(directory)
+
+    def path_for(self, dataset: str) -> Path:
+        return self.directory / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', dataset)}.baseline.json"
+
+    def load(self, dataset: str) -> Optional[Dict]:
+        path = self.path_for(dataset)
+        if not path.exists():
+            return None
+        with open(path, 'r') as f:
+            baseline = json.load(f)
+        if baseline.get('version') != self.VERSION:
+            logger.warning(f"Ignoring baseline {path} (format version {baseline.get('version')})")
+            return None
+        return baseline
+
+    def save(self, dataset: str, file_path: str, offset: int, profiler: 'StreamingProfiler'):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        baseline = {
+            'version': self.VERSION,
+            'dataset': dataset,
+            'source': str(Path(file_path).resolve()),
+            'offset': offset,
+            'row_count': profiler.row_count,
+            'checkpoints': self.checkpoints(file_path, offset),
+            'updated': datetime.now().isoformat(),
+            'profiler': profiler.to_dict()
+        }
+        path = self.path_for(dataset)
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(baseline, f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def checkpoints(cls, file_path: str, offset: int) -> Dict[str, str]:
+        """Hashes of the first and last CHECKPOINT_BYTES before `offset`"""
+        with open(file_path, 'rb') as f:
+            head = f.read(min(offset, cls.CHECKPOINT_BYTES))
+            f.seek(max(0, offset - cls.CHECKPOINT_BYTES))
+            tail = f.read(offset - f.tell())
+        return {'head': hashlib.sha256(head).hexdigest(), 'tail': hashlib.sha256(tail).hexdigest()}
+
+    def resume_offset(self, baseline: Dict, file_path: str) -> int:
+        """Offset to resume from, or 0 when the file is not an append of the baseline"""
+        offset = baseline['offset']
+        if Path(file_path).stat().st_size < offset:
+            logger.warning("File is smaller than its baseline; re-profiling from scratch")
+            return 0
+        if self.checkpoints(file_path, offset) != baseline['checkpoints']:
+            logger.warning("File changed before the baseline offset; re-profiling from scratch")
+            return 0
+        return offset
+
+
+class DriftDetector:
+    """Compare newly appended rows against the baseline accumulated before them"""
+
+    def __init__(self, null_rate_points: float = 5.0, mean_shift_std: float = 0.5,
+                 max_categories: int = 20):
+        self.null_rate_points = null_rate_points
+        self.mean_shift_std = mean_shift_std
+        self.max_categories = max_categories
+
+    def detect(self, baseline: 'StreamingProfiler', appended: 'StreamingProfiler') -> List[ValidationResult]:
+        results = []
+        base_profiles = {c.name: c for c in baseline.result().columns}
+        new_profiles = {c.name: c for c in appended.result().columns}
+
+        for col in base_profiles.keys() - new_profiles.keys():
+            results.append(self._drift("drift_column_missing", col, "column present", "column missing",
+                                       f"Column '{col}' is missing from the appended rows"))
+        for col in new_profiles.keys() - base_profiles.keys():
+            results.append(self._drift("drift_column_added", col, "no new columns", "column added",
+                                       f"Column '{col}' appears in the appended rows but not in the baseline"))
+
+        for col, new in new_profiles.items():
+            base = base_profiles.get(col)
+            if base is None:
+                continue
+
+            # A float column whose appended values all happen to be integral is not a change
+            compatible = new.data_type == base.data_type or (base.data_type, new.data_type) == ('float', 'integer')
+            if not compatible and new.total_count > new.null_count:
+                results.append(self._drift("drift_data_type", col, base.data_type, new.data_type,
+                                           f"Column '{col}' type changed from '{base.data_type}' to '{new.data_type}'"))
+
+            null_delta = new.null_percentage - base.null_percentage
+            if abs(null_delta) > self.null_rate_points:
+                results.append(self._drift("drift_null_rate", col, f"{base.null_percentage:.1f}% nulls",
+                                           f"{new.null_percentage:.1f}% nulls",
+                                           f"Column '{col}' null rate moved {null_delta:+.1f} points"))
+
+            # Identifier-like columns drift by construction
+            identifier = base.unique_percentage > 99
+            if base.std_dev and new.mean is not None and base.mean is not None and not identifier:
+                shift = (new.mean - base.mean) / base.std_dev
+                if abs(shift) > self.mean_shift_std:
+                    results.append(self._drift("drift_mean_shift", col, f"mean {base.mean:.4g}",
+                                               f"mean {new.mean:.4g}",
+                                               f"Column '{col}' mean shifted {shift:+.2f} baseline std devs"))
+
+            # New categories: only meaningful when the baseline's value set is known exactly
+            base_top = baseline.columns[col].top
+            if base.unique_count <= self.max_categories and len(base_top.counts) == base.unique_count:
+                unseen = sorted(set(appended.columns[col].top.counts) - set(base_top.counts))
+                if unseen:
+                    results.append(self._drift("drift_new_values", col, f"one of {sorted(base_top.counts)}",
+                                               f"{len(unseen)} new values",
+                                               f"Column '{col}' has values not seen in the baseline: {unseen[:10]}"))
+
+        return results
+
+    @staticmethod
+    def _drift(check: str, column: str, expected: Any, actual: Any, message: str) -> ValidationResult:
+        return ValidationResult(check_name=check, column=column, passed=False, expected=expected,
+                                actual=actual, severity="warning", message=message)
+
+
+class IncrementalProfiler:
+    """Profile only the rows appended since the last run and fold them into the baseline"""
+
+    def __init__(self, store: BaselineStore, drift_detector: Optional[DriftDetector] = None):
+        self.store = store
+        self.drift_detector = drift_detector or DriftDetector()
+
+    def run(self, file_path: str, dataset: Optional[str] = None, rebuild: bool = False,
+            update: bool = True) -> IncrementalRun:
+        dataset = dataset or Path(file_path).stem
+        baseline = None if rebuild else self.store.load(dataset)
+
+        offset = self.store.resume_offset(baseline, file_path) if baseline else 0
+        if offset == 0:
+            baseline = None
+
+        rows, end_offset = DataLoader.load_appended(file_path, offset)
+        appended = StreamingProfiler(dataset)
+        appended.update(rows)
+
+        drift = []
+        if baseline is not None:
+            merged = StreamingProfiler.from_dict(baseline['profiler'])
+            start_row = merged.row_count
+            if rows:
+                drift = self.drift_detector.detect(StreamingProfiler.from_dict(baseline['profiler']), appended)
+                merged.merge(appended)
+            logger.info(f"Baseline covers {start_row:,} rows; processing {len(rows):,} appended rows")
+        else:
+            merged, start_row = appended, 0
+            logger.info(f"No usable baseline for '{dataset}'; profiling all {len(rows):,} rows")
+
+        merged.bytes_read = end_offset
+        if update:
+            self.store.save(dataset, file_path, end_offset, merged)
+
+        return IncrementalRun(
+            rows=rows,
+            start_row=start_row,
+            total_rows=merged.row_count,
+            resumed=baseline is not None,
+            profile=merged.result(),
+            drift=drift
+        )
+
 
 # =============================================================================
 # Great Expectations Suite Generator
@@ -989,6 +1997,29 @@ class DataContractValidator:
 
     def validate_contract(self, data: List[Dict], contract: Dict) -> List[ValidationResult]:
         """Validate data against contract"""
+        def column_facts(col_name: str) -> Tuple[Optional[str], int]:
+            values = [row.get(col_name) for row in data]
+            non_null = [str(v) for v in values if v is not None and v != '']
+            detected_type = TypeDetector.detect_type(non_null[:1000]) if non_null else None
+            return detected_type, len(values) - len(non_null)
+
+        present = set(data[0]) if data else None
+        return self._check_contract(contract, len(data), present, column_facts)
+
+    def validate_contract_profile(self, profile: DataProfile, contract: Dict) -> List[ValidationResult]:
+        """Validate a (merged) profile against the contract without revisiting rows"""
+        by_name = {c.name: c for c in profile.columns}
+
+        def column_facts(col_name: str) -> Tuple[Optional[str], int]:
+            col = by_name[col_name]
+            return (col.data_type if col.total_count > col.null_count else None), col.null_count
+
+        present = set(by_name) if profile.row_count else None
+        return self._check_contract(contract, profile.row_count, present, column_facts)
+
+    def _check_contract(self, contract: Dict, row_count: int, present: Optional[Set[str]],
+                        column_facts) -> List[ValidationResult]:
+        """Contract checks over dataset facts; column_facts(name) -> (detected type or None, null count)"""
         results = []
 
         # Validate schema section
@@ -1002,7 +2033,7 @@ class DataContractValidator:
                     continue
 
                 # Check column exists
-                if data and col_name not in data[0]:
+                if present is not None and col_name not in present:
                     results.append(ValidationResult(
                         check_name="contract_column_exists",
                         column=col_name,
@@ -1014,13 +2045,14 @@ class DataContractValidator:
                     ))
                     continue
 
+                if present is None:
+                    continue
+
                 # Check data type
                 expected_type = col_def.get('type', col_def.get('data_type', 'string'))
-                values = [row.get(col_name) for row in data]
-                non_null = [str(v) for v in values if v is not None and v != '']
+                detected_type, null_count = column_facts(col_name)
 
-                if non_null:
-                    detected_type = TypeDetector.detect_type(non_null[:1000])
+                if detected_type is not None:
                     type_compatible = self._types_compatible(detected_type, expected_type)
 
                     if not type_compatible:
@@ -1036,7 +2068,6 @@ class DataContractValidator:
 
                 # Check nullable
                 if not col_def.get('nullable', True):
-                    null_count = sum(1 for v in values if v is None or v == '')
                     if null_count > 0:
                         results.append(ValidationResult(
                             check_name="contract_not_null",
@@ -1056,7 +2087,6 @@ class DataContractValidator:
             min_rows = sla.get('min_rows', sla.get('minimum_records'))
             max_rows = sla.get('max_rows', sla.get('maximum_records'))
 
-            row_count = len(data)
             if min_rows and row_count < min_rows:
                 results.append(ValidationResult(
                     check_name="contract_min_rows",
@@ -1105,6 +2135,13 @@ class DataContractValidator:
 # Report Generator
 # =============================================================================
 
+def _format_duplicates(profile: DataProfile) -> str:
+    """Duplicate row count, marked as an estimate when it carries an error bound"""
+    if profile.duplicate_rows_error:
+        return f"~{profile.duplicate_rows:,} (+/- {profile.duplicate_rows_error:,}, estimated)"
+    return f"{profile.duplicate_rows:,}"
+
+
 class ReportGenerator:
     """Generate validation reports"""
 
@@ -1121,7 +2158,7 @@ class ReportGenerator:
         lines.append(f"Generated: {datetime.now().isoformat()}")
         lines.append(f"Rows: {profile.row_count:,}")
         lines.append(f"Columns: {profile.column_count}")
-        lines.append(f"Duplicate Rows: {profile.duplicate_rows:,}")
+        lines.append(f"Duplicate Rows: {_format_duplicates(profile)}")
 
         # Quality Score
         lines.append("\n" + "-" * 40)
@@ -1207,6 +2244,7 @@ class ReportGenerator:
                 "row_count": profile.row_count,
                 "column_count": profile.column_count,
                 "duplicate_rows": profile.duplicate_rows,
+                "duplicate_rows_error": profile.duplicate_rows_error,
                 "memory_bytes": profile.memory_size_bytes
             },
             "quality_score": asdict(score),
@@ -1259,6 +2297,71 @@ class DataLoader:
         else:
             raise ValueError(f"Unsupported file format: {suffix}")
 
+    @staticmethod
+    def iter_chunks(file_path: str, chunk_size: int = 50_000) -> Iterator[List[Dict]]:
+        """Yield rows in chunks; CSV and JSONL are streamed, JSON is parsed whole"""
+        path = Path(file_path)
+
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        suffix = path.suffix.lower()
+
+        if suffix == '.csv':
+            f = open(file_path, 'r', newline='', encoding='utf-8')
+            rows = csv.DictReader(f)
+        elif suffix == '.jsonl':
+            f = open(file_path, 'r', encoding='utf-8')
+            rows = (json.loads(line) for line in f if line.strip())
+        elif suffix == '.json':
+            f = None
+            rows = iter(DataLoader._load_json(file_path))
+        else:
+            raise ValueError(f"Unsupported file format: {suffix}")
+
+        try:
+            chunk = []
+            for row in rows:
+                chunk.append(row)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+        finally:
+            if f is not None:
+                f.close()
+
+    @staticmethod
+    def load_appended(file_path: str, offset: int = 0) -> Tuple[List[Dict], int]:
+        """Load rows after byte `offset` and return them with the new end offset.
+
+        CSV and JSONL are resumable (the CSV header is re-read from the top of the
+        file); JSON documents are always loaded whole. Only complete lines are consumed:
+        a trailing line without its newline may still be being written, so it is left
+        for the next run.
+        """
+        suffix = Path(file_path).suffix.lower()
+        if suffix == '.json':
+            return DataLoader._load_json(file_path), Path(file_path).stat().st_size
+        if suffix not in ('.csv', '.jsonl'):
+            raise ValueError(f"Unsupported file format: {suffix}")
+
+        with open(file_path, 'rb') as f:
+            if suffix == '.csv':
+                fieldnames = next(csv.reader([f.readline().decode('utf-8')]), [])
+                offset = max(offset, f.tell())
+            f.seek(offset)
+            chunk = f.read()
+        chunk = chunk[:chunk.rfind(b'\n') + 1]
+
+        text = io.StringIO(chunk.decode('utf-8'), newline='')
+        if suffix == '.csv':
+            rows = [dict(row) for row in csv.DictReader(text, fieldnames=fieldnames)]
+        else:
+            rows = [json.loads(line) for line in text if line.strip()]
+        return rows, offset + len(chunk)
+
     @staticmethod
     def _load_csv(file_path: str) -> List[Dict]:
         """Load CSV file"""
@@ -1341,8 +2444,28 @@ class SchemaLoader:
 # CLI Interface
 # =============================================================================
 
+def _profile_input(args) -> DataProfile:
+    """Profile args.input, streaming it in chunks when --streaming is set"""
+    name = Path(args.input).stem
+    if getattr(args, 'streaming', False):
+        logger.info(f"Streaming profile of {args.input} (chunks of {args.chunk_size:,} rows)")
+        return StreamingProfiler.profile_file(args.input, name, args.chunk_size)
+
+    logger.info(f"Loading data from {args.input}")
+    data = DataLoader.load(args.input)
+    return DataProfiler(use_numpy=_use_numpy(args), workers=args.workers).profile(data, name=name)
+
+
+def _use_numpy(args) -> bool:
+    """Columnar NumPy backend unless --no-numpy was given or NumPy is missing"""
+    return HAS_NUMPY and not args.no_numpy
+
+
 def cmd_validate(args):
     """Run validation against schema"""
+    if args.baseline_dir:
+        return _cmd_validate_incremental(args)
+
     logger.info(f"Loading data from {args.input}")
     data = DataLoader.load(args.input)
 
@@ -1352,17 +2475,17 @@ def cmd_validate(args):
         logger.info(f"Loading schema from {args.schema}")
         schema = SchemaLoader.load(args.schema)
 
-        validator = SchemaValidator()
+        validator = SchemaValidator(workers=args.workers)
         results = validator.validate(data, schema)
 
     if args.detect_anomalies:
         logger.info("Running anomaly detection")
-        anomaly_detector = AnomalyDetector()
+        anomaly_detector = AnomalyDetector(use_numpy=_use_numpy(args))
         anomaly_results = anomaly_detector.validate(data)
         results.extend(anomaly_results)
 
     # Profile data
-    profiler = DataProfiler()
+    profiler = DataProfiler(use_numpy=_use_numpy(args), workers=args.workers)
     profile = profiler.profile(data, name=Path(args.input).stem)
 
     # Calculate score
@@ -1391,13 +2514,60 @@ def cmd_validate(args):
         sys.exit(1)
 
 
+def _run_incremental(args) -> IncrementalRun:
+    store = BaselineStore(args.baseline_dir)
+    return IncrementalProfiler(store).run(args.input, rebuild=args.rebuild_baseline,
+                                          update=not args.no_update_baseline)
+
+
+def _cmd_validate_incremental(args):
+    """Validate only the rows appended since the stored baseline"""
+    run = _run_incremental(args)
+    data = run.rows
+
+    results = []
+
+    if args.schema:
+        logger.info(f"Loading schema from {args.schema}")
+        schema = SchemaLoader.load(args.schema)
+        validator = SchemaValidator(workers=args.workers)
+        results = validator.validate_appended(data, schema, run.total_rows, run.start_row)
+
+    if args.detect_anomalies and data:
+        logger.info("Running anomaly detection on appended rows")
+        anomaly_results = AnomalyDetector(use_numpy=_use_numpy(args)).validate(data)
+        for r in anomaly_results:
+            r.failed_rows = [i + run.start_row for i in r.failed_rows]
+        results.extend(anomaly_results)
+
+    results.extend(run.drift)
+    _emit_report(args, run.profile, results)
+
+    errors = sum(1 for r in results if not r.passed and r.severity == "error")
+    if errors > 0:
+        sys.exit(1)
+
+
+def _emit_report(args, profile: DataProfile, results: List[ValidationResult]):
+    score = QualityScoreCalculator().calculate(profile, results)
+    reporter = ReportGenerator()
+
+    if args.json:
+        output = json.dumps(reporter.generate_json_report(profile, results, score), indent=2)
+    else:
+        output = reporter.generate_text_report(profile, results, score)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+        logger.info(f"Report saved to {args.output}")
+    else:
+        print(output)
+
+
 def cmd_profile(args):
     """Generate data profile"""
-    logger.info(f"Loading data from {args.input}")
-    data = DataLoader.load(args.input)
-
-    profiler = DataProfiler()
-    profile = profiler.profile(data, name=Path(args.input).stem)
+    profile = _profile_input(args)
 
     if args.json or args.output:
         output = json.dumps(asdict(profile), indent=2, default=str)
@@ -1407,7 +2577,7 @@ def cmd_profile(args):
         lines.append(f"Dataset: {profile.name}")
         lines.append(f"Rows: {profile.row_count:,}")
         lines.append(f"Columns: {profile.column_count}")
-        lines.append(f"Duplicate rows: {profile.duplicate_rows:,}")
+        lines.append(f"Duplicate rows: {_format_duplicates(profile)}")
         lines.append(f"\nColumn Profiles:")
 
         for col in profile.columns:
@@ -1429,12 +2599,8 @@ def cmd_profile(args):
 
 def cmd_generate_suite(args):
     """Generate Great Expectations suite"""
-    logger.info(f"Loading data from {args.input}")
-    data = DataLoader.load(args.input)
-
     # Profile first
-    profiler = DataProfiler()
-    profile = profiler.profile(data, name=Path(args.input).stem)
+    profile = _profile_input(args)
 
     # Generate suite
     generator = GreatExpectationsGenerator()
@@ -1452,17 +2618,26 @@ def cmd_generate_suite(args):
 
 def cmd_contract(args):
     """Validate against data contract"""
-    logger.info(f"Loading data from {args.input}")
-    data = DataLoader.load(args.input)
-
     logger.info(f"Loading contract from {args.contract}")
     contract_validator = DataContractValidator()
     contract = contract_validator.load_contract(args.contract)
 
+    if args.baseline_dir:
+        # The merged profile carries every fact the contract checks
+        run = _run_incremental(args)
+        results = contract_validator.validate_contract_profile(run.profile, contract) + run.drift
+        _emit_report(args, run.profile, results)
+        if any(not r.passed and r.severity == "error" for r in results):
+            sys.exit(1)
+        return
+
+    logger.info(f"Loading data from {args.input}")
+    data = DataLoader.load(args.input)
+
     results = contract_validator.validate_contract(data, contract)
 
     # Profile data
-    profiler = DataProfiler()
+    profiler = DataProfiler(use_numpy=_use_numpy(args), workers=args.workers)
     profile = profiler.profile(data, name=Path(args.input).stem)
 
     # Calculate score
@@ -1493,17 +2668,13 @@ def cmd_contract(args):
 
 def cmd_schema(args):
     """Generate schema from data"""
-    logger.info(f"Loading data from {args.input}")
-    data = DataLoader.load(args.input)
+    # Profile to detect types
+    profile = _profile_input(args)
 
-    if not data:
+    if not profile.row_count:
         logger.error("Empty dataset")
         sys.exit(1)
 
-    # Profile to detect types
-    profiler = DataProfiler()
-    profile = profiler.profile(data, name=Path(args.input).stem)
-
     # Generate schema
     schema = {
         "name": profile.name,
@@ -1549,6 +2720,23 @@ def cmd_schema(args):
         print(output)
 
 
+def _add_workers_arg(subparser):
+    subparser.add_argument('--workers', '-w', type=int, default=1,
+                           help='Profile/validate column groups in N worker processes (default: 1)')
+
+
+def _add_baseline_args(subparser):
+    subparser.add_argument('--baseline-dir', help='Baseline store; only rows appended since the last run are processed')
+    subparser.add_argument('--rebuild-baseline', action='store_true', help='Ignore the stored baseline and start over')
+    subparser.add_argument('--no-update-baseline', action='store_true', help='Do not advance the baseline after this run')
+
+
+def _add_streaming_args(subparser):
+    subparser.add_argument('--streaming', action='store_true',
+                           help='Profile in one chunked pass with bounded memory (sketched distinct counts and quantiles)')
+    subparser.add_argument('--chunk-size', type=int, default=50_000, help='Rows per chunk with --streaming (default: 50000)')
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
@@ -1562,18 +2750,29 @@ Examples:
   # Profile data
   python data_quality_validator.py profile data.csv --output profile.json
 
+  # Profile a file larger than RAM in one streaming pass
+  python data_quality_validator.py profile huge.csv --streaming
+
+  # Validate a wide table using 8 worker processes
+  python data_quality_validator.py validate wide.csv --schema schema.json --workers 8
+
   # Generate Great Expectations suite
   python data_quality_validator.py generate-suite data.csv --output expectations.json
 
   # Validate against data contract
   python data_quality_validator.py contract data.csv --contract contract.yaml
 
+  # Daily append-only partitions: process only new rows, report drift vs the baseline
+  python data_quality_validator.py contract events.csv --contract contract.yaml --baseline-dir .dq_baselines
+
   # Generate schema from data
   python data_quality_validator.py schema data.csv --output schema.json
         """
     )
 
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    parser.add_argument('--no-numpy', action='store_true',
+                        help='Use the pure-Python numeric paths even when NumPy is installed')
 
     subparsers = parser.add_subparsers(dest='command', help='Command to run')
 
@@ -1584,6 +2783,8 @@ Examples:
     validate_parser.add_argument('--output', '-o', help='Output report file')
     validate_parser.add_argument('--json', action='store_true', help='Output as JSON')
     validate_parser.add_argument('--detect-anomalies', action='store_true', help='Detect statistical anomalies')
+    _add_workers_arg(validate_parser)
+    _add_baseline_args(validate_parser)
     validate_parser.set_defaults(func=cmd_validate)
 
     # Profile command
@@ -1591,12 +2792,16 @@ Examples:
     profile_parser.add_argument('input', help='Input data file')
     profile_parser.add_argument('--output', '-o', help='Output profile file')
     profile_parser.add_argument('--json', action='store_true', help='Output as JSON')
+    _add_streaming_args(profile_parser)
+    _add_workers_arg(profile_parser)
     profile_parser.set_defaults(func=cmd_profile)
 
     # Generate suite command
     suite_parser = subparsers.add_parser('generate-suite', help='Generate Great Expectations suite')
     suite_parser.add_argument('input', help='Input data file')
     suite_parser.add_argument('--output', '-o', help='Output expectations file')
+    _add_streaming_args(suite_parser)
+    _add_workers_arg(suite_parser)
     suite_parser.set_defaults(func=cmd_generate_suite)
 
     # Contract command
@@ -1605,12 +2810,16 @@ Examples:
     contract_parser.add_argument('--contract', '-c', required=True, help='Data contract file (YAML or JSON)')
     contract_parser.add_argument('--output', '-o', help='Output report file')
     contract_parser.add_argument('--json', action='store_true', help='Output as JSON')
+    _add_workers_arg(contract_parser)
+    _add_baseline_args(contract_parser)
     contract_parser.set_defaults(func=cmd_contract)
 
     # Schema command
     schema_parser = subparsers.add_parser('schema', help='Generate schema from data')
     schema_parser.add_argument('input', help='Input data file')
     schema_parser.add_argument('--output', '-o', help='Output schema file')
+    _add_streaming_args(schema_parser)
+    _add_workers_arg(schema_parser)
     schema_parser.set_defaults(func=cmd_schema)
 
     args = parser.parse_args()
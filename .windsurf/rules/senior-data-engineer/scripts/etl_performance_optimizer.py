@@ -6,15 +6,19 @@ Comprehensive ETL/ELT performance analysis and optimization tool.
 Features:
 - SQL query analysis and optimization recommendations
 - Spark job configuration analysis
+- Streaming ingestion of raw Spark event logs (gzip/zstd, rolling logs) in parallel
 - Data skew detection and mitigation
 - Partition strategy recommendations
 - Join optimization suggestions
 - Memory and shuffle analysis
 - Cost estimation for cloud warehouses
+- Workload analysis: fingerprint thousands of logged statements and rank query families
 
 Usage:
     python etl_performance_optimizer.py analyze-sql query.sql
+    python etl_performance_optimizer.py analyze-workload queries/ query_history.csv --warehouse snowflake
     python etl_performance_optimizer.py analyze-spark spark-history.json
+    python etl_performance_optimizer.py analyze-spark /var/log/spark-events/ -j 8
     python etl_performance_optimizer.py optimize-partition data_stats.json
     python etl_performance_optimizer.py estimate-cost query.sql --warehouse snowflake
 """
@@ -26,8 +30,14 @@ import re
 import argparse
 import logging
 import math
+import csv
+import gzip
+import hashlib
+import io
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple, Set
+from typing import Dict, List, Optional, Any, Tuple, Set, Iterator
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from collections import defaultdict
@@ -77,6 +87,24 @@ class OptimizationRecommendation:
     priority: int = 1
 
 
+@dataclass
+class QueryFamily:
+    """Statements sharing one normalized shape (literals replaced by ?)"""
+    fingerprint: str
+    normalized: str
+    example: str
+    count: int = 0
+    observed_ms: float = 0.0
+    observed_count: int = 0
+    query_info: Optional[SQLQueryInfo] = None
+    recommendations: List[OptimizationRecommendation] = field(default_factory=list)
+    unit_cost: float = 0.0
+
+    @property
+    def impact(self) -> float:
+        return self.count * self.unit_cost
+
+
 @dataclass
 class SparkJobMetrics:
     """Metrics from a Spark job"""
@@ -93,6 +121,8 @@ class SparkJobMetrics:
     failed_tasks: int
     speculative_tasks: int
     skew_ratio: float  # max_task_time / median_task_time
+    skewed_stage: Optional[int] = None  # stage with the worst ratio, when known from an event log
+    executor_run_time_ms: int = 0  # summed task run time from an event log; 0 when unknown
 
 
 @dataclass
@@ -712,6 +742,209 @@ class SQLOptimizer:
         return recommendations
 
 
+# =============================================================================
+# SQL Workload Analyzer
+# =============================================================================
+
+# Quoted strings/identifiers and comments are skipped so only real terminators split
+_STATEMENT_TOKEN = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|--[^\n]*|/\*.*?\*/|;", re.DOTALL)
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b')
+_PLACEHOLDER_LIST = re.compile(r'\(\s*\?(?:\s*,\s*\?)+\s*\)')
+_VALUES_LIST = re.compile(r'\(\?\)(?:\s*,\s*\(\?\))+')
+
+# Relative per-execution weight when no warehouse pricing is selected
+COMPLEXITY_WEIGHT = {'low': 1.0, 'medium': 2.0, 'high': 4.0, 'very_high': 8.0}
+
+# Query-log field names (case-insensitive), e.g. Snowflake/BigQuery/Redshift history exports
+QUERY_FIELDS = ('query_text', 'query', 'sql', 'statement', 'querytxt')
+DURATION_FIELDS = ('duration_ms', 'total_elapsed_time', 'elapsed_ms', 'execution_time_ms', 'total_slot_ms')
+
+
+def split_statements(text: str) -> List[str]:
+    """Split a script on top-level semicolons, dropping comment-only fragments"""
+    pieces = []
+    start = 0
+    for match in _STATEMENT_TOKEN.finditer(text):
+        if match.group() == ';':
+            pieces.append(text[start:match.start()])
+            start = match.end()
+    pieces.append(text[start:])
+    cleaner = SQLParser()
+    return [p.strip() for p in pieces if cleaner._clean_sql(p)]
+
+
+@lru_cache(maxsize=65536)
+def fingerprint_sql(sql: str) -> Tuple[str, str]:
+    """(fingerprint, normalized shape); literals become ?, IN/VALUES lists collapse"""
+    normalized = SQLParser()._clean_sql(sql)
+    normalized = _STRING_LITERAL.sub('?', normalized)
+    normalized = _NUMBER_LITERAL.sub('?', normalized)
+    normalized = _PLACEHOLDER_LIST.sub('(?)', normalized)
+    normalized = _VALUES_LIST.sub('(?)', normalized).lower()
+    return hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).hexdigest(), normalized
+
+
+class WorkloadReader:
+    """Read statements (with observed durations when logged) from files, directories and query logs"""
+
+    LOG_SUFFIXES = ('.csv', '.json', '.jsonl')
+
+    def iter_statements(self, inputs: List[str]) -> Iterator[Tuple[str, Optional[float]]]:
+        for item in inputs:
+            path = Path(item)
+            if path.is_dir():
+                for sql_file in sorted(path.rglob('*.sql')):
+                    yield from self._read_script(sql_file)
+            elif path.suffix.lower() in self.LOG_SUFFIXES:
+                yield from self._read_log(path)
+            else:
+                yield from self._read_script(path)
+
+    def _read_script(self, path: Path) -> Iterator[Tuple[str, Optional[float]]]:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            for statement in split_statements(f.read()):
+                yield statement, None
+
+    def _read_log(self, path: Path) -> Iterator[Tuple[str, Optional[float]]]:
+        suffix = path.suffix.lower()
+        with open(path, 'r', encoding='utf-8', errors='replace', newline='') as f:
+            if suffix == '.csv':
+                records = csv.DictReader(f)
+            elif suffix == '.jsonl':
+                records = (json.loads(line) for line in f if line.strip())
+            else:
+                content = json.load(f)
+                records = content if isinstance(content, list) else content.get('queries', [])
+            for record in records:
+                entry = self._parse_record(record)
+                if entry:
+                    yield entry
+
+    @staticmethod
+    def _parse_record(record: Dict) -> Optional[Tuple[str, Optional[float]]]:
+        fields = {str(k).lower(): v for k, v in record.items()}
+        sql = next((fields[k] for k in QUERY_FIELDS if fields.get(k)), None)
+        if not sql:
+            return None
+        duration = None
+        for key in DURATION_FIELDS:
+            if fields.get(key) not in (None, ''):
+                try:
+                    duration = float(fields[key])
+                except (TypeError, ValueError):
+                    pass
+                break
+        return str(sql), duration
+
+
+def _fingerprint_batch(batch: List[Tuple[str, Optional[float]]]) -> Dict[str, List]:
+    """Per-shape [normalized, example, count, observed_ms, observed_count] for one batch"""
+    shapes: Dict[str, List] = {}
+    for sql, duration in batch:
+        fp, normalized = fingerprint_sql(sql)
+        shape = shapes.get(fp)
+        if shape is None:
+            shape = shapes[fp] = [normalized, sql, 0, 0.0, 0]
+        shape[2] += 1
+        if duration is not None:
+            shape[3] += duration
+            shape[4] += 1
+    return shapes
+
+
+def _analyze_shape(example: str, warehouse: Optional[str],
+                   data_stats: Optional[Dict]) -> Tuple[SQLQueryInfo, List[OptimizationRecommendation], float]:
+    """Parse and analyze one representative statement; returns its per-execution cost"""
+    query_info = SQLParser().parse(example)
+    recommendations = SQLOptimizer().analyze(query_info, example)
+    if warehouse:
+        unit_cost = CostEstimator().estimate(query_info, warehouse, data_stats).total_cost
+    else:
+        unit_cost = COMPLEXITY_WEIGHT.get(query_info.estimated_complexity, 1.0)
+    return query_info, recommendations, unit_cost
+
+
+class WorkloadAnalyzer:
+    """Group a statement stream into query families and rank them by frequency x cost.
+
+    Statements are fingerprinted in batches across worker processes; each distinct
+    shape is then parsed and analyzed exactly once, from its first example.
+    """
+
+    def __init__(self, warehouse: Optional[str] = None, data_stats: Optional[Dict] = None,
+                 workers: int = 1, batch_size: int = 2000):
+        self.warehouse = warehouse
+        self.data_stats = data_stats
+        self.workers = max(1, workers)
+        self.batch_size = batch_size
+        self.statements = 0
+
+    def analyze(self, statements: Iterator[Tuple[str, Optional[float]]]) -> List[QueryFamily]:
+        families: Dict[str, QueryFamily] = {}
+
+        if self.workers == 1:
+            for batch in self._batches(statements):
+                self._merge_batch(families, _fingerprint_batch(batch))
+            for family in families.values():
+                self._apply_analysis(family, _analyze_shape(family.example, self.warehouse, self.data_stats))
+        else:
+            with ProcessPoolExecutor(self.workers) as pool:
+                for shapes in pool.map(_fingerprint_batch, self._batches(statements)):
+                    self._merge_batch(families, shapes)
+                ordered = list(families.values())
+                analyses = pool.map(_analyze_shape, [f.example for f in ordered],
+                                    [self.warehouse] * len(ordered), [self.data_stats] * len(ordered),
+                                    chunksize=max(1, len(ordered) // (self.workers * 4)))
+                for family, analysis in zip(ordered, analyses):
+                    self._apply_analysis(family, analysis)
+
+        return sorted(families.values(), key=lambda f: f.impact, reverse=True)
+
+    def _batches(self, statements: Iterator[Tuple[str, Optional[float]]]) -> Iterator[List]:
+        batch = []
+        for entry in statements:
+            batch.append(entry)
+            self.statements += 1
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _merge_batch(families: Dict[str, QueryFamily], shapes: Dict[str, List]):
+        for fp, (normalized, example, count, observed_ms, observed_count) in shapes.items():
+            family = families.get(fp)
+            if family is None:
+                family = families[fp] = QueryFamily(fingerprint=fp, normalized=normalized, example=example)
+            family.count += count
+            family.observed_ms += observed_ms
+            family.observed_count += observed_count
+
+    @staticmethod
+    def _apply_analysis(family: QueryFamily, analysis: Tuple):
+        family.query_info, family.recommendations, family.unit_cost = analysis
+
+    @staticmethod
+    def aggregate_recommendations(families: List[QueryFamily]) -> List[Dict]:
+        """Recommendations across families, weighted by the impact of the families they apply to"""
+        by_title: Dict[str, Dict] = {}
+        for family in families:
+            for rec in family.recommendations:
+                entry = by_title.setdefault(rec.title, {
+                    'title': rec.title, 'severity': rec.severity, 'category': rec.category,
+                    'recommendation': rec.recommendation, 'families': 0, 'executions': 0, 'impact': 0.0,
+                    'top_fingerprints': []
+                })
+                entry['families'] += 1
+                entry['executions'] += family.count
+                entry['impact'] += family.impact
+                if len(entry['top_fingerprints']) < 5:
+                    entry['top_fingerprints'].append(family.fingerprint)
+        return sorted(by_title.values(), key=lambda e: e['impact'], reverse=True)
+
+
 # =============================================================================
 # Spark Job Analyzer
 # =============================================================================
@@ -733,7 +966,9 @@ class SparkJobAnalyzer:
             recommendations.append(self._recommend_reduce_shuffle(metrics, shuffle_ratio))
 
         # Check for GC overhead
-        gc_ratio = metrics.gc_time_ms / max(metrics.duration_ms, 1)
+        # GC time is summed over tasks, so compare it with summed task run time when known;
+        # against wall-clock duration, parallel tasks inflate the share
+        gc_ratio = metrics.gc_time_ms / max(metrics.executor_run_time_ms or metrics.duration_ms, 1)
         if gc_ratio > 0.1:
             recommendations.append(self._recommend_memory_tuning(metrics, gc_ratio))
 
@@ -759,7 +994,8 @@ class SparkJobAnalyzer:
             category="skew",
             severity="critical",
             title="Severe Data Skew Detected",
-            description=f"Skew ratio of {metrics.skew_ratio:.1f}x indicates uneven data distribution.",
+            description=f"Skew ratio of {metrics.skew_ratio:.1f}x indicates uneven data distribution"
+                        + (f" (worst in stage {metrics.skewed_stage})." if metrics.skewed_stage is not None else "."),
             current_issue=f"Task execution time varies by {metrics.skew_ratio:.1f}x, causing stragglers",
             recommendation="Apply skew handling techniques to rebalance data",
             expected_improvement="Up to 80% reduction in job time by eliminating stragglers",
@@ -796,12 +1032,16 @@ class SparkJobAnalyzer:
         )
 
     def _recommend_memory_tuning(self, metrics: SparkJobMetrics, gc_ratio: float) -> OptimizationRecommendation:
+        if metrics.executor_run_time_ms:
+            basis, total_ms = "task run time", metrics.executor_run_time_ms
+        else:
+            basis, total_ms = "execution time", metrics.duration_ms
         return OptimizationRecommendation(
             category="memory",
             severity="high",
             title="High GC Overhead",
-            description=f"GC time is {gc_ratio * 100:.1f}% of total execution time.",
-            current_issue=f"GC time: {metrics.gc_time_ms / 1000:.1f}s out of {metrics.duration_ms / 1000:.1f}s total",
+            description=f"GC time is {gc_ratio * 100:.1f}% of total {basis}.",
+            current_issue=f"GC time: {metrics.gc_time_ms / 1000:.1f}s out of {total_ms / 1000:.1f}s total {basis}",
             recommendation="Tune memory settings to reduce garbage collection",
             expected_improvement="20-50% faster execution with proper memory config",
             implementation="""Memory tuning options:
@@ -902,6 +1142,277 @@ class SparkJobAnalyzer:
         )
 
 
+# =============================================================================
+# Spark Event Log Ingestion
+# =============================================================================
+
+class TaskDurationSketch:
+    """Log-bucketed histogram of task durations (~1% relative error, a few hundred buckets at most)"""
+
+    GROWTH = 1.02
+    _LOG_GROWTH = math.log(GROWTH)
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = defaultdict(int)
+        self.count = 0
+        self.max_ms = 0.0
+
+    def add(self, ms: float):
+        self.buckets[int(math.log(ms) / self._LOG_GROWTH) + 1 if ms >= 1 else 0] += 1
+        self.count += 1
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def quantile(self, q: float) -> float:
+        target = q * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= target:
+                return self.GROWTH ** (bucket - 0.5) if bucket else 0.5
+        return self.max_ms
+
+
+class _StageState:
+    __slots__ = ('job_id', 'durations')
+
+    def __init__(self, job_id: Optional[int]):
+        self.job_id = job_id
+        self.durations = TaskDurationSketch()
+
+
+class _JobState:
+    __slots__ = ('job_id', 'start_ms', 'end_ms', 'stage_ids', 'tasks', 'failed', 'speculative', 'gc_ms',
+                 'run_ms', 'peak_memory', 'input_bytes', 'output_bytes', 'shuffle_read', 'shuffle_write',
+                 'skew_ratio', 'skewed_stage')
+
+    def __init__(self, job_id: int, start_ms: int, stage_ids: List[int]):
+        self.job_id = job_id
+        self.start_ms = start_ms
+        self.end_ms = start_ms
+        self.stage_ids = stage_ids
+        self.tasks = self.failed = self.speculative = self.gc_ms = self.run_ms = self.peak_memory = 0
+        self.input_bytes = self.output_bytes = self.shuffle_read = self.shuffle_write = 0
+        self.skew_ratio = 1.0
+        self.skewed_stage = None
+
+
+class SparkEventLogIngester:
+    """Stream a Spark history event log into SparkJobMetrics, one job per SparkListenerJobStart.
+
+    Lines are read one at a time; events other than the few below are skipped before
+    JSON decoding. Task totals are folded into their job as they arrive and each running
+    stage keeps only a duration sketch, dropped when the stage completes, so memory is
+    bounded by concurrently running stages rather than by task count.
+    """
+
+    EVENTS = {
+        'SparkListenerApplicationStart', 'SparkListenerJobStart', 'SparkListenerJobEnd',
+        'SparkListenerStageCompleted', 'SparkListenerTaskEnd'
+    }
+    # Stages with fewer tasks give meaningless max/median ratios
+    MIN_SKEW_TASKS = 10
+
+    def __init__(self):
+        self.app_id = ''
+        self.jobs: Dict[int, _JobState] = {}
+        self.stages: Dict[int, _StageState] = {}
+        self.stage_to_job: Dict[int, int] = {}
+        self.finished: List[SparkJobMetrics] = []
+        self.last_ms = 0
+
+    def ingest(self, lines: Iterator[str]):
+        """Feed event-log lines; call once per rolling log part, then finish()"""
+        handlers = {
+            'SparkListenerApplicationStart': self._on_app_start,
+            'SparkListenerJobStart': self._on_job_start,
+            'SparkListenerJobEnd': self._on_job_end,
+            'SparkListenerStageCompleted': self._on_stage_completed,
+            'SparkListenerTaskEnd': self._on_task_end,
+        }
+        for line in lines:
+            if line.startswith('{"Event":"'):
+                name = line[10:line.find('"', 10)]
+                if name not in self.EVENTS:
+                    continue
+            elif not line.strip():
+                continue
+            try:
+                event = json.loads(line)
+            except ValueError:
+                logger.debug(f"Skipping malformed event line: {line[:80]}")
+                continue
+            handler = handlers.get(event.get('Event'))
+            if handler:
+                handler(event)
+
+    def finish(self) -> List[SparkJobMetrics]:
+        """Close out jobs still running at end of log (e.g. a crashed application)"""
+        for stage_id in list(self.stages):
+            self._close_stage(stage_id)
+        for job_id in list(self.jobs):
+            self._close_job(job_id, self.last_ms)
+        return self.finished
+
+    def _on_app_start(self, event: Dict):
+        self.app_id = event.get('App ID') or event.get('App Name') or ''
+
+    def _on_job_start(self, event: Dict):
+        job_id = event['Job ID']
+        stage_ids = event.get('Stage IDs') or [s['Stage ID'] for s in event.get('Stage Infos', [])]
+        start = event.get('Submission Time', self.last_ms)
+        self.last_ms = max(self.last_ms, start)
+        self.jobs[job_id] = _JobState(job_id, start, stage_ids)
+        for stage_id in stage_ids:
+            self.stage_to_job[stage_id] = job_id
+
+    def _on_job_end(self, event: Dict):
+        end = event.get('Completion Time', self.last_ms)
+        self.last_ms = max(self.last_ms, end)
+        job_id = event['Job ID']
+        job = self.jobs.get(job_id)
+        if job is None:
+            return
+        for stage_id in job.stage_ids:
+            if stage_id in self.stages:
+                self._close_stage(stage_id)
+            if self.stage_to_job.get(stage_id) == job_id:
+                del self.stage_to_job[stage_id]
+        self._close_job(job_id, end)
+
+    def _on_stage_completed(self, event: Dict):
+        stage_id = event.get('Stage Info', {}).get('Stage ID')
+        if stage_id in self.stages:
+            self._close_stage(stage_id)
+
+    def _on_task_end(self, event: Dict):
+        stage_id = event.get('Stage ID')
+        job = self.jobs.get(self.stage_to_job.get(stage_id))
+        if job is None:
+            return
+        info = event.get('Task Info', {})
+        metrics = event.get('Task Metrics') or {}
+
+        job.tasks += 1
+        if info.get('Failed') or event.get('Task End Reason', {}).get('Reason', 'Success') != 'Success':
+            job.failed += 1
+        if info.get('Speculative'):
+            job.speculative += 1
+        job.gc_ms += metrics.get('JVM GC Time', 0)
+        job.run_ms += metrics.get('Executor Run Time', 0)
+        job.peak_memory = max(job.peak_memory, metrics.get('Peak Execution Memory', 0))
+        job.input_bytes += metrics.get('Input Metrics', {}).get('Bytes Read', 0)
+        job.output_bytes += metrics.get('Output Metrics', {}).get('Bytes Written', 0)
+        shuffle_read = metrics.get('Shuffle Read Metrics', {})
+        job.shuffle_read += shuffle_read.get('Remote Bytes Read', 0) + shuffle_read.get('Local Bytes Read', 0)
+        job.shuffle_write += metrics.get('Shuffle Write Metrics', {}).get('Shuffle Bytes Written', 0)
+
+        finish = info.get('Finish Time', 0)
+        self.last_ms = max(self.last_ms, finish)
+        launch = info.get('Launch Time')
+        if launch and finish >= launch:
+            stage = self.stages.get(stage_id)
+            if stage is None:
+                stage = self.stages[stage_id] = _StageState(job.job_id)
+            stage.durations.add(finish - launch)
+
+    def _close_stage(self, stage_id: int):
+        stage = self.stages.pop(stage_id)
+        job = self.jobs.get(stage.job_id)
+        sketch = stage.durations
+        if job is None or sketch.count < self.MIN_SKEW_TASKS:
+            return
+        ratio = sketch.max_ms / max(sketch.quantile(0.5), 1.0)
+        if ratio > job.skew_ratio:
+            job.skew_ratio = ratio
+            job.skewed_stage = stage_id
+
+    def _close_job(self, job_id: int, end_ms: int):
+        job = self.jobs.pop(job_id)
+        self.finished.append(SparkJobMetrics(
+            job_id=f"{self.app_id}:{job_id}" if self.app_id else str(job_id),
+            duration_ms=max(0, end_ms - job.start_ms),
+            stages=len(job.stage_ids),
+            tasks=job.tasks,
+            shuffle_read_bytes=job.shuffle_read,
+            shuffle_write_bytes=job.shuffle_write,
+            input_bytes=job.input_bytes,
+            output_bytes=job.output_bytes,
+            peak_memory_bytes=job.peak_memory,
+            gc_time_ms=job.gc_ms,
+            failed_tasks=job.failed,
+            speculative_tasks=job.speculative,
+            skew_ratio=round(job.skew_ratio, 2),
+            skewed_stage=job.skewed_stage,
+            executor_run_time_ms=job.run_ms
+        ))
+
+
+def open_event_log(path: Path):
+    """Open an event log (plain, .gz, or .zst/.zstd) for line-by-line text reading"""
+    suffix = path.suffix.lower()
+    if suffix == '.gz':
+        return gzip.open(path, 'rt', encoding='utf-8', errors='replace')
+    if suffix in ('.zst', '.zstd'):
+        try:
+            from compression import zstd  # Python 3.14+
+            return zstd.open(path, 'rt', encoding='utf-8', errors='replace')
+        except ImportError:
+            pass
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError(f"{path.name}: reading zstd event logs needs Python 3.14+ "
+                             f"or 'pip install zstandard'") from None
+        raw = zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+        return io.TextIOWrapper(raw, encoding='utf-8', errors='replace')
+    if suffix in ('.lz4', '.snappy', '.lzf'):
+        raise ValueError(f"{path.name}: {suffix[1:]} event logs are not supported; "
+                         f"set spark.eventLog.compression.codec=zstd or decompress first")
+    return open(path, 'r', encoding='utf-8', errors='replace')
+
+
+def is_event_log(path: Path) -> bool:
+    """Event logs are JSON lines starting with an "Event" key; summaries are a JSON document"""
+    if path.is_dir() or path.suffix.lower() in ('.gz', '.zst', '.zstd'):
+        return True
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        first = f.readline()
+    try:
+        event = json.loads(first)
+    except ValueError:
+        return False
+    return isinstance(event, dict) and 'Event' in event
+
+
+def expand_event_logs(path: Path) -> List[List[Path]]:
+    """Applications under `path`, each as its ordered list of (rolling) event log parts"""
+    def part_index(p: Path) -> int:
+        match = re.match(r'events_(\d+)_', p.name)
+        return int(match.group(1)) if match else 0
+
+    if path.is_file():
+        return [[path]]
+    if path.name.startswith('eventlog_v2_'):
+        return [sorted((p for p in path.iterdir() if p.name.startswith('events_')), key=part_index)]
+    apps = []
+    for child in sorted(path.iterdir()):
+        if child.name.startswith('.') or child.name.endswith('.inprogress.crc'):
+            continue
+        if child.is_dir() or not child.name.endswith('.crc'):
+            apps.extend(expand_event_logs(child))
+    return apps
+
+
+def _ingest_application(parts: List[Path]) -> List[SparkJobMetrics]:
+    """Ingest one application's event log (worker entry point)"""
+    ingester = SparkEventLogIngester()
+    for part in parts:
+        with open_event_log(part) as lines:
+            ingester.ingest(lines)
+    return ingester.finish()
+
+
 # =============================================================================
 # Partition Strategy Advisor
 # =============================================================================
@@ -1299,6 +1810,79 @@ class ReportGenerator:
 
         return "\n".join(lines)
 
+    def generate_workload_text_report(self, families: List[QueryFamily], statements: int,
+                                      cost_label: str, top: int = 20) -> str:
+        """Generate a text report of the heaviest query families"""
+        total_impact = sum(f.impact for f in families) or 1.0
+        lines = []
+        lines.append("=" * 80)
+        lines.append("SQL WORKLOAD ANALYSIS REPORT")
+        lines.append("=" * 80)
+        lines.append(f"\nGenerated: {datetime.now().isoformat()}")
+        lines.append(f"Statements: {statements:,}")
+        lines.append(f"Query families: {len(families):,} (each parsed once)")
+        lines.append(f"Cost basis: {cost_label}")
+
+        lines.append("\n" + "-" * 80)
+        lines.append(f"TOP {min(top, len(families))} QUERY FAMILIES BY FREQUENCY x COST")
+        lines.append("-" * 80)
+        for i, family in enumerate(families[:top], 1):
+            info = family.query_info
+            share = family.impact / total_impact * 100
+            lines.append(f"\n{i}. {family.fingerprint}  {family.count:,} runs x {family.unit_cost:.4g} "
+                         f"= {family.impact:,.4g} ({share:.1f}%)")
+            lines.append(f"   {info.query_type} | complexity {info.estimated_complexity} | "
+                         f"tables: {', '.join(sorted(info.tables)) or 'None'}")
+            if family.observed_count:
+                lines.append(f"   Observed: avg {family.observed_ms / family.observed_count:,.1f} ms "
+                             f"over {family.observed_count:,} logged runs")
+            shape = family.normalized if len(family.normalized) <= 160 else family.normalized[:157] + '...'
+            lines.append(f"   Shape: {shape}")
+            if family.recommendations:
+                lines.append(f"   Issues: {'; '.join(r.title for r in family.recommendations)}")
+
+        aggregated = WorkloadAnalyzer.aggregate_recommendations(families)
+        if aggregated:
+            lines.append("\n" + "-" * 80)
+            lines.append("RECOMMENDATIONS BY WORKLOAD IMPACT")
+            lines.append("-" * 80)
+            for i, entry in enumerate(aggregated, 1):
+                share = entry['impact'] / total_impact * 100
+                lines.append(f"\n{i}. [{entry['severity'].upper()}] {entry['title']} - {share:.1f}% of workload cost")
+                lines.append(f"   {entry['families']:,} families, {entry['executions']:,} executions")
+                lines.append(f"   {entry['recommendation']}")
+
+        lines.append("\n" + "=" * 80)
+        return "\n".join(lines)
+
+    def generate_workload_json_report(self, families: List[QueryFamily], statements: int,
+                                      cost_label: str, top: int = 20) -> Dict:
+        """Generate a JSON report of the heaviest query families"""
+        return {
+            "report_type": "sql_workload_analysis",
+            "generated_at": datetime.now().isoformat(),
+            "statements": statements,
+            "families": len(families),
+            "cost_basis": cost_label,
+            "top_families": [
+                {
+                    "fingerprint": f.fingerprint,
+                    "count": f.count,
+                    "unit_cost": f.unit_cost,
+                    "impact": f.impact,
+                    "observed_avg_ms": f.observed_ms / f.observed_count if f.observed_count else None,
+                    "query_type": f.query_info.query_type,
+                    "complexity": f.query_info.estimated_complexity,
+                    "tables": sorted(f.query_info.tables),
+                    "normalized": f.normalized,
+                    "example": f.example,
+                    "recommendations": [r.title for r in f.recommendations]
+                }
+                for f in families[:top]
+            ],
+            "recommendations": WorkloadAnalyzer.aggregate_recommendations(families)
+        }
+
     def generate_json_report(self, query_info: SQLQueryInfo,
                             recommendations: List[OptimizationRecommendation],
                             cost_estimate: Optional[CostEstimate] = None) -> Dict:
@@ -1375,39 +1959,95 @@ def cmd_analyze_sql(args):
         print(output)
 
 
-def cmd_analyze_spark(args):
-    """Analyze Spark job metrics"""
-    with open(args.input, 'r') as f:
-        metrics_data = json.load(f)
+def cmd_analyze_workload(args):
+    """Fingerprint a statement workload and rank query families by frequency x cost"""
+    data_stats = None
+    if args.stats:
+        with open(args.stats, 'r') as f:
+            data_stats = json.load(f)
+
+    analyzer = WorkloadAnalyzer(warehouse=args.warehouse, data_stats=data_stats,
+                                workers=args.workers or os.cpu_count() or 1)
+    families = analyzer.analyze(WorkloadReader().iter_statements(args.inputs))
+    logger.info(f"Fingerprinted {analyzer.statements:,} statements into {len(families):,} query families")
 
-    # Handle both single job and array of jobs
-    if isinstance(metrics_data, list):
-        jobs = metrics_data
+    if not families:
+        logger.error("No SQL statements found")
+        sys.exit(1)
+
+    cost_label = (f"estimated {args.warehouse} USD per run" if args.warehouse
+                  else "relative complexity weight per run")
+    reporter = ReportGenerator()
+
+    if args.json:
+        report = reporter.generate_workload_json_report(families, analyzer.statements, cost_label, args.top)
+        output = json.dumps(report, indent=2)
     else:
-        jobs = [metrics_data]
+        output = reporter.generate_workload_text_report(families, analyzer.statements, cost_label, args.top)
 
-    all_recommendations = []
-    analyzer = SparkJobAnalyzer()
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+        logger.info(f"Report saved to {args.output}")
+    else:
+        print(output)
 
-    for job_data in jobs:
-        metrics = SparkJobMetrics(
-            job_id=job_data.get('jobId', 'unknown'),
-            duration_ms=job_data.get('duration', 0),
-            stages=job_data.get('numStages', 0),
-            tasks=job_data.get('numTasks', 0),
-            shuffle_read_bytes=job_data.get('shuffleReadBytes', 0),
-            shuffle_write_bytes=job_data.get('shuffleWriteBytes', 0),
-            input_bytes=job_data.get('inputBytes', 0),
-            output_bytes=job_data.get('outputBytes', 0),
-            peak_memory_bytes=job_data.get('peakMemoryBytes', 0),
-            gc_time_ms=job_data.get('gcTime', 0),
-            failed_tasks=job_data.get('failedTasks', 0),
-            speculative_tasks=job_data.get('speculativeTasks', 0),
-            skew_ratio=job_data.get('skewRatio', 1.0)
-        )
 
-        recommendations = analyzer.analyze(metrics)
-        all_recommendations.extend(recommendations)
+def _spark_metrics_from_summary(job_data: Dict) -> SparkJobMetrics:
+    """Map a pre-summarized job record (camelCase keys) to SparkJobMetrics"""
+    return SparkJobMetrics(
+        job_id=job_data.get('jobId', 'unknown'),
+        duration_ms=job_data.get('duration', 0),
+        stages=job_data.get('numStages', 0),
+        tasks=job_data.get('numTasks', 0),
+        shuffle_read_bytes=job_data.get('shuffleReadBytes', 0),
+        shuffle_write_bytes=job_data.get('shuffleWriteBytes', 0),
+        input_bytes=job_data.get('inputBytes', 0),
+        output_bytes=job_data.get('outputBytes', 0),
+        peak_memory_bytes=job_data.get('peakMemoryBytes', 0),
+        gc_time_ms=job_data.get('gcTime', 0),
+        failed_tasks=job_data.get('failedTasks', 0),
+        speculative_tasks=job_data.get('speculativeTasks', 0),
+        skew_ratio=job_data.get('skewRatio', 1.0),
+        executor_run_time_ms=job_data.get('executorRunTime', 0)
+    )
+
+
+def cmd_analyze_spark(args):
+    """Analyze Spark job metrics from summary JSON files and/or raw event logs"""
+    jobs: List[SparkJobMetrics] = []
+    applications: List[List[Path]] = []
+    for name in args.inputs:
+        path = Path(name)
+        if not path.exists():
+            logger.error(f"Input not found: {path}")
+            sys.exit(1)
+        if is_event_log(path):
+            applications.extend(expand_event_logs(path))
+            continue
+        with open(path, 'r') as f:
+            metrics_data = json.load(f)
+        # Handle both single job and array of jobs
+        for job_data in metrics_data if isinstance(metrics_data, list) else [metrics_data]:
+            jobs.append(_spark_metrics_from_summary(job_data))
+
+    workers = min(args.workers or os.cpu_count() or 1, max(1, len(applications)))
+    try:
+        if workers > 1:
+            with ProcessPoolExecutor(workers) as pool:
+                for app_jobs in pool.map(_ingest_application, applications):
+                    jobs.extend(app_jobs)
+        else:
+            for parts in applications:
+                jobs.extend(_ingest_application(parts))
+    except (OSError, ValueError, EOFError) as e:
+        logger.error(f"Failed to read event log: {e}")
+        sys.exit(1)
+
+    all_recommendations = []
+    analyzer = SparkJobAnalyzer()
+    for metrics in jobs:
+        all_recommendations.extend(analyzer.analyze(metrics))
 
     # Deduplicate similar recommendations
     unique_recs = []
@@ -1425,9 +2065,19 @@ def cmd_analyze_spark(args):
         lines.append("=" * 60)
         lines.append("SPARK JOB OPTIMIZATION REPORT")
         lines.append("=" * 60)
+        if applications:
+            lines.append(f"\nEvent Logs Ingested: {len(applications)}")
         lines.append(f"\nJobs Analyzed: {len(jobs)}")
         lines.append(f"Recommendations: {len(unique_recs)}")
 
+        if applications and jobs:
+            lines.append("\nSlowest Jobs:")
+            for job in sorted(jobs, key=lambda j: j.duration_ms, reverse=True)[:10]:
+                skew = f"skew {job.skew_ratio:.1f}x" + (f" (stage {job.skewed_stage})"
+                                                         if job.skewed_stage is not None else "")
+                lines.append(f"  {job.job_id}: {job.duration_ms / 1000:.1f}s, {job.stages} stages, "
+                             f"{job.tasks} tasks, {skew}")
+
         for i, rec in enumerate(unique_recs, 1):
             lines.append(f"\n{i}. [{rec.severity.upper()}] {rec.title}")
             lines.append(f"   {rec.description}")
@@ -1602,6 +2252,9 @@ Examples:
   # Analyze with cost estimate
   python etl_performance_optimizer.py analyze-sql query.sql --warehouse bigquery
 
+  # Rank the heaviest query families in a warehouse query log
+  python etl_performance_optimizer.py analyze-workload query_history.csv --warehouse snowflake --top 25
+
   # Analyze Spark job metrics
   python etl_performance_optimizer.py analyze-spark spark-history.json
 
@@ -1630,9 +2283,27 @@ Examples:
     sql_parser.add_argument('--json', action='store_true', help='Output as JSON')
     sql_parser.set_defaults(func=cmd_analyze_sql)
 
+    # Analyze workload command
+    workload_parser = subparsers.add_parser('analyze-workload', help='Rank query families in a SQL workload')
+    workload_parser.add_argument('inputs', nargs='+',
+                                 help='SQL files, directories of .sql files, or query logs (.csv/.json/.jsonl)')
+    workload_parser.add_argument('--warehouse', '-w', choices=['bigquery', 'snowflake', 'redshift', 'databricks'],
+                                 help='Weight families by estimated warehouse cost')
+    workload_parser.add_argument('--stats', '-s', help='Data statistics JSON file')
+    workload_parser.add_argument('--workers', '-j', type=int, default=0,
+                                 help='Worker processes (default: CPU count)')
+    workload_parser.add_argument('--top', type=int, default=20, help='Families to report (default: 20)')
+    workload_parser.add_argument('--output', '-o', help='Output file')
+    workload_parser.add_argument('--json', action='store_true', help='Output as JSON')
+    workload_parser.set_defaults(func=cmd_analyze_workload)
+
     # Analyze Spark command
     spark_parser = subparsers.add_parser('analyze-spark', help='Analyze Spark job metrics')
-    spark_parser.add_argument('input', help='Spark metrics JSON file')
+    spark_parser.add_argument('inputs', nargs='+',
+                              help='Spark metrics JSON files, or raw event logs / event log directories '
+                                   '(plain, .gz, .zst; rolling eventlog_v2_* directories supported)')
+    spark_parser.add_argument('--workers', '-j', type=int, default=0,
+                              help='Event logs to ingest in parallel (default: CPU count)')
     spark_parser.add_argument('--output', '-o', help='Output file')
     spark_parser.add_argument('--json', action='store_true', help='Output as JSON')
     spark_parser.set_defaults(func=cmd_analyze_spark)
@@ -0,0 +1,56 @@
+"""Tests for the Spark event-log ingestion in etl_performance_optimizer.py"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from etl_performance_optimizer import SparkJobAnalyzer, _ingest_application  # noqa: E402
+
+
+def _write_event_log(path: Path, tasks_per_stage: int = 200, stages: int = 2):
+    """One job whose stages each run `tasks_per_stage` 100ms tasks with 1ms of GC, 50 at a time"""
+    events = [
+        {'Event': 'SparkListenerApplicationStart', 'App Name': 'synthetic', 'App ID': 'app-1'},
+        {'Event': 'SparkListenerJobStart', 'Job ID': 0, 'Submission Time': 0,
+         'Stage IDs': list(range(stages))},
+    ]
+    clock = 0
+    for stage_id in range(stages):
+        for task in range(tasks_per_stage):
+            launch = clock + (task // 50) * 100
+            events.append({
+                'Event': 'SparkListenerTaskEnd', 'Stage ID': stage_id,
+                'Task End Reason': {'Reason': 'Success'},
+                'Task Info': {'Launch Time': launch, 'Finish Time': launch + 100},
+                'Task Metrics': {'Executor Run Time': 100, 'JVM GC Time': 1},
+            })
+        clock += (tasks_per_stage // 50) * 100
+        events.append({'Event': 'SparkListenerStageCompleted', 'Stage Info': {'Stage ID': stage_id}})
+    events.append({'Event': 'SparkListenerJobEnd', 'Job ID': 0, 'Completion Time': clock})
+    path.write_text(''.join(json.dumps(e, separators=(',', ':')) + '\n' for e in events))
+
+
+def test_ingest_application_sums_task_metrics(tmp_path):
+    log = tmp_path / 'app-1'
+    _write_event_log(log)
+
+    [job] = _ingest_application([log])
+
+    assert job.job_id == 'app-1:0'
+    assert job.tasks == 400
+    assert job.duration_ms == 800
+    assert job.gc_time_ms == 400
+    assert job.executor_run_time_ms == 40_000
+
+
+def test_parallel_tasks_do_not_inflate_gc_share(tmp_path):
+    log = tmp_path / 'app-1'
+    _write_event_log(log)
+
+    [job] = _ingest_application([log])
+    titles = [r.title for r in SparkJobAnalyzer().analyze(job)]
+
+    # 400ms of GC over 40s of task time is 1%, though it is half the 800ms wall clock
+    assert 'High GC Overhead' not in titles
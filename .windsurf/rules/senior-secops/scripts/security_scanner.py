@@ -3,6 +3,8 @@
 Security Scanner - Scan source code for security vulnerabilities.
 
 Table of Contents:
+    PatternEngine - Compiles every rule once and scans a file's lines in one pass
+    FindingsCache - Engine hits per file content hash, persisted between runs
     SecurityScanner - Main class for security scanning
         __init__         - Initialize with target path and options
         scan()           - Run all security scans
@@ -11,6 +13,7 @@ Table of Contents:
         scan_xss()       - Detect XSS vulnerabilities
         scan_command_injection() - Detect command injection
         scan_path_traversal() - Detect path traversal
+        _collect_files() - Pruned os.scandir walk, or git-changed files with --since
         _scan_file()     - Scan individual file for patterns
         _calculate_severity() - Calculate finding severity
     main() - CLI entry point
@@ -19,6 +22,8 @@ Usage:
     python security_scanner.py /path/to/project
     python security_scanner.py /path/to/project --severity high
     python security_scanner.py /path/to/project --output report.json --json
+    python security_scanner.py /path/to/project --jobs 8 --cache
+    python security_scanner.py /path/to/project --since origin/main
 """
 
 import os
@@ -26,11 +31,20 @@ import sys
 import json
 import re
 import argparse
+import hashlib
+import subprocess
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
 
 @dataclass
 class SecurityFinding:
@@ -46,6 +60,221 @@ class SecurityFinding:
     recommendation: str
 
 
+def _case_fold_table() -> Dict[int, str]:
+    """
+    Length-preserving str.translate table: ASCII letters to lowercase, plus the few non-ASCII
+    characters re.IGNORECASE treats as ASCII letters (e.g. U+017F LONG S matches 's').
+    """
+    table = {ord(c): c.lower() for c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'}
+    for char in re.findall('[a-z]', ''.join(map(chr, range(0x80, 0x10000))), re.IGNORECASE):
+        table[ord(char)] = next(a for a in 'abcdefghijklmnopqrstuvwxyz' if re.fullmatch(a, char, re.IGNORECASE))
+    return table
+
+
+_CASE_FOLD = _case_fold_table()
+# Non-ASCII characters str.lower() leaves (or makes) different from their _CASE_FOLD letter
+_FOLD_EXTRA = [(chr(code), letter) for code, letter in _CASE_FOLD.items()
+               if code >= 0x80 and chr(code).lower() != letter]
+
+
+def _fold(content: str) -> str:
+    """Case-fold `content` for keyword matching without changing its length."""
+    folded = content.lower()
+    if content.isascii():
+        return folded
+    if len(folded) != len(content):  # e.g. U+0130 lowercases to two characters
+        return content.translate(_CASE_FOLD)
+    for char, letter in _FOLD_EXTRA:
+        if char in folded:
+            folded = folded.replace(char, letter)
+    return folded
+
+
+def _required_literals(pattern: str, flags: int = 0) -> Optional[Set[str]]:
+    """
+    Lowercase literals of which any match of `pattern` must contain at least one.
+
+    Returns None when no such set can be derived (the rule then bypasses the prefilter).
+    """
+    def walk(items) -> Optional[Set[str]]:
+        candidates = []
+        run = ''
+        for op, av in items:
+            if op is sre_parse.LITERAL:
+                run += chr(av).lower()
+                continue
+            if run:
+                candidates.append({run})
+                run = ''
+            sub = None
+            if op is sre_parse.SUBPATTERN:
+                sub = walk(av[-1])
+            elif op is sre_parse.BRANCH:
+                alternatives = [walk(branch) for branch in av[1]]
+                if all(alternatives):
+                    sub = set().union(*alternatives)
+            elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] >= 1:
+                sub = walk(av[2])
+            if sub:
+                candidates.append(sub)
+        if run:
+            candidates.append({run})
+        if not candidates:
+            return None
+        # Prefer the set whose shortest literal is longest (most selective)
+        return max(candidates, key=lambda c: min(len(lit) for lit in c))
+
+    try:
+        literals = walk(sre_parse.parse(pattern, flags))
+    except re.error:
+        return None
+    # Only ASCII literals can be matched against the _CASE_FOLD-translated text
+    if not literals or not all(lit and lit.isascii() for lit in literals):
+        return None
+    return literals
+
+
+class PatternEngine:
+    """
+    Compile a rule list once and scan text against all of it.
+
+    Every literal some rule requires is combined into one alternation that is run once over
+    the case-folded content. Each hit names the keyword found and its line, and a keyword ->
+    rules table decides which rules are searched on that line; a line matching several rules
+    still yields every match, exactly as searching each rule separately would.
+
+    (An alternation of the full rules is not used as the gate: CPython's re cannot apply the
+    per-rule literal-prefix scan across alternatives, which makes it slower than the rules.)
+    """
+
+    def __init__(self, patterns: List[str], flags: int = re.IGNORECASE):
+        self.patterns = patterns
+        self.flags = flags
+        self.rules: List[Tuple[int, re.Pattern, Optional[Set[str]]]] = []
+        for index, pattern in enumerate(patterns):
+            try:
+                compiled = re.compile(pattern, flags)
+            except re.error:
+                continue
+            self.rules.append((index, compiled, _required_literals(pattern, flags)))
+
+        self.keywords = None
+        self.dispatch: Dict[str, List[int]] = {}
+        if self.rules and all(literals for _, _, literals in self.rules):
+            keywords = sorted(set().union(*(literals for _, _, literals in self.rules)), key=len, reverse=True)
+            # Searching again from each hit's start + 1 reports every start position, longest
+            # keyword first; any shorter literal starting there is a prefix of the reported one
+            self.keywords = re.compile('|'.join(re.escape(k) for k in keywords))
+            self.dispatch = {
+                keyword: [position for position, (_, _, literals) in enumerate(self.rules)
+                          if any(keyword.startswith(lit) for lit in literals)]
+                for keyword in keywords
+            }
+
+    def scan(self, content: str, lines: List[str]) -> Iterator[Tuple[int, int, re.Match]]:
+        """Yield (line index, rule index, match) for every rule matching each line of `content`."""
+        if self.keywords is None:
+            for line_index, line in enumerate(lines):
+                for index, regex, _ in self.rules:
+                    match = regex.search(line)
+                    if match:
+                        yield line_index, index, match
+            return
+
+        starts = []
+        offset = 0
+        for line in lines:
+            starts.append(offset)
+            offset += len(line) + 1
+        found: Dict[int, Set[str]] = {}
+        folded = _fold(content)
+        hit = self.keywords.search(folded)
+        while hit:
+            found.setdefault(bisect_right(starts, hit.start()) - 1, set()).add(hit.group())
+            hit = self.keywords.search(folded, hit.start() + 1)
+
+        for line_index in sorted(found):
+            line = lines[line_index]
+            positions = sorted(set().union(*(self.dispatch[keyword] for keyword in found[line_index])))
+            for position in positions:
+                index, regex, _ = self.rules[position]
+                match = regex.search(line)
+                if match:
+                    yield line_index, index, match
+
+
+class FindingsCache:
+    """
+    Engine hits per file, persisted between runs.
+
+    Entries are keyed by a hash of the file's bytes and stamped with a digest of the rule set,
+    so an edited file or an edited rule is rescanned. Only the raw hits are stored: false
+    positive filtering and severity depend on the file's path and are always re-applied.
+    """
+
+    def __init__(self, path: Path, version: str):
+        self.path = path
+        self.version = version
+        self.entries: Dict[str, List] = {}
+        self.used: Dict[str, List] = {}
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            if data.get('version') == version:
+                self.entries = data['entries']
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def save(self, prune: bool = True):
+        """
+        Persist the cache; with `prune`, keep only entries seen this run.
+
+        Pruning lets deleted or changed files age out, so it only makes sense after a
+        full-tree scan; a partial (--since) run merges into the existing entries.
+        """
+        entries = self.used if prune else {**self.entries, **self.used}
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        try:
+            with open(tmp, 'w') as f:
+                json.dump({'version': self.version, 'entries': entries}, f, separators=(',', ':'))
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"Warning: could not write cache {self.path}: {e}", file=sys.stderr)
+
+
+def _engine_hits(file_path: Path, engine: PatternEngine,
+                 cached: Optional[Dict[str, List]]) -> Tuple[Optional[str], List]:
+    """
+    Read one file and return (cache key, hits) with hits as [line index, rule index, line].
+
+    On a read error the key is None and the error message is returned in place of the hits.
+    """
+    try:
+        data = file_path.read_bytes()
+    except OSError as e:
+        return None, str(e)
+    key = hashlib.blake2b(data, digest_size=16).hexdigest()
+    if cached is not None and key in cached:
+        return key, cached[key]
+    # Decode exactly as read_text() would, including universal newlines
+    content = data.decode('utf-8', errors='ignore').replace('\r\n', '\n').replace('\r', '\n')
+    lines = content.split('\n')
+    return key, [[line_index, rule_index, lines[line_index]]
+                 for line_index, rule_index, _ in engine.scan(content, lines)]
+
+
+_WORKER = {}
+
+
+def _init_worker(patterns: List[str], flags: int, cached: Optional[Dict[str, List]]):
+    _WORKER['engine'] = PatternEngine(patterns, flags)
+    _WORKER['cached'] = cached
+
+
+def _engine_hits_task(file_path: Path) -> Tuple[Optional[str], List]:
+    return _engine_hits(file_path, _WORKER['engine'], _WORKER['cached'])
+
+
 class SecurityScanner:
     """Scan source code for security vulnerabilities."""
 
@@ -130,11 +359,17 @@ class SecurityScanner:
          'Path.join with user input without validation'),
     ]
 
+    # Default findings cache file, relative to the scanned directory
+    CACHE_FILE = '.security_scanner.cache'
+
     def __init__(
         self,
         target_path: str,
         severity_threshold: str = "low",
-        verbose: bool = False
+        verbose: bool = False,
+        jobs: int = 1,
+        cache_path: Optional[str] = None,
+        since: Optional[str] = None
     ):
         """
         Initialize the security scanner.
@@ -143,13 +378,43 @@ class SecurityScanner:
             target_path: Directory or file to scan
             severity_threshold: Minimum severity to report (critical, high, medium, low)
             verbose: Enable verbose output
+            jobs: Number of processes to scan files with
+            cache_path: Findings cache file; None disables caching
+            since: Only scan files changed since this git revision
         """
         self.target_path = Path(target_path)
         self.severity_threshold = severity_threshold
         self.verbose = verbose
+        self.jobs = max(1, jobs)
+        self.cache_path = cache_path
+        self.since = since
         self.findings: List[SecurityFinding] = []
         self.files_scanned = 0
         self.severity_order = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3, 'info': 4}
+        self._rules, self._engine = self._build_engine()
+
+    def _ruleset_version(self) -> str:
+        """Digest of the compiled rules; any rule change invalidates cached hits."""
+        spec = json.dumps([self._engine.flags, self._engine.patterns])
+        return hashlib.sha256(spec.encode()).hexdigest()[:16]
+
+    def _build_engine(self) -> Tuple[List[Tuple[int, str, str, str, str]], PatternEngine]:
+        """Flatten every category's patterns, in scan order, into one engine."""
+        categories = [
+            (self.SECRET_PATTERNS, 'secrets', 'Hardcoded Secret', 'critical'),
+            (self.SQL_INJECTION_PATTERNS, 'injection', 'SQL Injection', 'high'),
+            (self.XSS_PATTERNS, 'xss', 'Cross-Site Scripting (XSS)', 'high'),
+            (self.COMMAND_INJECTION_PATTERNS, 'injection', 'Command Injection', 'critical'),
+            (self.PATH_TRAVERSAL_PATTERNS, 'path-traversal', 'Path Traversal', 'medium'),
+        ]
+        rules = []
+        patterns_in_order = []
+        for category_index, (patterns, category, title, default_severity) in enumerate(categories):
+            for pattern_tuple in patterns:
+                description = pattern_tuple[1] if len(pattern_tuple) > 1 else title
+                rules.append((category_index, category, title, default_severity, description))
+                patterns_in_order.append(pattern_tuple[0])
+        return rules, PatternEngine(patterns_in_order)
 
     def scan(self) -> Dict:
         """
@@ -168,13 +433,35 @@ class SecurityScanner:
         start_time = datetime.now()
 
         # Collect files to scan
-        files_to_scan = self._collect_files()
+        try:
+            files_to_scan = self._collect_files()
+        except (ValueError, OSError) as e:
+            return {"status": "error", "message": str(e)}
         print(f"Files to scan: {len(files_to_scan)}")
 
-        # Run scans
-        for file_path in files_to_scan:
-            self._scan_file(file_path)
+        cache = None
+        if self.cache_path:
+            cache = FindingsCache(Path(self.cache_path), self._ruleset_version())
+        cached = cache.entries if cache else None
+
+        # Run scans; hits are applied in file order so rule ids stay sequential
+        if self.jobs > 1 and len(files_to_scan) > 1:
+            with ProcessPoolExecutor(
+                self.jobs, initializer=_init_worker,
+                initargs=(self._engine.patterns, self._engine.flags, cached)
+            ) as pool:
+                chunksize = max(1, len(files_to_scan) // (self.jobs * 8))
+                results = list(pool.map(_engine_hits_task, files_to_scan, chunksize=chunksize))
+        else:
+            results = (_engine_hits(f, self._engine, cached) for f in files_to_scan)
+
+        for file_path, (key, hits) in zip(files_to_scan, results):
+            if key is not None and cache:
+                cache.used[key] = hits
+            self._scan_file(file_path, key, hits)
             self.files_scanned += 1
+        if cache:
+            cache.save(prune=not self.since)
 
         # Filter by severity threshold
         threshold_level = self.severity_order.get(self.severity_threshold, 3)
@@ -207,123 +494,104 @@ class SecurityScanner:
 
     def _collect_files(self) -> List[Path]:
         """Collect files to scan."""
-        files = []
-
         if self.target_path.is_file():
             return [self.target_path]
+        if self.since:
+            return self._changed_files()
 
-        for root, dirs, filenames in os.walk(self.target_path):
-            # Skip directories
-            dirs[:] = [d for d in dirs if d not in self.SKIP_DIRS]
+        files = []
+        stack = [str(self.target_path)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            subdirs = []
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        # Skip directories before descending into them; like os.walk,
+                        # symlinked directories are not followed
+                        if entry.name not in self.SKIP_DIRS and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in self.SCAN_EXTENSIONS:
+                        files.append(Path(entry.path))
+                except OSError:
+                    continue
+            # Same top-down order as os.walk
+            stack.extend(reversed(subdirs))
 
-            for filename in filenames:
-                file_path = Path(root) / filename
-                if file_path.suffix.lower() in self.SCAN_EXTENSIONS:
-                    files.append(file_path)
+        return files
 
+    def _changed_files(self) -> List[Path]:
+        """Files changed since `self.since` (plus untracked files), filtered like a full walk."""
+        def git(*args) -> List[str]:
+            result = subprocess.run(['git', '-C', str(self.target_path), *args],
+                                    capture_output=True, text=True)
+            if result.returncode != 0:
+                raise ValueError(result.stderr.strip() or f"git {' '.join(args)} failed")
+            return [line for line in result.stdout.splitlines() if line]
+
+        names = git('diff', '--name-only', '--relative', self.since, '--') + \
+            git('ls-files', '--others', '--exclude-standard')
+        files = []
+        for name in dict.fromkeys(names):
+            path = self.target_path / name
+            if self.SKIP_DIRS.intersection(Path(name).parts[:-1]):
+                continue
+            if path.suffix.lower() in self.SCAN_EXTENSIONS and path.is_file():
+                files.append(path)
         return files
 
-    def _scan_file(self, file_path: Path):
-        """Scan a single file for security issues."""
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            lines = content.split('\n')
-
-            relative_path = str(file_path.relative_to(self.target_path) if self.target_path.is_dir() else file_path.name)
-
-            # Scan for secrets
-            self._scan_patterns(
-                lines, relative_path,
-                self.SECRET_PATTERNS,
-                'secrets',
-                'Hardcoded Secret',
-                'critical'
-            )
+    def _scan_file(self, file_path: Path, key: Optional[str], hits):
+        """Turn one file's engine hits (or read error) into findings."""
+        if key is None:
+            if self.verbose:
+                print(f"  Error scanning {file_path}: {hits}")
+            return
 
-            # Scan for SQL injection
-            self._scan_patterns(
-                lines, relative_path,
-                [(p[0], p[1]) for p in self.SQL_INJECTION_PATTERNS],
-                'injection',
-                'SQL Injection',
-                'high'
-            )
+        relative_path = str(file_path.relative_to(self.target_path) if self.target_path.is_dir() else file_path.name)
 
-            # Scan for XSS
-            self._scan_patterns(
-                lines, relative_path,
-                [(p[0], p[1]) for p in self.XSS_PATTERNS],
-                'xss',
-                'Cross-Site Scripting (XSS)',
-                'high'
-            )
+        self._apply_hits(hits, relative_path)
 
-            # Scan for command injection
-            self._scan_patterns(
-                lines, relative_path,
-                [(p[0], p[1]) for p in self.COMMAND_INJECTION_PATTERNS],
-                'injection',
-                'Command Injection',
-                'critical'
-            )
+        if self.verbose:
+            print(f"  Scanned: {relative_path}")
 
-            # Scan for path traversal
-            self._scan_patterns(
-                lines, relative_path,
-                [(p[0], p[1]) for p in self.PATH_TRAVERSAL_PATTERNS],
-                'path-traversal',
-                'Path Traversal',
-                'medium'
-            )
+    def _apply_hits(self, hits: List, file_path: str):
+        """Apply engine hits to findings, ordered by category, then line, then pattern."""
+        hits = sorted(
+            (self._rules[rule_index][0], line_index, rule_index, line)
+            for line_index, rule_index, line in hits
+        )
 
-            if self.verbose:
-                print(f"  Scanned: {relative_path}")
+        for _, line_index, rule_index, line in hits:
+            _, category, title, default_severity, description = self._rules[rule_index]
 
-        except Exception as e:
-            if self.verbose:
-                print(f"  Error scanning {file_path}: {e}")
+            # Check for false positives (comments, test files)
+            if self._is_false_positive(line, file_path):
+                continue
 
-    def _scan_patterns(
-        self,
-        lines: List[str],
-        file_path: str,
-        patterns: List[Tuple],
-        category: str,
-        title: str,
-        default_severity: str
-    ):
-        """Scan lines for patterns."""
-        for line_num, line in enumerate(lines, 1):
-            for pattern_tuple in patterns:
-                pattern = pattern_tuple[0]
-                description = pattern_tuple[1] if len(pattern_tuple) > 1 else title
+            # Determine severity based on context
+            severity = self._calculate_severity(
+                default_severity,
+                file_path,
+                category
+            )
 
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    # Check for false positives (comments, test files)
-                    if self._is_false_positive(line, file_path):
-                        continue
-
-                    # Determine severity based on context
-                    severity = self._calculate_severity(
-                        default_severity,
-                        file_path,
-                        category
-                    )
-
-                    finding = SecurityFinding(
-                        rule_id=f"{category}-{len(self.findings) + 1:04d}",
-                        severity=severity,
-                        category=category,
-                        title=title,
-                        description=description,
-                        file_path=file_path,
-                        line_number=line_num,
-                        code_snippet=line.strip()[:100],
-                        recommendation=self._get_recommendation(category)
-                    )
-
-                    self.findings.append(finding)
+            finding = SecurityFinding(
+                rule_id=f"{category}-{len(self.findings) + 1:04d}",
+                severity=severity,
+                category=category,
+                title=title,
+                description=description,
+                file_path=file_path,
+                line_number=line_index + 1,
+                code_snippet=line.strip()[:100],
+                recommendation=self._get_recommendation(category)
+            )
+
+            self.findings.append(finding)
 
     def _is_false_positive(self, line: str, file_path: str) -> bool:
         """Check if finding is likely a false positive."""
@@ -409,6 +677,8 @@ Examples:
   %(prog)s /path/to/project --severity high
   %(prog)s /path/to/project --output report.json --json
   %(prog)s /path/to/file.py --verbose
+  %(prog)s /path/to/project --jobs 8 --cache
+  %(prog)s /path/to/project --since origin/main --cache
         """
     )
 
@@ -436,16 +706,44 @@ Examples:
         "--output", "-o",
         help="Output file path"
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Scan files across N processes (default: 1)"
+    )
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const=SecurityScanner.CACHE_FILE,
+        metavar="PATH",
+        help=f"Reuse results for unchanged files (default: <target>/{SecurityScanner.CACHE_FILE})"
+    )
+    parser.add_argument(
+        "--since",
+        metavar="GIT_REV",
+        help="Only scan files changed since a git revision (plus untracked files)"
+    )
 
     args = parser.parse_args()
 
+    cache_path = args.cache
+    if cache_path == SecurityScanner.CACHE_FILE and Path(args.target).is_dir():
+        cache_path = str(Path(args.target) / SecurityScanner.CACHE_FILE)
+
     scanner = SecurityScanner(
         target_path=args.target,
         severity_threshold=args.severity,
-        verbose=args.verbose
+        verbose=args.verbose,
+        jobs=args.jobs or os.cpu_count() or 1,
+        cache_path=cache_path,
+        since=args.since
     )
 
     result = scanner.scan()
+    if result.get('status') == 'error':
+        print(f"Error: {result['message']}")
+        sys.exit(1)
 
     if args.json:
         output = json.dumps(result, indent=2)
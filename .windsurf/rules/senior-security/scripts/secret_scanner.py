@@ -9,19 +9,30 @@ Usage:
     python secret_scanner.py /path/to/project
     python secret_scanner.py /path/to/file.py
     python secret_scanner.py /path/to/project --format json
+    python secret_scanner.py /path/to/project --jobs 8 --cache
+    python secret_scanner.py /path/to/project --since HEAD --cache
     python secret_scanner.py --list-patterns
 """
 
 import argparse
+import hashlib
 import json
 import os
 import re
+import subprocess
 import sys
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from enum import Enum
 
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
 
 class Severity(Enum):
     CRITICAL = "critical"
@@ -246,79 +257,393 @@ SECRET_PATTERNS = [
 ]
 
 
+# Scanning engine: every pattern is compiled once and each file is scanned in one pass
+
+def _case_fold_table() -> Dict[int, str]:
+    """
+    Length-preserving str.translate table: ASCII letters to lowercase, plus the few non-ASCII
+    characters re.IGNORECASE treats as ASCII letters (e.g. U+017F LONG S matches 's').
+    """
+    table = {ord(c): c.lower() for c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'}
+    for char in re.findall('[a-z]', ''.join(map(chr, range(0x80, 0x10000))), re.IGNORECASE):
+        table[ord(char)] = next(a for a in 'abcdefghijklmnopqrstuvwxyz' if re.fullmatch(a, char, re.IGNORECASE))
+    return table
+
+
+_CASE_FOLD = _case_fold_table()
+# Non-ASCII characters str.lower() leaves (or makes) different from their _CASE_FOLD letter
+_FOLD_EXTRA = [(chr(code), letter) for code, letter in _CASE_FOLD.items()
+               if code >= 0x80 and chr(code).lower() != letter]
+
+
+def _fold(content: str) -> str:
+    """Case-fold `content` for keyword matching without changing its length."""
+    folded = content.lower()
+    if content.isascii():
+        return folded
+    if len(folded) != len(content):  # e.g. U+0130 lowercases to two characters
+        return content.translate(_CASE_FOLD)
+    for char, letter in _FOLD_EXTRA:
+        if char in folded:
+            folded = folded.replace(char, letter)
+    return folded
+
+
+def _required_literals(pattern: str, flags: int = 0) -> Optional[Set[str]]:
+    """
+    Lowercase literals of which any match of `pattern` must contain at least one.
+
+    Returns None when no such set can be derived (the rule then bypasses the prefilter).
+    """
+    def walk(items) -> Optional[Set[str]]:
+        candidates = []
+        run = ''
+        for op, av in items:
+            if op is sre_parse.LITERAL:
+                run += chr(av).lower()
+                continue
+            if run:
+                candidates.append({run})
+                run = ''
+            sub = None
+            if op is sre_parse.SUBPATTERN:
+                sub = walk(av[-1])
+            elif op is sre_parse.BRANCH:
+                alternatives = [walk(branch) for branch in av[1]]
+                if all(alternatives):
+                    sub = set().union(*alternatives)
+            elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] >= 1:
+                sub = walk(av[2])
+            if sub:
+                candidates.append(sub)
+        if run:
+            candidates.append({run})
+        if not candidates:
+            return None
+        # Prefer the set whose shortest literal is longest (most selective)
+        return max(candidates, key=lambda c: min(len(lit) for lit in c))
+
+    try:
+        literals = walk(sre_parse.parse(pattern, flags))
+    except re.error:
+        return None
+    # Only ASCII literals can be matched against the _CASE_FOLD-translated text
+    if not literals or not all(lit and lit.isascii() for lit in literals):
+        return None
+    return literals
+
+
+class PatternEngine:
+    """
+    All secret patterns compiled once, scanned in a single pass per file.
+
+    The literals each pattern requires are joined into one keyword alternation run over the
+    case-folded file; each keyword hit maps (via a keyword -> patterns table) to the patterns
+    worth searching on that line. Every pattern that matches a line is still reported.
+    """
+
+    def __init__(self, patterns: List[str], flags: int = re.IGNORECASE):
+        self.rules: List[Tuple[int, re.Pattern, Optional[Set[str]]]] = []
+        for index, pattern in enumerate(patterns):
+            try:
+                compiled = re.compile(pattern, flags)
+            except re.error:
+                continue
+            self.rules.append((index, compiled, _required_literals(pattern, flags)))
+
+        self.keywords = None
+        self.dispatch: Dict[str, List[int]] = {}
+        if self.rules and all(literals for _, _, literals in self.rules):
+            keywords = sorted(set().union(*(literals for _, _, literals in self.rules)), key=len, reverse=True)
+            # Searching again from each hit's start + 1 reports every start position, longest
+            # keyword first; any shorter literal starting there is a prefix of the reported one
+            self.keywords = re.compile('|'.join(re.escape(k) for k in keywords))
+            self.dispatch = {
+                keyword: [position for position, (_, _, literals) in enumerate(self.rules)
+                          if any(keyword.startswith(lit) for lit in literals)]
+                for keyword in keywords
+            }
+
+    def scan(self, content: str, lines: List[str]) -> Iterator[Tuple[int, int, re.Match]]:
+        """Yield (line index, rule index, match) for every rule matching each line of `content`."""
+        if self.keywords is None:
+            for line_index, line in enumerate(lines):
+                for index, regex, _ in self.rules:
+                    match = regex.search(line)
+                    if match:
+                        yield line_index, index, match
+            return
+
+        starts = []
+        offset = 0
+        for line in lines:
+            starts.append(offset)
+            offset += len(line) + 1
+        found: Dict[int, Set[str]] = {}
+        folded = _fold(content)
+        hit = self.keywords.search(folded)
+        while hit:
+            found.setdefault(bisect_right(starts, hit.start()) - 1, set()).add(hit.group())
+            hit = self.keywords.search(folded, hit.start() + 1)
+
+        for line_index in sorted(found):
+            line = lines[line_index]
+            positions = sorted(set().union(*(self.dispatch[keyword] for keyword in found[line_index])))
+            for position in positions:
+                index, regex, _ = self.rules[position]
+                match = regex.search(line)
+                if match:
+                    yield line_index, index, match
+
+
+_ENGINES: Dict[Tuple[str, ...], PatternEngine] = {}
+
+
+def get_engine(patterns: List[SecretPattern]) -> PatternEngine:
+    """Compiled engine for a pattern list, built once per distinct list."""
+    key = tuple(p.pattern_id for p in patterns)
+    engine = _ENGINES.get(key)
+    if engine is None:
+        engine = _ENGINES[key] = PatternEngine([p.regex for p in patterns])
+    return engine
+
+
 def scan_file(file_path: Path, patterns: List[SecretPattern]) -> List[SecretFinding]:
     """Scan a single file for secrets."""
-    findings = []
     extension = file_path.suffix.lower()
+    applicable = [p for p in patterns if extension in p.file_extensions]
+    if not applicable:
+        return []
 
     try:
         content = file_path.read_text(encoding='utf-8', errors='ignore')
-        lines = content.split('\n')
     except Exception:
-        return findings
+        return []
+    return scan_content(file_path, content, applicable)
 
-    for pattern in patterns:
-        if extension not in pattern.file_extensions:
+
+def scan_content(file_path: Path, content: str, applicable: List[SecretPattern]) -> List[SecretFinding]:
+    """Scan already-read file content against the patterns applicable to its extension."""
+    findings = []
+    lines = content.split('\n')
+
+    hits = []
+    for line_index, index, match in get_engine(applicable).scan(content, lines):
+        # Skip comments that explain patterns (like in this file)
+        lower = lines[line_index].lower()
+        if 'regex' in lower or 'pattern' in lower:
             continue
+        hits.append((index, line_index, match))
+
+    # Report in pattern order, then line order
+    hits.sort(key=lambda hit: (hit[0], hit[1]))
+    for index, line_index, match in hits:
+        pattern = applicable[index]
+
+        # Mask the actual secret for safety
+        matched = match.group(0)
+        if len(matched) > 20:
+            masked = matched[:10] + "..." + matched[-5:]
+        else:
+            masked = matched[:5] + "..."
+
+        findings.append(SecretFinding(
+            pattern_id=pattern.pattern_id,
+            name=pattern.name,
+            severity=pattern.severity,
+            file_path=str(file_path),
+            line_number=line_index + 1,
+            matched_text=masked,
+            recommendation=pattern.recommendation
+        ))
 
-        try:
-            regex = re.compile(pattern.regex, re.IGNORECASE)
+    return findings
 
-            for i, line in enumerate(lines, 1):
-                # Skip comments that explain patterns (like in this file)
-                if 'regex' in line.lower() or 'pattern' in line.lower():
-                    continue
 
-                match = regex.search(line)
-                if match:
-                    # Mask the actual secret for safety
-                    matched = match.group(0)
-                    if len(matched) > 20:
-                        masked = matched[:10] + "..." + matched[-5:]
-                    else:
-                        masked = matched[:5] + "..."
-
-                    findings.append(SecretFinding(
-                        pattern_id=pattern.pattern_id,
-                        name=pattern.name,
-                        severity=pattern.severity,
-                        file_path=str(file_path),
-                        line_number=i,
-                        matched_text=masked,
-                        recommendation=pattern.recommendation
-                    ))
-        except re.error:
+# Files and directories
+DEFAULT_EXCLUDE_DIRS = [
+    "node_modules", ".git", "__pycache__", "venv", ".venv",
+    "dist", "build", ".next", "vendor", ".idea", ".vscode"
+]
+ENV_FILE_NAMES = ['.env', '.env.local', '.env.production']
+MAX_FILE_SIZE = 1_000_000  # Skip binary files and large files
+DEFAULT_CACHE_FILE = '.secret_scanner.cache'
+
+
+def _is_candidate(name: str, size: int, extensions: set) -> bool:
+    return (os.path.splitext(name)[1].lower() in extensions or name in ENV_FILE_NAMES) and size <= MAX_FILE_SIZE
+
+
+def iter_files(dir_path: Path, extensions: set, exclude_dirs: List[str]) -> Iterator[Path]:
+    """
+    Walk `dir_path` with os.scandir, never descending into excluded directories.
+
+    Files are yielded in the same pre-order as Path.rglob("*"), so reports stay in a stable order.
+    """
+    excluded = set(exclude_dirs)
+    stack = [str(dir_path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in excluded:
+                        subdirs.append(entry.path)
+                elif entry.is_file() and _is_candidate(entry.name, entry.stat().st_size, extensions):
+                    yield Path(entry.path)
+            except OSError:
+                continue
+        stack.extend(reversed(subdirs))
+
+
+def changed_files(dir_path: Path, since: str, extensions: set, exclude_dirs: List[str]) -> List[Path]:
+    """Files under `dir_path` changed since git revision `since`, plus untracked files."""
+    def git(*args) -> List[str]:
+        result = subprocess.run(['git', '-C', str(dir_path), *args], capture_output=True, text=True)
+        if result.returncode != 0:
+            raise ValueError(result.stderr.strip() or f"git {' '.join(args)} failed")
+        return [line for line in result.stdout.splitlines() if line]
+
+    names = git('diff', '--name-only', '--relative', since, '--') + \
+        git('ls-files', '--others', '--exclude-standard')
+    excluded = set(exclude_dirs)
+    files = []
+    for name in dict.fromkeys(names):
+        path = dir_path / name
+        if excluded.intersection(Path(name).parts[:-1]) or not path.is_file():
             continue
+        if _is_candidate(path.name, path.stat().st_size, extensions):
+            files.append(path)
+    return files
+
+
+def ruleset_version(patterns: List[SecretPattern]) -> str:
+    """Digest of the pattern set; any rule change invalidates cached results."""
+    spec = [[p.pattern_id, p.regex, p.severity.value, p.file_extensions] for p in patterns]
+    return hashlib.sha256(json.dumps(spec).encode()).hexdigest()[:16]
+
+
+class FindingsCache:
+    """Per-file findings persisted between runs, keyed by extension + content hash."""
 
+    def __init__(self, path: Path, version: str):
+        self.path = path
+        self.version = version
+        self.entries: Dict[str, List] = {}
+        self.used: Dict[str, List] = {}
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            if data.get('version') == version:
+                self.entries = data['entries']
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def save(self, prune: bool = True):
+        """Persist the cache; with `prune`, keep only entries seen this run.
+
+        Pruning lets deleted or changed files age out, so it only makes sense after a
+        full-tree scan; a partial (--since) run merges into the existing entries.
+        """
+        entries = self.used if prune else {**self.entries, **self.used}
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        try:
+            with open(tmp, 'w') as f:
+                json.dump({'version': self.version, 'entries': entries}, f, separators=(',', ':'))
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"Warning: could not write cache {self.path}: {e}", file=sys.stderr)
+
+
+def _scan_cached(file_path: Path, patterns: List[SecretPattern],
+                 cached: Optional[Dict[str, List]]) -> Tuple[Optional[str], List]:
+    """Scan one file, reusing `cached` rows when its content hash is known.
+
+    Returns (cache key, rows) where a row is [pattern_id, line_number, matched_text].
+    """
+    extension = file_path.suffix.lower()
+    applicable = [p for p in patterns if extension in p.file_extensions]
+    if not applicable:
+        return None, []
+    try:
+        data = file_path.read_bytes()
+    except OSError:
+        return None, []
+    key = f"{extension}:{hashlib.blake2b(data, digest_size=16).hexdigest()}"
+    if cached is not None and key in cached:
+        return key, cached[key]
+    # Decode exactly as read_text() would, including universal newlines
+    content = data.decode('utf-8', errors='ignore').replace('\r\n', '\n').replace('\r', '\n')
+    rows = [[f.pattern_id, f.line_number, f.matched_text] for f in scan_content(file_path, content, applicable)]
+    return key, rows
+
+
+_WORKER = {}
+
+
+def _init_worker(patterns: List[SecretPattern], cached: Optional[Dict[str, List]]):
+    _WORKER['patterns'] = patterns
+    _WORKER['cached'] = cached
+
+
+def _scan_task(file_path: Path) -> Tuple[Optional[str], List]:
+    return _scan_cached(file_path, _WORKER['patterns'], _WORKER['cached'])
+
+
+def scan_paths(files: List[Path], patterns: List[SecretPattern], jobs: int = 1,
+               cache: Optional[FindingsCache] = None) -> List[SecretFinding]:
+    """Scan `files` (optionally across `jobs` processes and through a findings cache)."""
+    cached = cache.entries if cache else None
+    if jobs > 1 and len(files) > 1:
+        with ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(patterns, cached)) as pool:
+            results = list(pool.map(_scan_task, files, chunksize=max(1, len(files) // (jobs * 8))))
+    else:
+        results = [_scan_cached(f, patterns, cached) for f in files]
+
+    by_id = {p.pattern_id: p for p in patterns}
+    findings = []
+    for file_path, (key, rows) in zip(files, results):
+        if key is None:
+            continue
+        if cache:
+            cache.used[key] = rows
+        for pattern_id, line_number, matched_text in rows:
+            pattern = by_id[pattern_id]
+            findings.append(SecretFinding(
+                pattern_id=pattern_id,
+                name=pattern.name,
+                severity=pattern.severity,
+                file_path=str(file_path),
+                line_number=line_number,
+                matched_text=matched_text,
+                recommendation=pattern.recommendation
+            ))
     return findings
 
 
 def scan_directory(dir_path: Path, patterns: List[SecretPattern],
-                   exclude_dirs: List[str] = None) -> List[SecretFinding]:
-    """Scan all files in a directory for secrets."""
+                   exclude_dirs: List[str] = None, jobs: int = 1,
+                   cache: Optional[FindingsCache] = None, since: Optional[str] = None) -> List[SecretFinding]:
+    """Scan all files in a directory (or only those changed since a git revision) for secrets."""
     if exclude_dirs is None:
-        exclude_dirs = [
-            "node_modules", ".git", "__pycache__", "venv", ".venv",
-            "dist", "build", ".next", "vendor", ".idea", ".vscode"
-        ]
+        exclude_dirs = DEFAULT_EXCLUDE_DIRS
 
-    findings = []
     extensions = set()
     for pattern in patterns:
         extensions.update(pattern.file_extensions)
 
-    for file_path in dir_path.rglob("*"):
-        if file_path.is_file():
-            # Check exclusions
-            if any(excluded in file_path.parts for excluded in exclude_dirs):
-                continue
-
-            # Skip binary files and large files
-            if file_path.stat().st_size > 1_000_000:  # 1MB limit
-                continue
-
-            if file_path.suffix.lower() in extensions or file_path.name in ['.env', '.env.local', '.env.production']:
-                findings.extend(scan_file(file_path, patterns))
+    if since:
+        files = changed_files(dir_path, since, extensions, exclude_dirs)
+    else:
+        files = list(iter_files(dir_path, extensions, exclude_dirs))
+    findings = scan_paths(files, patterns, jobs, cache)
+    if cache:
+        cache.save(prune=not since)
 
     return sorted(findings, key=lambda f: (
         0 if f.severity == Severity.CRITICAL else
@@ -436,6 +761,12 @@ Examples:
 
   # Save report to file
   python secret_scanner.py /path/to/project --output report.txt
+
+  # Pre-commit: only files changed since HEAD, reusing cached results
+  python secret_scanner.py . --since HEAD --cache
+
+  # Large repository across 8 processes
+  python secret_scanner.py /path/to/monorepo --jobs 8 --cache
         """
     )
 
@@ -464,6 +795,24 @@ Examples:
         choices=["critical", "high", "medium", "low"],
         help="Minimum severity to report"
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Scan files across N processes (default: 1)"
+    )
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const=DEFAULT_CACHE_FILE,
+        metavar="PATH",
+        help=f"Reuse findings for unchanged files (default: <path>/{DEFAULT_CACHE_FILE})"
+    )
+    parser.add_argument(
+        "--since",
+        metavar="GIT_REV",
+        help="Only scan files changed since a git revision (plus untracked files)"
+    )
 
     args = parser.parse_args()
 
@@ -491,7 +840,18 @@ Examples:
     if path.is_file():
         findings = scan_file(path, patterns)
     else:
-        findings = scan_directory(path, patterns)
+        cache = None
+        if args.cache:
+            cache_path = Path(args.cache)
+            if args.cache == DEFAULT_CACHE_FILE:
+                cache_path = path / DEFAULT_CACHE_FILE
+            cache = FindingsCache(cache_path, ruleset_version(patterns))
+        try:
+            findings = scan_directory(path, patterns, jobs=args.jobs or os.cpu_count() or 1,
+                                      cache=cache, since=args.since)
+        except (ValueError, OSError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
 
     # Format output
     if args.format == "json":
@@ -10,27 +10,92 @@ Usage:
     python debt_scanner.py /path/to/codebase
     python debt_scanner.py /path/to/codebase --config config.json
     python debt_scanner.py /path/to/codebase --output report.json --format both
+    python debt_scanner.py /path/to/codebase --jobs 8
 """
 
 import ast
+import hashlib
 import json
 import argparse
 import os
 import re
 import sys
+from array import array
 from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Set, Tuple
 
 
+# Duplicate detection: lines are normalized to tokens (so whitespace and formatting do not
+# matter), fingerprinted with a stable digest, and windows of fingerprints are hashed with a
+# Rabin-Karp rolling hash. Blank, comment-only, import and punctuation-only lines are not
+# significant and never start, end or break a duplicate.
+TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+WORD_RE = re.compile(r"\w")
+INSIGNIFICANT_LINE_RE = re.compile(
+    r"^(?:#(?!include)|//|/\*|\*|--|import\b|from\s+\S+\s+import\b|#include\b|using\b|package\b|require\b)"
+)
+ROLLING_MOD = (1 << 61) - 1
+ROLLING_BASE = 1_000_003
+MIN_DUPLICATE_CHARS = 50  # Only consider substantial blocks
+
+
+def _fingerprint_file(task: Tuple[str, int]) -> Tuple[array, array, array, array]:
+    """
+    Fingerprint one file for duplicate detection.
+
+    Returns (line fingerprints, their 1-based line numbers, window start indexes, window hashes)
+    for every run of `window` significant lines holding more than MIN_DUPLICATE_CHARS characters.
+    """
+    file_path, window = task
+    try:
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            lines = f.read().splitlines()
+    except OSError:
+        lines = []
+
+    fingerprints, line_numbers, lengths = [], array('i'), []
+    tokenize, insignificant, has_word = TOKEN_RE.findall, INSIGNIFICANT_LINE_RE.match, WORD_RE.search
+    blake2b = hashlib.blake2b
+    for line_number, line in enumerate(lines, 1):
+        stripped = line.strip()
+        if not stripped or insignificant(stripped) or not has_word(stripped):
+            continue
+        normalized = ' '.join(tokenize(stripped))
+        fingerprints.append(int.from_bytes(blake2b(normalized.encode(), digest_size=8).digest(), 'big'))
+        line_numbers.append(line_number)
+        lengths.append(len(normalized))
+
+    starts, hashes = array('i'), array('Q')
+    if len(fingerprints) >= window:
+        modulus, base = ROLLING_MOD, ROLLING_BASE
+        top = pow(base, window - 1, modulus)
+        rolling = chars = 0
+        for i in range(window - 1):
+            rolling = (rolling * base + fingerprints[i]) % modulus
+            chars += lengths[i]
+        for start in range(len(fingerprints) - window + 1):
+            end = start + window - 1
+            rolling = (rolling * base + fingerprints[end]) % modulus
+            chars += lengths[end]
+            if chars > MIN_DUPLICATE_CHARS:
+                starts.append(start)
+                hashes.append(rolling)
+            rolling = (rolling - fingerprints[start] * top) % modulus
+            chars -= lengths[start]
+    return array('Q', fingerprints), line_numbers, starts, hashes
+
+
 class DebtScanner:
     """Main scanner class for detecting technical debt in codebases."""
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, jobs: int = 1):
         self.config = self._load_default_config()
         if config:
             self.config.update(config)
+        self.jobs = max(1, jobs)
         
         self.debt_items = []
         self.stats = defaultdict(int)
@@ -276,39 +341,92 @@ class DebtScanner:
                 )
     
     def _detect_duplicates(self, directory: str):
-        """Detect duplicate code blocks across files."""
-        # Simple duplicate detection based on exact line matches
-        line_hashes = defaultdict(list)
-        
-        for file_path, file_info in self.file_stats.items():
-            try:
-                full_path = os.path.join(directory, file_path)
-                with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                
-                for i in range(len(lines) - self.config["min_duplicate_lines"] + 1):
-                    block = ''.join(lines[i:i + self.config["min_duplicate_lines"]])
-                    block_hash = hash(block.strip())
-                    if len(block.strip()) > 50:  # Only consider substantial blocks
-                        line_hashes[block_hash].append((file_path, i + 1, block))
-            except Exception:
-                continue
-        
-        # Report duplicates
-        for block_hash, occurrences in line_hashes.items():
-            if len(occurrences) > 1:
-                for file_path, line_num, block in occurrences:
-                    self._add_debt_item(
-                        "duplicate_code",
-                        f"Duplicate code block found in {len(occurrences)} files",
-                        file_path,
-                        "medium",
-                        {
-                            "line_number": line_num,
-                            "duplicate_count": len(occurrences),
-                            "other_files": [f[0] for f in occurrences if f[0] != file_path]
-                        }
-                    )
+        """
+        Detect duplicate code blocks across files.
+        
+        Windows of `min_duplicate_lines` significant lines that share a rolling hash are grouped;
+        each later occurrence is paired with the group's first one, checked line by line and
+        extended both ways to the longest matching region. Pairs found on an already extended
+        region are skipped, and regions with the same first location and length are reported
+        together as one item listing every location.
+        """
+        window = max(1, self.config["min_duplicate_lines"])
+        files = list(self.file_stats)
+        tasks = [(os.path.join(directory, file_path), window) for file_path in files]
+        if self.jobs > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(self.jobs) as pool:
+                results = list(pool.map(_fingerprint_file, tasks, chunksize=max(1, len(tasks) // (self.jobs * 8))))
+        else:
+            results = [_fingerprint_file(task) for task in tasks]
+        
+        # Window hash -> packed (file index << 32 | window start); only repeats get a list
+        first_seen: Dict[int, int] = {}
+        repeated: Dict[int, List[int]] = {}
+        for file_index, (_, _, starts, hashes) in enumerate(results):
+            for start, window_hash in zip(starts, hashes):
+                packed = (file_index << 32) | start
+                seen = first_seen.setdefault(window_hash, packed)
+                if seen != packed:
+                    repeated.setdefault(window_hash, [seen]).append(packed)
+        first_seen.clear()
+        
+        # Extend every (first occurrence, later occurrence) pair into a maximal region,
+        # walking first occurrences in file/line order so extended regions are seen first
+        covered: Dict[Tuple[int, int, int], int] = {}
+        clone_classes: Dict[Tuple[int, int, int], List[Tuple[int, int]]] = {}
+        for occurrences in sorted(repeated.values(), key=lambda o: o[0]):
+            file_a, pos_a = occurrences[0] >> 32, occurrences[0] & 0xFFFFFFFF
+            prints_a = results[file_a][0]
+            for packed in occurrences[1:]:
+                file_b, pos_b = packed >> 32, packed & 0xFFFFFFFF
+                diagonal = (file_a, file_b, pos_b - pos_a)
+                if covered.get(diagonal, -1) >= pos_a + window:
+                    continue
+                # Within one file, a region may not run into its own copy
+                if file_a == file_b and pos_b < pos_a + window:
+                    continue
+                prints_b = results[file_b][0]
+                if prints_a[pos_a:pos_a + window] != prints_b[pos_b:pos_b + window]:
+                    continue  # Rolling hash collision
+                start_a, start_b, end_a, end_b = pos_a, pos_b, pos_a + window, pos_b + window
+                while start_a > 0 and start_b > 0 and prints_a[start_a - 1] == prints_b[start_b - 1] \
+                        and (file_a != file_b or start_b - 1 >= end_a):
+                    start_a -= 1
+                    start_b -= 1
+                limit_a = start_b if file_a == file_b else len(prints_a)
+                while end_a < limit_a and end_b < len(prints_b) and prints_a[end_a] == prints_b[end_b]:
+                    end_a += 1
+                    end_b += 1
+                covered[diagonal] = end_a
+                locations = clone_classes.setdefault((file_a, start_a, end_a - start_a), [(file_a, start_a)])
+                if (file_b, start_b) not in locations:
+                    locations.append((file_b, start_b))
+        
+        # Report one item per duplicated region, in file/line order
+        for (file_a, start_a, length), locations in sorted(clone_classes.items()):
+            spans = []
+            for file_index, start in locations:
+                line_numbers = results[file_index][1]
+                spans.append({
+                    "file_path": files[file_index],
+                    "start_line": line_numbers[start],
+                    "end_line": line_numbers[start + length - 1],
+                })
+            file_path = files[file_a]
+            self._add_debt_item(
+                "duplicate_code",
+                f"Duplicate code block ({length} lines) found in {len(spans)} places",
+                file_path,
+                "medium",
+                {
+                    "line_number": spans[0]["start_line"],
+                    "end_line": spans[0]["end_line"],
+                    "duplicate_lines": length,
+                    "duplicate_count": len(spans),
+                    "other_files": sorted({span["file_path"] for span in spans[1:]} - {file_path}),
+                    "locations": spans
+                }
+            )
     
     def _calculate_priorities(self):
         """Calculate priority scores for debt items."""
@@ -633,6 +751,8 @@ def main():
     parser.add_argument("--output", help="Output file path")
     parser.add_argument("--format", choices=["json", "text", "both"], 
                        default="both", help="Output format")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                       help="Fingerprint files for duplicate detection across N processes")
     
     args = parser.parse_args()
     
@@ -647,7 +767,7 @@ def main():
             sys.exit(1)
     
     # Run scan
-    scanner = DebtScanner(config)
+    scanner = DebtScanner(config, jobs=args.jobs or os.cpu_count() or 1)
     try:
         report = scanner.scan_directory(args.directory)
     except Exception as e:
@@ -3,6 +3,7 @@
 
 Within-deck: no skeleton slug > 2 cards. Cross-deck + within: near-duplicate text scan
 via normalized 3-word shingle Jaccard (>0.55 = same joke). Exit 1 on violations.
+--profile[=PATH] / --chrome-trace PATH: per-phase timing + memory trace (tools/instrument.py).
 """
 import json
 import re
@@ -11,6 +12,9 @@ from collections import Counter
 from itertools import combinations
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / 'tools'))
+from instrument import Profiler  # noqa: E402
+
 STOP = set('a an the i my your their our of to in at on for with and or is was would has have '
            'you they we it that this'.split())
 
@@ -21,29 +25,38 @@ def shingles(text: str) -> frozenset:
     return frozenset(tuple(words[i:i + 3]) for i in range(len(words) - 2))
 
 def main() -> int:
-    cards = []  # (deck, id, text, skeleton)
-    for path in sys.argv[1:]:
-        d = json.loads(Path(path).read_text())
-        for c in d.get('cards', []):
-            cards.append((d['deck'], c['id'], c.get('text', ''), c.get('skeleton', '')))
-    errs = []
-    per_deck: dict[str, Counter] = {}
-    for deck, _cid, _text, skel in cards:
-        per_deck.setdefault(deck, Counter())[skel] += 1
-    for deck, counts in per_deck.items():
-        for skel, n in counts.items():
-            if n > 2:
-                errs.append(f'{deck}: skeleton "{skel}" used {n}x (budget 2)')
-    shingled = [(deck, cid, shingles(text)) for deck, cid, text, _ in cards]
-    for (d1, id1, s1), (d2, id2, s2) in combinations(shingled, 2):
-        if not s1 or not s2:
-            continue
-        inter = len(s1 & s2)
-        if inter == 0:
-            continue
-        j = inter / len(s1 | s2)
-        if j > 0.55:
-            errs.append(f'near-duplicate ({j:.2f}): {d1}/{id1} ~ {d2}/{id2}')
+    prof = Profiler.from_argv('dedup_skeletons')
+    try:
+        cards = []  # (deck, id, text, skeleton)
+        for path in sys.argv[1:]:
+            with prof.phase('parse', path=path) as ph:
+                d = json.loads(Path(path).read_text())
+                for c in d.get('cards', []):
+                    cards.append((d['deck'], c['id'], c.get('text', ''), c.get('skeleton', '')))
+                ph.items = len(d.get('cards', []))
+        errs = []
+        with prof.phase('skeleton_budget', items=len(cards)):
+            per_deck: dict[str, Counter] = {}
+            for deck, _cid, _text, skel in cards:
+                per_deck.setdefault(deck, Counter())[skel] += 1
+            for deck, counts in per_deck.items():
+                for skel, n in counts.items():
+                    if n > 2:
+                        errs.append(f'{deck}: skeleton "{skel}" used {n}x (budget 2)')
+        with prof.phase('shingle', items=len(cards)):
+            shingled = [(deck, cid, shingles(text)) for deck, cid, text, _ in cards]
+        with prof.phase('pair_compare', items=len(cards) * (len(cards) - 1) // 2):
+            for (d1, id1, s1), (d2, id2, s2) in combinations(shingled, 2):
+                if not s1 or not s2:
+                    continue
+                inter = len(s1 & s2)
+                if inter == 0:
+                    continue
+                j = inter / len(s1 | s2)
+                if j > 0.55:
+                    errs.append(f'near-duplicate ({j:.2f}): {d1}/{id1} ~ {d2}/{id2}')
+    finally:
+        prof.finish()
     if errs:
         print(f'FAIL: {len(errs)} dedup violations')
         for e in errs[:50]:
@@ -3,12 +3,16 @@
 
 Checks: schema shape, chaos>=3, E/C in 1..5, text<=120 chars, register vocabulary,
 per-deck required extras, banlist regexes, id uniqueness+format, {NAME} above E3 heuristic.
+--profile[=PATH] / --chrome-trace PATH: per-phase timing + memory trace (tools/instrument.py).
 """
 import json
 import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / 'tools'))
+from instrument import Profiler  # noqa: E402
+
 REGISTERS = {'observational', 'absurdist', 'deadpan', 'menace', 'petty-domestic',
              'gross', 'physical', 'parody', 'table-aware', 'euphemism'}
 EXTRAS = {
@@ -30,10 +34,24 @@ def load_banlist() -> list[re.Pattern]:
             pats.append(re.compile(line, re.I))
     return pats
 
-def lint(path: str, bans: list[re.Pattern]) -> list[str]:
+def lint(path: str, bans: list[re.Pattern], prof: Profiler | None = None) -> list[str]:
+    # A caller-supplied profiler is finished by the caller; one made here is ours to finish
+    own = prof is None
+    if own:
+        prof = Profiler('lint_deck')
     errs: list[str] = []
-    d = json.loads(Path(path).read_text())
-    deck = d.get('deck', '?')
+    try:
+        with prof.phase('parse', path=path):
+            d = json.loads(Path(path).read_text())
+        deck = d.get('deck', '?')
+        with prof.phase('check', items=len(d.get('cards', [])), deck=deck):
+            _check(d, deck, bans, errs)
+    finally:
+        if own:
+            prof.finish()
+    return errs
+
+def _check(d: dict, deck: str, bans: list[re.Pattern], errs: list[str]) -> None:
     if d.get('schema') != 3:
         errs.append(f'{deck}: schema != 3')
     ids: set[str] = set()
@@ -73,23 +91,27 @@ def lint(path: str, bans: list[re.Pattern]) -> list[str]:
             errs.append(f'{loc}: taboo needs exactly 5 forbidden words')
         if deck == 'scatter' and len(str(c.get('category', '')).split()) > 7:
             errs.append(f'{loc}: category > 7 words')
-    return errs
 
 def main() -> int:
-    bans = load_banlist()
-    failed = False
-    for path in sys.argv[1:]:
-        errs = lint(path, bans)
-        n = len(json.loads(Path(path).read_text()).get('cards', []))
-        if errs:
-            failed = True
-            print(f'FAIL {path} ({n} cards, {len(errs)} violations):')
-            for e in errs[:40]:
-                print(f'  - {e}')
-            if len(errs) > 40:
-                print(f'  ... +{len(errs) - 40} more')
-        else:
-            print(f'OK   {path} ({n} cards)')
+    prof = Profiler.from_argv('lint_deck')
+    try:
+        with prof.phase('load_banlist'):
+            bans = load_banlist()
+        failed = False
+        for path in sys.argv[1:]:
+            errs = lint(path, bans, prof)
+            n = len(json.loads(Path(path).read_text()).get('cards', []))
+            if errs:
+                failed = True
+                print(f'FAIL {path} ({n} cards, {len(errs)} violations):')
+                for e in errs[:40]:
+                    print(f'  - {e}')
+                if len(errs) > 40:
+                    print(f'  ... +{len(errs) - 40} more')
+            else:
+                print(f'OK   {path} ({n} cards)')
+    finally:
+        prof.finish()
     return 1 if failed else 0
 
 if __name__ == '__main__':
@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""room_load.py — drive hundreds of full-roster rooms against a live RoomDO (spec Part 3).
+
+The load twin of bots.ts: where the bots play ONE night end-to-end, this harness parks
+many rooms in LOBBY with full rosters and hammers the transport half of the wire table
+(protocol.ts): HEARTBEAT, PING/PONG clock sync, RESYNC storms and FIRE taps. It records
+per-message latency histograms, broadcast fan-out time and every ERR code (ROOM_FULL,
+BAD_INPUT, ...) so we know the per-DO capacity before launch nights.
+
+Stdlib only (asyncio + a minimal RFC 6455 client) so it runs anywhere python3 does.
+
+RUN:
+  terminal 1:  pnpm dev                                   # wrangler dev on :8787
+  terminal 2:  python3 test/room_load.py --rooms 200 --players 16 --duration 60
+               --out load.json                            # machine-readable report
+
+Latencies are measured on this machine's clock. The PING one-way figure compares the
+server's `sv` stamp with local receive time, so it is only meaningful against a local
+`wrangler dev` sharing this host's clock.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import math
+import os
+import random
+import ssl
+import sys
+import time
+import urllib.request
+from collections import Counter
+from urllib.parse import urlsplit
+
+HEARTBEAT_S = 15.0  # bots.ts HEARTBEAT_MS
+CONNECT_TIMEOUT_S = 10.0
+SETTLE_TIMEOUT_S = 10.0  # wait for the whole room to observe each JOIN broadcast
+MAX_FRAME = 1 << 20
+WS_GUID = b'258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+POOL = ['HOST', 'ASH', 'BLAZE', 'CINDER', 'EMBER', 'SOOT', 'GRIME', 'RASH', 'MOLD', 'BILE',
+        'SCAB', 'CRUD', 'LYE', 'TAR', 'SLAG', 'CHAR']
+
+
+# ===== latency histogram =====
+class Histogram:
+    """Log-bucketed latency histogram (ms): ~2% relative error, fixed memory, mergeable."""
+
+    GROWTH = 1.02
+    FLOOR_MS = 0.01
+
+    def __init__(self) -> None:
+        self.counts: Counter = Counter()
+        self.n = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, ms: float) -> None:
+        ms = max(ms, self.FLOOR_MS)
+        self.counts[int(math.log(ms / self.FLOOR_MS, self.GROWTH))] += 1
+        self.n += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    def percentile(self, p: float) -> float:
+        if self.n == 0:
+            return 0.0
+        rank = max(1, math.ceil(self.n * p / 100))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(self.FLOOR_MS * self.GROWTH ** (bucket + 1), self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        return {
+            'n': self.n,
+            'mean_ms': round(self.total / self.n, 2) if self.n else 0.0,
+            'p50_ms': round(self.percentile(50), 2),
+            'p90_ms': round(self.percentile(90), 2),
+            'p99_ms': round(self.percentile(99), 2),
+            'max_ms': round(self.max, 2),
+        }
+
+
+class Stats:
+    """Run-wide counters. Single event loop, so no locking."""
+
+    def __init__(self) -> None:
+        self.latency: dict[str, Histogram] = {}
+        self.sent: Counter = Counter()
+        self.received: Counter = Counter()
+        self.errors: Counter = Counter()  # ERR codes from the server + transport failures
+        self.rooms_ok = 0
+        self.rooms_failed = 0
+
+    def observe(self, name: str, ms: float) -> None:
+        self.latency.setdefault(name, Histogram()).record(ms)
+
+    def report(self, elapsed: float) -> dict:
+        return {
+            'elapsed_s': round(elapsed, 2),
+            'rooms': {'ok': self.rooms_ok, 'failed': self.rooms_failed},
+            'sent': dict(self.sent),
+            'received': dict(self.received),
+            'errors': dict(self.errors),
+            'latency': {k: h.summary() for k, h in sorted(self.latency.items())},
+        }
+
+
+# ===== minimal WebSocket client (RFC 6455, text frames only) =====
+class WebSocketClosed(Exception):
+    pass
+
+
+class WebSocket:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.closed = False
+
+    @classmethod
+    async def connect(cls, url: str) -> 'WebSocket':
+        parts = urlsplit(url)
+        secure = parts.scheme == 'wss'
+        port = parts.port or (443 if secure else 80)
+        reader, writer = await asyncio.open_connection(
+            parts.hostname, port, ssl=ssl.create_default_context() if secure else None)
+        key = base64.b64encode(os.urandom(16))
+        path = parts.path + (f'?{parts.query}' if parts.query else '')
+        writer.write(
+            f'GET {path} HTTP/1.1\r\nHost: {parts.netloc}\r\nUpgrade: websocket\r\n'
+            f'Connection: Upgrade\r\nSec-WebSocket-Key: {key.decode()}\r\n'
+            'Sec-WebSocket-Version: 13\r\n\r\n'.encode())
+        head = await reader.readuntil(b'\r\n\r\n')
+        status = head.split(b'\r\n', 1)[0]
+        if b' 101 ' not in status + b' ':
+            writer.close()
+            raise WebSocketClosed(f'upgrade refused: {status.decode(errors="replace")}')
+        return cls(reader, writer)
+
+    def _frame(self, opcode: int, payload: bytes) -> bytes:
+        n = len(payload)
+        if n < 126:
+            header = bytes([0x80 | opcode, 0x80 | n])
+        elif n < 1 << 16:
+            header = bytes([0x80 | opcode, 0x80 | 126]) + n.to_bytes(2, 'big')
+        else:
+            header = bytes([0x80 | opcode, 0x80 | 127]) + n.to_bytes(8, 'big')
+        mask = os.urandom(4)
+        # Whole-payload XOR via big ints: one C-level op instead of a per-byte Python loop.
+        masked = (int.from_bytes(payload, 'big') ^ int.from_bytes((mask * (n // 4 + 1))[:n], 'big')
+                  ).to_bytes(n, 'big') if n else b''
+        return header + mask + masked
+
+    async def send(self, text: str) -> None:
+        if self.closed:
+            raise WebSocketClosed('send on closed socket')
+        self.writer.write(self._frame(0x1, text.encode()))
+        await self.writer.drain()
+
+    async def recv(self) -> str:
+        """Next complete text message; answers control frames inline."""
+        chunks: list[bytes] = []
+        while True:
+            b0, b1 = await self.reader.readexactly(2)
+            opcode, n = b0 & 0x0F, b1 & 0x7F
+            if n == 126:
+                n = int.from_bytes(await self.reader.readexactly(2), 'big')
+            elif n == 127:
+                n = int.from_bytes(await self.reader.readexactly(8), 'big')
+            if n > MAX_FRAME:
+                raise WebSocketClosed(f'frame too large ({n} bytes)')
+            payload = await self.reader.readexactly(n)  # server frames are never masked
+            if opcode == 0x8:
+                self.closed = True
+                raise WebSocketClosed(f'closed by server (code={int.from_bytes(payload[:2], "big") if payload else 0})')
+            if opcode == 0x9:
+                self.writer.write(self._frame(0xA, payload))
+                continue
+            if opcode == 0xA:
+                continue
+            chunks.append(payload)
+            if b0 & 0x80:
+                return b''.join(chunks).decode()
+
+    async def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            try:
+                self.writer.write(self._frame(0x8, (1000).to_bytes(2, 'big')))
+                await self.writer.drain()
+            except (ConnectionError, RuntimeError):
+                pass
+        self.writer.close()
+
+
+# ===== simulated phone =====
+class Phone:
+    """One socket in one room: answers PINGs, heartbeats, and timestamps what it sees."""
+
+    def __init__(self, room: 'Room', index: int, stats: Stats) -> None:
+        self.room = room
+        self.index = index
+        self.name = POOL[index % len(POOL)] + ('' if index < len(POOL) else str(index))
+        self.stats = stats
+        self.ws: WebSocket | None = None
+        self.players_seen = 0
+        self.resync_sent: list[float] = []  # FIFO: each RESYNC is answered by exactly one STATE
+        self.joined = asyncio.Event()
+        self.tasks: list[asyncio.Task] = []
+
+    async def send(self, msg: dict) -> None:
+        if self.ws is None or self.ws.closed:
+            return
+        try:
+            await self.ws.send(json.dumps(msg))
+            self.stats.sent[msg['t']] += 1
+        except (ConnectionError, WebSocketClosed):
+            self.stats.errors['SEND_FAILED'] += 1
+
+    async def connect(self, ws_base: str, code: str, device: str) -> None:
+        started = time.perf_counter()
+        self.ws = await asyncio.wait_for(
+            WebSocket.connect(f'{ws_base}/ws/{code}?v=1&dev={device}'), CONNECT_TIMEOUT_S)
+        self.stats.observe('ws_connect', (time.perf_counter() - started) * 1000)
+        self.tasks.append(asyncio.create_task(self.read_loop()))
+
+    async def read_loop(self) -> None:
+        assert self.ws is not None
+        try:
+            while True:
+                raw = await self.ws.recv()
+                now = time.perf_counter()
+                frame = json.loads(raw)
+                t = frame.get('t', '?')
+                self.stats.received[t] += 1
+                if t == 'PING':
+                    await self.send({'t': 'PONG', 'id': frame['id'], 'cl': int(time.time() * 1000)})
+                    self.stats.observe('ping_one_way', time.time() * 1000 - frame.get('sv', 0))
+                elif t == 'STATE':
+                    if self.resync_sent:
+                        self.stats.observe('resync_state', (now - self.resync_sent.pop(0)) * 1000)
+                    self.players_seen = len(frame.get('s', {}).get('players', []))
+                    self.room.on_state(self, now)
+                elif t == 'HEAT':
+                    self.room.on_heat(now)
+                elif t == 'ERR':
+                    self.stats.errors[str(frame.get('code', 'UNKNOWN'))] += 1
+        except (asyncio.IncompleteReadError, ConnectionError, WebSocketClosed):
+            if not self.room.stopping:
+                self.stats.errors['SOCKET_CLOSED'] += 1
+        except (ValueError, KeyError):
+            self.stats.errors['MALFORMED_FRAME'] += 1
+
+    async def heartbeat_loop(self, period: float) -> None:
+        await asyncio.sleep(random.uniform(0, period))  # de-phase phones like real pockets
+        while True:
+            await self.send({'t': 'HEARTBEAT'})
+            await asyncio.sleep(period)
+
+    async def resync(self) -> None:
+        self.resync_sent.append(time.perf_counter())
+        await self.send({'t': 'RESYNC'})
+
+    async def close(self) -> None:
+        for task in self.tasks:
+            task.cancel()
+        if self.ws is not None:
+            await self.ws.close()
+
+
+class Room:
+    """A full roster in LOBBY. Fan-out = send time until the LAST phone sees the broadcast."""
+
+    def __init__(self, code: str, n_players: int, stats: Stats) -> None:
+        self.code = code
+        self.stats = stats
+        self.phones = [Phone(self, i, stats) for i in range(n_players)]
+        self.stopping = False
+        self.join_pending: tuple[int, float, set] | None = None  # (roster size, sent at, waiting)
+        self.join_done = asyncio.Event()
+        self.heat_pending: tuple[float, int] | None = None  # (sent at, phones still waiting)
+
+    def on_state(self, phone: Phone, now: float) -> None:
+        if self.join_pending is None:
+            return
+        size, sent, waiting = self.join_pending
+        if phone.players_seen >= size:
+            waiting.discard(phone.index)
+        if not waiting:
+            self.stats.observe('join_fanout', (now - sent) * 1000)
+            self.join_pending = None
+            self.join_done.set()
+
+    def on_heat(self, now: float) -> None:
+        if self.heat_pending is None:
+            return
+        sent, left = self.heat_pending
+        left -= 1
+        if left <= 0:
+            self.stats.observe('heat_fanout', (now - sent) * 1000)
+            self.heat_pending = None
+        else:
+            self.heat_pending = (sent, left)
+
+    async def fill(self, ws_base: str, nonce: str) -> None:
+        """Connect and JOIN one phone at a time so each JOIN broadcast is timed in isolation."""
+        for phone in self.phones:
+            await phone.connect(ws_base, self.code, f'load{nonce}{self.code}{phone.index:02d}')
+            connected = {p.index for p in self.phones if p.ws is not None}
+            self.join_done.clear()
+            self.join_pending = (phone.index + 1, time.perf_counter(), connected)
+            await phone.send({'t': 'JOIN', 'name': phone.name, 'avatar': phone.index % 16})
+            try:
+                await asyncio.wait_for(self.join_done.wait(), SETTLE_TIMEOUT_S)
+            except asyncio.TimeoutError:
+                self.stats.errors['JOIN_FANOUT_TIMEOUT'] += 1
+                self.join_pending = None
+            await phone.send({'t': 'CEILING', 'v': 5})
+            await phone.send({'t': 'ATTEST18'})
+
+    async def fire(self) -> None:
+        """One tap from a random phone; HEAT is broadcast to the whole room (<= 4Hz)."""
+        if self.heat_pending is None:
+            self.heat_pending = (time.perf_counter(), len(self.phones))
+        await random.choice(self.phones).send({'t': 'FIRE', 'n': 1})
+
+    async def close(self) -> None:
+        self.stopping = True
+        await asyncio.gather(*(p.close() for p in self.phones), return_exceptions=True)
+
+
+# ===== orchestration =====
+def create_room(base: str) -> str:
+    req = urllib.request.Request(f'{base}/api/room', method='POST', data=b'')
+    with urllib.request.urlopen(req, timeout=CONNECT_TIMEOUT_S) as res:
+        return json.loads(res.read())['code']
+
+
+async def open_room(args: argparse.Namespace, stats: Stats, gate: asyncio.Semaphore,
+                    nonce: str) -> Room | None:
+    loop = asyncio.get_running_loop()
+    async with gate:
+        started = time.perf_counter()
+        try:
+            code = await loop.run_in_executor(None, create_room, args.url)
+        except OSError as e:
+            stats.errors['CREATE_FAILED'] += 1
+            stats.rooms_failed += 1
+            print(f'  room create failed: {e}', file=sys.stderr)
+            return None
+        stats.observe('room_create', (time.perf_counter() - started) * 1000)
+        room = Room(code, args.players, stats)
+        try:
+            await room.fill(args.url.replace('http', 'ws', 1), nonce)
+        except (OSError, asyncio.TimeoutError, WebSocketClosed, asyncio.IncompleteReadError) as e:
+            stats.errors['CONNECT_FAILED'] += 1
+            stats.rooms_failed += 1
+            print(f'  room {code} fill failed: {e}', file=sys.stderr)
+            await room.close()
+            return None
+        stats.rooms_ok += 1
+        return room
+
+
+async def resync_storms(rooms: list[Room], every: float, fraction: float) -> None:
+    """Every `every` seconds, `fraction` of ALL phones RESYNC at once (a venue Wi-Fi blip)."""
+    while True:
+        await asyncio.sleep(every)
+        phones = [p for r in rooms for p in r.phones]
+        storm = random.sample(phones, max(1, int(len(phones) * fraction))) if phones else []
+        await asyncio.gather(*(p.resync() for p in storm))
+
+
+async def fire_taps(rooms: list[Room], per_room_hz: float) -> None:
+    while True:
+        await asyncio.sleep(1 / per_room_hz)
+        await asyncio.gather(*(r.fire() for r in rooms))
+
+
+async def run(args: argparse.Namespace) -> dict:
+    stats = Stats()
+    nonce = os.urandom(4).hex()
+    gate = asyncio.Semaphore(args.ramp)
+    started = time.perf_counter()
+    print(f'opening {args.rooms} rooms x {args.players} phones against {args.url} ...')
+    opened = await asyncio.gather(*(open_room(args, stats, gate, nonce) for _ in range(args.rooms)))
+    rooms = [r for r in opened if r is not None]
+    print(f'  {len(rooms)}/{args.rooms} rooms filled in {time.perf_counter() - started:.1f}s; '
+          f'soaking {args.duration:.0f}s')
+
+    background = [asyncio.create_task(p.heartbeat_loop(args.heartbeat)) for r in rooms for p in r.phones]
+    if args.resync_every > 0:
+        background.append(asyncio.create_task(resync_storms(rooms, args.resync_every, args.resync_fraction)))
+    if args.fire_hz > 0:
+        background.append(asyncio.create_task(fire_taps(rooms, args.fire_hz)))
+    # Clock sync needs no driver: every socket gets a 5x200ms PING batch on connect and
+    # every 60s after (clock.ts), answered in Phone.read_loop.
+    await asyncio.sleep(args.duration)
+
+    for task in background:
+        task.cancel()
+    await asyncio.gather(*(r.close() for r in rooms), return_exceptions=True)
+    return stats.report(time.perf_counter() - started)
+
+
+def print_report(report: dict) -> None:
+    print(f"\nrooms ok={report['rooms']['ok']} failed={report['rooms']['failed']} "
+          f"in {report['elapsed_s']}s")
+    print(f"{'metric':<16}{'n':>9}{'mean':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}")
+    for name, s in report['latency'].items():
+        print(f"{name:<16}{s['n']:>9}{s['mean_ms']:>10}{s['p50_ms']:>10}{s['p90_ms']:>10}"
+              f"{s['p99_ms']:>10}{s['max_ms']:>10}")
+    print('sent:     ' + ', '.join(f'{k}={v}' for k, v in sorted(report['sent'].items())))
+    print('received: ' + ', '.join(f'{k}={v}' for k, v in sorted(report['received'].items())))
+    errors = report['errors']
+    print('errors:   ' + (', '.join(f'{k}={v}' for k, v in sorted(errors.items())) or 'none'))
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    ap.add_argument('--url', default=os.environ.get('HELLDECK_URL', 'http://127.0.0.1:8787'))
+    ap.add_argument('--rooms', type=int, default=100)
+    ap.add_argument('--players', type=int, default=16, help='phones per room (12 seat, rest are imps)')
+    ap.add_argument('--duration', type=float, default=60.0, help='soak seconds after all rooms fill')
+    ap.add_argument('--ramp', type=int, default=20, help='rooms filling concurrently')
+    ap.add_argument('--heartbeat', type=float, default=HEARTBEAT_S, help='seconds between HEARTBEATs')
+    ap.add_argument('--resync-every', type=float, default=10.0, help='seconds between storms (0=off)')
+    ap.add_argument('--resync-fraction', type=float, default=0.5, help='share of phones per storm')
+    ap.add_argument('--fire-hz', type=float, default=2.0, help='FIRE taps per room per second (0=off)')
+    ap.add_argument('--out', help='write the JSON report here')
+    args = ap.parse_args()
+    args.url = args.url.rstrip('/')
+    if args.rooms < 1 or args.players < 1 or not 0 < args.resync_fraction <= 1:
+        ap.error('--rooms/--players must be >= 1 and --resync-fraction in (0, 1]')
+
+    report = asyncio.run(run(args))
+    print_report(report)
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f'report -> {args.out}')
+    return 1 if report['rooms']['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+HELLDECK Gold Cards Build Pipeline
+
+Builds app/src/main/assets/gold/gold_cards_v2.json from one source card set per game
+(scripts/gold_sources/<GAME>.json) and emits a compact copy for release builds.
+
+- Each source set is hashed; only games whose source (or the pipeline itself) changed
+  are re-normalized. Unchanged games reuse their cached serialized fragments.
+- --check ignores the (gitignored) cache: it regenerates both outputs in memory and
+  compares them byte-for-byte with the committed assets, so it is reliable on a fresh clone.
+- Output is stream-written fragment by fragment, then swapped in atomically.
+- The readable asset (indent=2) stays diff-friendly in git; the compact artifact lands in
+  app/src/release/assets/gold/, which overrides the main asset in release APKs.
+
+Usage:
+    python3 scripts/build_gold_cards.py              # incremental build
+    python3 scripts/build_gold_cards.py --force      # rebuild every game
+    python3 scripts/build_gold_cards.py --check      # exit 1 if outputs are stale
+    python3 scripts/build_gold_cards.py split        # explode the asset into sources
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import textwrap
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCES_DIR = Path("scripts/gold_sources")
+CACHE_DIR = Path("scripts/.gold_cache")
+READABLE_OUT = Path("app/src/main/assets/gold/gold_cards_v2.json")
+RELEASE_OUT = Path("app/src/release/assets/gold/gold_cards_v2.json")
+
+# Bump when normalization or serialization changes: invalidates every cached fragment.
+PIPELINE_VERSION = "1"
+# id/game/family are derived from the source file, never hand-maintained.
+DERIVED_FIELDS = ("id", "game", "family")
+# (opener, separator, closer) around the per-game fragments of each output
+READABLE_FRAME = ("[\n", ",\n", "\n]")
+RELEASE_FRAME = ("[", ",", "]")
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _source_files(sources: Path) -> list:
+    """Source sets in output order: index.json first, then any new games alphabetically."""
+    index_path = sources / "index.json"
+    order = json.loads(index_path.read_text())["games"] if index_path.exists() else []
+    present = {p.stem: p for p in sources.glob("*.json") if p.name != "index.json"}
+    games = [g for g in order if g in present] + sorted(set(present) - set(order))
+    return [(game, present[game]) for game in games]
+
+
+def normalize(game: str, cards: list) -> list:
+    """Assign positional per-game ids and derived fields; keep every other field in source order.
+
+    Ids are `<game>_<n>` by position in the source set, so inserting or removing a card
+    renumbers every card after it in that game.
+    """
+    out = []
+    seen_texts = set()
+    for n, card in enumerate(cards, 1):
+        text = card.get("text")
+        if not isinstance(text, str) or not text.strip():
+            raise ValueError(f"{game}: card {n} has no text")
+        if text in seen_texts:
+            raise ValueError(f"{game}: duplicate card text {text!r}")
+        seen_texts.add(text)
+        normalized = {"id": f"{game.lower()}_{n}", "game": game, "family": game.lower()}
+        normalized.update((k, v) for k, v in card.items() if k not in DERIVED_FIELDS)
+        out.append(normalized)
+    return out
+
+
+def build_fragments(game: str, source: Path) -> dict:
+    """Serialize one game's cards in both output registers."""
+    cards = normalize(game, json.loads(source.read_text()))
+    readable = ",\n".join(
+        textwrap.indent(json.dumps(c, indent=2, ensure_ascii=False), "  ") for c in cards
+    )
+    compact = ",".join(json.dumps(c, separators=(",", ":"), ensure_ascii=False) for c in cards)
+    return {"count": len(cards), "readable": readable, "compact": compact}
+
+
+def stream_write(path: Path, opener: str, fragments: list, separator: str, closer: str) -> str:
+    """Write fragments to a temp file beside `path`, then atomically replace it. Returns sha256."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+            def emit(piece: str) -> None:
+                f.write(piece)
+                digest.update(piece.encode("utf-8"))
+
+            emit(opener)
+            for i, fragment in enumerate(fragments):
+                if i:
+                    emit(separator)
+                emit(fragment)
+            emit(closer)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return digest.hexdigest()
+
+
+def _file_sha(path: Path) -> str:
+    return _sha256(path.read_bytes()) if path.exists() else ""
+
+
+def check(args, games: list) -> int:
+    """Regenerate both outputs in memory and compare them byte-for-byte with the files."""
+    readable_parts, compact_parts = [], []
+    for game, source in games:
+        fragments = build_fragments(game, source)
+        if fragments["count"]:
+            readable_parts.append(fragments["readable"])
+            compact_parts.append(fragments["compact"])
+
+    stale = []
+    for path, (opener, separator, closer), parts in (
+        (args.out, READABLE_FRAME, readable_parts),
+        (args.release_out, RELEASE_FRAME, compact_parts),
+    ):
+        expected = (opener + separator.join(parts) + closer).encode("utf-8")
+        if not path.exists() or path.read_bytes() != expected:
+            stale.append(os.path.relpath(path, ROOT))
+    if stale:
+        print(f"❌ Gold cards stale: {', '.join(stale)} (run scripts/build_gold_cards.py)")
+        return 1
+    print(f"✅ Gold cards up to date ({len(games)} games)")
+    return 0
+
+
+def build(args) -> int:
+    sources = args.sources
+    manifest_path = args.cache / "manifest.json"
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+    if manifest.get("pipeline") != PIPELINE_VERSION:
+        manifest = {}
+    cached_games = manifest.get("games", {})
+
+    games = _source_files(sources)
+    if not games:
+        print(f"❌ No source card sets in {sources} (run `split` to bootstrap)")
+        return 1
+    if args.check:
+        return check(args, games)
+
+    rebuilt, reused, entries = [], [], {}
+    readable_parts, compact_parts = [], []
+    for game, source in games:
+        source_hash = _sha256(source.read_bytes())
+        entry = cached_games.get(game)
+        fragment_path = args.cache / f"{game}.json"
+        if not args.force and entry and entry["source"] == source_hash and fragment_path.exists():
+            fragments = json.loads(fragment_path.read_text())
+            reused.append(game)
+        else:
+            fragments = build_fragments(game, source)
+            rebuilt.append(game)
+            args.cache.mkdir(parents=True, exist_ok=True)
+            fragment_path.write_text(json.dumps(fragments, ensure_ascii=False))
+        entries[game] = {"source": source_hash, "count": fragments["count"]}
+        if fragments["count"]:
+            readable_parts.append(fragments["readable"])
+            compact_parts.append(fragments["compact"])
+
+    outputs_intact = (
+        manifest.get("readable") == _file_sha(args.out)
+        and manifest.get("release") == _file_sha(args.release_out)
+        and set(cached_games) == set(entries)
+    )
+    if not rebuilt and outputs_intact and not args.force:
+        print(f"✅ Gold cards up to date ({len(games)} games, nothing to rebuild)")
+        return 0
+
+    readable_sha = stream_write(args.out, READABLE_FRAME[0], readable_parts, *READABLE_FRAME[1:])
+    release_sha = stream_write(args.release_out, RELEASE_FRAME[0], compact_parts, *RELEASE_FRAME[1:])
+    args.cache.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps(
+        {"pipeline": PIPELINE_VERSION, "games": entries, "readable": readable_sha, "release": release_sha},
+        indent=2,
+    ))
+
+    total = sum(e["count"] for e in entries.values())
+    print(f"Rebuilt: {', '.join(rebuilt) or '(none)'}")
+    print(f"Reused:  {len(reused)} games from cache")
+    print(f"Total:   {total} cards across {len(entries)} games")
+    print(f"  readable → {args.out} ({args.out.stat().st_size:,} bytes)")
+    print(f"  release  → {args.release_out} ({args.release_out.stat().st_size:,} bytes)")
+    return 0
+
+
+def split(args) -> int:
+    """Bootstrap/refresh per-game sources from the readable asset (ids and family are dropped)."""
+    cards = json.loads(args.out.read_text())
+    by_game = {}
+    for card in cards:
+        by_game.setdefault(card["game"], []).append(
+            {k: v for k, v in card.items() if k not in DERIVED_FIELDS}
+        )
+    args.sources.mkdir(parents=True, exist_ok=True)
+    for game, game_cards in by_game.items():
+        (args.sources / f"{game}.json").write_text(
+            json.dumps(game_cards, indent=2, ensure_ascii=False) + "\n"
+        )
+    (args.sources / "index.json").write_text(json.dumps({"games": list(by_game)}, indent=2) + "\n")
+    print(f"✅ Split {len(cards)} cards into {len(by_game)} source sets in {args.sources}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the gold card assets from per-game sources")
+    parser.add_argument("command", nargs="?", choices=["build", "split"], default="build")
+    parser.add_argument("--sources", type=Path, default=SOURCES_DIR)
+    parser.add_argument("--cache", type=Path, default=CACHE_DIR)
+    parser.add_argument("--out", type=Path, default=READABLE_OUT)
+    parser.add_argument("--release-out", type=Path, default=RELEASE_OUT)
+    parser.add_argument("--force", action="store_true", help="Ignore the cache and rebuild all games")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the committed outputs differ from a fresh build (writes nothing)")
+    args = parser.parse_args()
+
+    # Relative paths are anchored at the repo root, so the script runs from any directory.
+    for name in ("sources", "cache", "out", "release_out"):
+        path = getattr(args, name)
+        if not path.is_absolute():
+            setattr(args, name, ROOT / path)
+
+    try:
+        return split(args) if args.command == "split" else build(args)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
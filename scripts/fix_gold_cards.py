@@ -4,12 +4,24 @@ HELLDECK Gold Card Quality Fix
 Based on Comedy Science Research (Benign Violation Theory + Specificity)
 
 This script fixes/replaces low-quality gold cards with comedy-science-backed versions.
+
+Writes the readable gold asset, then runs `build_gold_cards.py split` and `build` so
+scripts/gold_sources (the pipeline's input) and the release asset stay in sync with it.
 """
 
 import json
+import subprocess
+import sys
 from pathlib import Path
 
-GOLD_CARDS_PATH = Path(__file__).parent.parent / "app/src/main/assets/gold/gold_cards.json"
+GOLD_CARDS_PATH = Path(__file__).parent.parent / "app/src/main/assets/gold/gold_cards_v2.json"
+BUILD_PIPELINE = Path(__file__).parent / "build_gold_cards.py"
+
+
+def sync_gold_pipeline():
+    """Refresh the per-game sources from the asset just written, then rebuild both assets."""
+    for command in ("split", "build"):
+        subprocess.run([sys.executable, str(BUILD_PIPELINE), command], check=True)
 
 # ============================================================================
 # REALITY CHECK - Complete rewrite needed (current cards are generic)
@@ -854,6 +866,7 @@ def main():
         json.dump(all_cards, f, indent=2)
     
     print(f"\n✅ Fixed gold cards written to: {output_path}")
+    sync_gold_pipeline()
     
     # Also write a backup
     backup_path = GOLD_CARDS_PATH.with_suffix('.json.backup')
@@ -5,10 +5,25 @@ Based on Comedy Science Principles:
 - Benign Violation Theory (McGraw & Warren)
 - Specificity ("Jujufruits" > "candy")
 - Hard consonants, visual imagery, escalation
+
+Writes the readable gold asset, then runs `build_gold_cards.py split` and `build` so
+scripts/gold_sources (the pipeline's input) and the release asset stay in sync with it.
 """
 
 import json
 import random
+import subprocess
+import sys
+from pathlib import Path
+
+GOLD_CARDS_PATH = Path(__file__).parent.parent / "app/src/main/assets/gold/gold_cards_v2.json"
+BUILD_PIPELINE = Path(__file__).parent / "build_gold_cards.py"
+
+
+def sync_gold_pipeline():
+    """Refresh the per-game sources from the asset just written, then rebuild both assets."""
+    for command in ("split", "build"):
+        subprocess.run([sys.executable, str(BUILD_PIPELINE), command], check=True)
 
 # ============================================
 # RED FLAG RALLY - Dating Red Flags
@@ -427,7 +442,7 @@ if __name__ == "__main__":
     new_cards = build_gold_cards()
     
     # Load existing cards to preserve good ones
-    with open("/Users/nicholastoledo/Development/active/HELLDECK/app/src/main/assets/gold/gold_cards.json", "r") as f:
+    with open(GOLD_CARDS_PATH) as f:
         existing = json.load(f)
     
     # Keep existing ROAST_CONSENSUS (it's good), OVER_UNDER, REALITY_CHECK
@@ -449,8 +464,9 @@ if __name__ == "__main__":
     print(f"Total: {len(final_cards)} cards")
     
     # Write output
-    output_path = "/Users/nicholastoledo/Development/active/HELLDECK/app/src/main/assets/gold/gold_cards_v2.json"
+    output_path = GOLD_CARDS_PATH
     with open(output_path, "w") as f:
         json.dump(final_cards, f, indent=2)
     
     print(f"\nWritten to: {output_path}")
+    sync_gold_pipeline()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Shared asset graph for the HELLDECK verification tools.
+
+Parses the Kotlin game registries, gold cards, v3 templates and lexicons once into an
+indexed model that checks query instead of re-reading and substring-scanning files.
+Parsed facts are cached per file in tools/.cache/asset_graph.json, keyed by content
+hash (with an mtime/size fast path), so an unchanged tree loads without parsing.
+
+Usage:
+  python tools/asset_graph.py          # build/refresh the cache and print a summary
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Callable
+
+CACHE_PATH = Path("tools/.cache/asset_graph.json")
+# Bump whenever an extractor changes shape or what it records.
+SCHEMA_VERSION = 1
+
+KOTLIN_ROOT = Path("app/src/main/java")
+REGISTRY_KT = KOTLIN_ROOT / "com/helldeck/engine/GamesRegistry.kt"
+METADATA_KT = KOTLIN_ROOT / "com/helldeck/engine/GameMetadata.kt"
+ICONS_KT = KOTLIN_ROOT / "com/helldeck/ui/GameIcons.kt"
+GOLD_JSON = Path("app/src/main/assets/gold/gold_cards_v2.json")
+TEMPLATES_DIR = Path("app/src/main/assets/templates_v3")
+LEXICON_DIRS = (Path("app/src/main/assets/lexicons"), Path("app/src/main/assets/lexicons_v2"))
+
+# Games removed per HDRealRules.md; any surviving reference is reported.
+LEGACY_GAMES = ("MAJORITY_REPORT", "ODD_ONE_OUT", "HYPE_OR_YIKE")
+LEGACY_TOKENS = LEGACY_GAMES + ("GameIds.MAJORITY", "GameIds.ODD_ONE", "GameIds.HYPE_YIKE")
+
+CONST_RE = re.compile(r'const val (\w+)\s*=\s*"([^"]+)"')
+ALIAS_RE = re.compile(r"const val (\w+)\s*=\s*([A-Z_][A-Z0-9_]*)\s*$", re.M)
+METADATA_RE = re.compile(r"GameIds\.(\w+) to GameInfo\(")
+ICON_RE = re.compile(r'GameIds\.(\w+)\s*->\s*"([^"]+)"')
+IDENT_RE = re.compile(r"\b[A-Z][A-Z0-9_]{2,}\b")
+CALL_RE = re.compile(r"\b(\w+)\(")
+
+
+# ---------------------------------------------------------------------------
+# Extractors: file text -> JSON-serializable facts. Pure, so results can be cached.
+# ---------------------------------------------------------------------------
+
+
+def extract_kotlin(text: str) -> dict:
+    legacy = []
+    for lineno, line in enumerate(text.splitlines(), 1):
+        tokens = [t for t in LEGACY_TOKENS if t in line]
+        if tokens:
+            stripped = line.strip()
+            comment = stripped.startswith("//") or "/*" in line or "*/" in line
+            legacy.extend([lineno, t, comment, stripped] for t in tokens)
+    return {
+        "consts": dict(CONST_RE.findall(text)),
+        "aliases": dict(ALIAS_RE.findall(text)),
+        "registered": METADATA_RE.findall(text),
+        "icons": dict(ICON_RE.findall(text)),
+        "idents": sorted(set(IDENT_RE.findall(text))),
+        "calls": sorted(set(CALL_RE.findall(text))),
+        "legacy": legacy,
+    }
+
+
+def extract_gold(text: str) -> dict:
+    counts: dict[str, int] = {}
+    ids: set[str] = set()
+    duplicate_ids = []
+    for card in json.loads(text):
+        game = card.get("game", "UNKNOWN")
+        counts[game] = counts.get(game, 0) + 1
+        cid = card.get("id")
+        if cid in ids:
+            duplicate_ids.append(cid)
+        ids.add(cid)
+    return {"counts": counts, "duplicate_ids": duplicate_ids}
+
+
+def extract_template(text: str) -> dict:
+    games: dict[str, int] = {}
+    for template in json.loads(text):
+        game = template.get("game", "UNKNOWN")
+        games[game] = games.get(game, 0) + 1
+    return {"games": games}
+
+
+def extract_lexicon(text: str) -> dict:
+    data = json.loads(text)
+    entries = data.get("entries", []) if isinstance(data, dict) else data
+    return {"entries": len(entries)}
+
+
+# ---------------------------------------------------------------------------
+# Graph
+# ---------------------------------------------------------------------------
+
+
+class AssetGraph:
+    """Indexed view over every parsed asset. Paths are repo-relative POSIX strings."""
+
+    def __init__(self, files: dict[str, dict]):
+        self.files = files
+        registry = files.get(REGISTRY_KT.as_posix(), {})
+        self.game_ids: dict[str, str] = registry.get("consts", {})
+        self.aliases: dict[str, str] = registry.get("aliases", {})
+        self.registered: list[str] = files.get(METADATA_KT.as_posix(), {}).get("registered", [])
+        self.icons: dict[str, str] = files.get(ICONS_KT.as_posix(), {}).get("icons", {})
+        self.gold_counts: dict[str, int] = files.get(GOLD_JSON.as_posix(), {}).get("counts", {})
+        self.templates_by_game: dict[str, list[str]] = {}
+        self.lexicons: dict[str, int] = {}
+        for path, facts in files.items():
+            if path.startswith(TEMPLATES_DIR.as_posix() + "/"):
+                for game in facts["games"]:
+                    self.templates_by_game.setdefault(game, []).append(Path(path).name)
+            elif any(path.startswith(d.as_posix() + "/") for d in LEXICON_DIRS):
+                self.lexicons[path] = facts["entries"]
+
+    # -- queries -------------------------------------------------------------
+
+    def games(self) -> list[tuple[str, str]]:
+        """Official games as (GameIds constant, game id), in registry order."""
+        return list(self.game_ids.items())
+
+    def full_id(self, short: str) -> str | None:
+        return self.game_ids.get(self.aliases.get(short, short))
+
+    def kotlin_files(self) -> list[str]:
+        return [p for p in self.files if p.endswith(".kt")]
+
+    def legacy_hits(self, path: str | None = None) -> list[tuple[str, int, str, bool, str]]:
+        """(file, line, token, is_comment, line_text) for every legacy token occurrence."""
+        paths = [path] if path else self.kotlin_files()
+        return [
+            (p, lineno, token, comment, line)
+            for p in paths
+            for lineno, token, comment, line in self.files.get(p, {}).get("legacy", [])
+        ]
+
+    def file_idents(self, path: Path | str) -> set[str]:
+        return set(self.files.get(Path(path).as_posix(), {}).get("idents", []))
+
+    def file_calls(self, path: Path | str) -> set[str]:
+        return set(self.files.get(Path(path).as_posix(), {}).get("calls", []))
+
+    def has_file(self, path: Path | str) -> bool:
+        return Path(path).as_posix() in self.files
+
+
+# ---------------------------------------------------------------------------
+# Loading + cache
+# ---------------------------------------------------------------------------
+
+
+def _inputs(base: Path) -> list[tuple[Path, Callable[[str], dict]]]:
+    inputs = [(p, extract_kotlin) for p in sorted((base / KOTLIN_ROOT).rglob("*.kt"))]
+    if (base / GOLD_JSON).exists():
+        inputs.append((base / GOLD_JSON, extract_gold))
+    inputs += [(p, extract_template) for p in sorted((base / TEMPLATES_DIR).glob("*.json"))]
+    for lex_dir in LEXICON_DIRS:
+        inputs += [(p, extract_lexicon) for p in sorted((base / lex_dir).glob("*.json"))]
+    return inputs
+
+
+def load(base_path: str | Path = ".", use_cache: bool = True) -> AssetGraph:
+    """Build the graph, re-parsing only files whose content changed since the last run."""
+    base = Path(base_path)
+    cache_file = base / CACHE_PATH
+    cached: dict = {}
+    if use_cache and cache_file.exists():
+        try:
+            blob = json.loads(cache_file.read_text())
+            if blob.get("schema") == SCHEMA_VERSION:
+                cached = blob["files"]
+        except (OSError, ValueError, KeyError):
+            cached = {}
+
+    entries: dict[str, dict] = {}
+    dirty = False
+    for path, extract in _inputs(base):
+        rel = path.relative_to(base).as_posix()
+        st = path.stat()
+        entry = cached.get(rel)
+        if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            entries[rel] = entry
+            continue
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        if not entry or entry["sha256"] != digest:
+            try:
+                facts = extract(data.decode("utf-8"))
+            except ValueError as ex:  # malformed JSON/UTF-8: surface as an empty fact set
+                facts = {"error": str(ex)}
+            entry = {"sha256": digest, "facts": facts}
+        entries[rel] = {**entry, "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+        dirty = True
+    dirty = dirty or set(entries) != set(cached)
+
+    if use_cache and dirty:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps({"schema": SCHEMA_VERSION, "files": entries}))
+
+    files = {}
+    for rel, entry in entries.items():
+        facts = entry["facts"]
+        if "error" in facts:
+            print(f"  ⚠️  {rel}: {facts['error']}", file=sys.stderr)
+            facts = {"games": {}, "entries": 0, "counts": {}}
+        files[rel] = facts
+    return AssetGraph(files)
+
+
+def main() -> int:
+    graph = load(Path(__file__).parent.parent)
+    print(
+        f"Games:     {len(graph.games())} registered ids, {len(graph.registered)} in GameMetadata"
+    )
+    print(f"Kotlin:    {len(graph.kotlin_files())} files")
+    print(
+        f"Gold:      {sum(graph.gold_counts.values())} cards across {len(graph.gold_counts)} games"
+    )
+    print(f"Templates: {sum(len(v) for v in graph.templates_by_game.values())} files")
+    print(f"Lexicons:  {len(graph.lexicons)} files, {sum(graph.lexicons.values())} entries")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
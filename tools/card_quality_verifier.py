@@ -2,10 +2,14 @@
 """
 5-Pass Card Quality Verification System
 Ensures all cards are funny, appropriate, and match HDRealRules.md tone
+
+--profile[=PATH] / --chrome-trace PATH: per-pass timing + memory trace (tools/instrument.py).
 """
 
 import json
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+from instrument import Profiler
 
 
 class CardQualityVerifier:
@@ -13,9 +17,11 @@ class CardQualityVerifier:
     5-Pass verification system for card quality
     """
 
-    def __init__(self, gold_cards_path: str):
-        with open(gold_cards_path) as f:
-            self.data = json.load(f)
+    def __init__(self, gold_cards_path: str, prof: Optional[Profiler] = None):
+        self.prof = prof or Profiler("card_quality_verifier")
+        with self.prof.phase("parse", path=gold_cards_path):
+            with open(gold_cards_path) as f:
+                self.data = json.load(f)
         self.issues = []
         self.warnings = []
 
@@ -402,12 +408,17 @@ class CardQualityVerifier:
         print("🎯 HELLDECK CARD QUALITY VERIFICATION SYSTEM")
         print("=" * 60)
 
+        passes = [
+            self.pass_1_structure_validation,
+            self.pass_2_content_quality,
+            self.pass_3_humor_tone_check,
+            self.pass_4_game_specific_validation,
+            self.pass_5_uniqueness_check,
+        ]
         results = []
-        results.append(self.pass_1_structure_validation())
-        results.append(self.pass_2_content_quality())
-        results.append(self.pass_3_humor_tone_check())
-        results.append(self.pass_4_game_specific_validation())
-        results.append(self.pass_5_uniqueness_check())
+        for run_pass in passes:
+            with self.prof.phase(run_pass.__name__):
+                results.append(run_pass())
 
         all_passed = all(results)
 
@@ -445,11 +456,13 @@ class CardQualityVerifier:
 if __name__ == "__main__":
     import sys
 
+    prof = Profiler.from_argv("card_quality_verifier")
     gold_cards_path = "app/src/main/assets/gold_cards.json"
     if len(sys.argv) > 1:
         gold_cards_path = sys.argv[1]
 
-    verifier = CardQualityVerifier(gold_cards_path)
+    verifier = CardQualityVerifier(gold_cards_path, prof)
     passed, issues, warnings = verifier.run_all_passes()
+    prof.finish()
 
     sys.exit(0 if passed else 1)
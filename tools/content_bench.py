@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the HELLDECK content toolchain.
+
+Generates synthetic corpora at several sizes (decks, lexicons, quality sweep reports)
+modelled on the real content, then times each tool against them:
+
+  lint, stats, dedup        descent/content/tools/{lint_deck,deck_stats,dedup_skeletons}.py
+  lexicon_lint              tools/lexicon_lint.py
+  quality_summarize         tools/quality_summarize.py
+  quality_ai_summary        tools/quality_ai_summary.py
+
+Each measurement runs in its own subprocess (isolated memory, hard timeout), so a
+quadratic pass that blows up at 100k cards is reported as a timeout, not a hang.
+
+Usage:
+  python tools/content_bench.py                              # 1k,10k,100k -> reports/bench/
+  python tools/content_bench.py --sizes 1000,10000 --tools dedup,lint
+  python tools/content_bench.py --compare reports/bench/content_bench_baseline.json \\
+      --threshold 0.25                                       # exit 1 on >25% slowdown
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import platform
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DECK_DIR = ROOT / "descent/content/decks"
+DESCENT_TOOLS = ROOT / "descent/content/tools"
+OUT_DIR = ROOT / "reports/bench"
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+SEED = 1337
+GAMES = ("ROAST_CONSENSUS", "POISON_PITCH", "RED_FLAG_RALLY", "TABOO_TIMER", "SCATTERBLAST")
+# Lexicon files hold far fewer entries than decks hold cards in practice.
+LEXICON_FILES = 40
+
+# tool name -> (script path, how its inputs are wired: "decks" | "lexicons" | "quality")
+TOOLS = {
+    "lint": (DESCENT_TOOLS / "lint_deck.py", "decks"),
+    "stats": (DESCENT_TOOLS / "deck_stats.py", "decks"),
+    "dedup": (DESCENT_TOOLS / "dedup_skeletons.py", "decks"),
+    "lexicon_lint": (ROOT / "tools/lexicon_lint.py", "lexicons"),
+    "quality_summarize": (ROOT / "tools/quality_summarize.py", "quality"),
+    "quality_ai_summary": (ROOT / "tools/quality_ai_summary.py", "quality"),
+}
+
+
+# ---------------------------------------------------------------------------
+# Synthetic corpora
+# ---------------------------------------------------------------------------
+
+
+class CorpusModel:
+    """Word pool, text-length and skeleton-reuse distributions sampled from the real decks."""
+
+    def __init__(self, deck_dir: Path = DECK_DIR):
+        self.templates: dict[str, list[dict]] = {}
+        self.words: list[str] = []
+        self.lengths: list[int] = []
+        skeleton_uses: dict[tuple[str, str], int] = {}
+        for path in sorted(deck_dir.glob("*.json")):
+            deck = json.loads(path.read_text())
+            self.templates[deck["deck"]] = deck["cards"]
+            for card in deck["cards"]:
+                words = card.get("text", "").split()
+                self.words.extend(words)
+                self.lengths.append(len(words))
+                key = (deck["deck"], card.get("skeleton", ""))
+                skeleton_uses[key] = skeleton_uses.get(key, 0) + 1
+        reused = sum(1 for n in skeleton_uses.values() if n > 1)
+        self.skeleton_reuse = reused / max(1, len(skeleton_uses))
+
+    def text(self, rng: random.Random) -> str:
+        return " ".join(rng.choices(self.words, k=rng.choice(self.lengths)))
+
+
+def _skeleton(rng: random.Random, words: list[str]) -> str:
+    picked = (re.sub(r"[^a-z]", "", w.lower()) for w in rng.sample(words, 4))
+    return "-".join(w for w in picked if w) or "synthetic"
+
+
+def write_decks(model: CorpusModel, n_cards: int, out: Path, rng: random.Random) -> list[Path]:
+    """n_cards split across every real deck type, extras copied from real cards."""
+    out.mkdir(parents=True, exist_ok=True)
+    decks = sorted(model.templates)
+    paths = []
+    for i, deck in enumerate(decks):
+        count = n_cards // len(decks) + (1 if i < n_cards % len(decks) else 0)
+        cards, skeletons = [], []
+        for k in range(count):
+            card = dict(rng.choice(model.templates[deck]))
+            if skeletons and rng.random() < model.skeleton_reuse:
+                skeleton = skeletons.pop(
+                    rng.randrange(len(skeletons))
+                )  # reuse once, like real decks
+            else:
+                skeleton = _skeleton(rng, model.words)
+                skeletons.append(skeleton)
+            card.update(id=f"{deck}_v3_{k + 1:03d}", text=model.text(rng), skeleton=skeleton)
+            cards.append(card)
+        path = out / f"{deck}.json"
+        path.write_text(json.dumps({"schema": 3, "deck": deck, "cards": cards}))
+        paths.append(path)
+    return paths
+
+
+def write_lexicons(model: CorpusModel, n_entries: int, out: Path, rng: random.Random) -> None:
+    out.mkdir(parents=True, exist_ok=True)
+    per_file = max(1, n_entries // LEXICON_FILES)
+    for i in range(LEXICON_FILES):
+        entries = [
+            {
+                "text": " ".join(rng.choices(model.words, k=rng.randint(1, 4))),
+                "needs_article": rng.choice(["none", "a", "the"]),
+                "spice": rng.randint(1, 3),
+            }
+            for _ in range(per_file)
+        ]
+        (out / f"slot_{i:02d}.json").write_text(
+            json.dumps({"slot_type": f"slot_{i:02d}", "entries": entries})
+        )
+
+
+def write_quality(model: CorpusModel, n_rows: int, out: Path, rng: random.Random) -> None:
+    """Sweep JSONs shaped like app/build/reports/cardlab/quality/quality_<GAME>_<SEED>_<COUNT>."""
+    out.mkdir(parents=True, exist_ok=True)
+    issues = ("too_long", "repeat_slot", "low_humor", "awkward_grammar", "spice_mismatch")
+    per_game = max(1, n_rows // len(GAMES))
+    for game in GAMES:
+        rows = [
+            {
+                "text": model.text(rng),
+                "metrics": {
+                    "aiHumor": round(rng.random(), 3),
+                    "aiSense": round(rng.random(), 3),
+                    "aiUnderstandable": round(rng.random(), 3) if rng.random() > 0.1 else None,
+                },
+            }
+            for _ in range(per_game)
+        ]
+        summary = {
+            "game": game,
+            "total": per_game,
+            "passRate": round(rng.uniform(60, 99), 1),
+            "avgScore": round(rng.random(), 3),
+            "topIssues": {k: rng.randint(0, per_game // 10) for k in issues},
+        }
+        (out / f"quality_{game}_{SEED}_{per_game}.json").write_text(
+            json.dumps({"summary": summary, "rows": rows})
+        )
+
+
+def build_corpus(size: int, root: Path) -> Path:
+    """Deterministic corpus for `size`; reused across runs when already on disk."""
+    corpus = root / f"n{size}"
+    marker = corpus / ".complete"
+    if marker.exists():
+        return corpus
+    model = CorpusModel()
+    rng = random.Random(SEED + size)
+    write_decks(model, size, corpus / "decks", rng)
+    write_lexicons(model, size, corpus / "lexicons", rng)
+    write_quality(model, size, corpus / "quality", rng)
+    marker.write_text("ok")
+    return corpus
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+
+def _run_tool_inprocess(tool: str, corpus: Path) -> float:
+    """Child-process entry: load the tool, wire its inputs to `corpus`, time main()."""
+    script, kind = TOOLS[tool]
+    spec = importlib.util.spec_from_file_location(f"bench_{tool}", script)
+    module = importlib.util.module_from_spec(spec)
+    sys.path.insert(0, str(script.parent))
+    spec.loader.exec_module(module)
+
+    argv = [str(script)]
+    if kind == "decks":
+        argv += [str(p) for p in sorted((corpus / "decks").glob("*.json"))]
+    elif kind == "lexicons":
+        module.LEX_DIR = corpus / "lexicons"
+    else:
+        module.IN_DIR = corpus / "quality"
+        module.OUT_MD = corpus / f"{tool}.md"
+    sys.argv = argv
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            module.main()
+        except SystemExit:
+            pass
+    return time.perf_counter() - started
+
+
+def measure(tool: str, corpus: Path, repeat: int, timeout: float) -> dict:
+    runs = []
+    for _ in range(repeat):
+        try:
+            proc = subprocess.run(
+                [sys.executable, __file__, "--child", tool, str(corpus)],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired:
+            return {"status": "timeout", "seconds": None}
+        if proc.returncode != 0:
+            return {"status": "error", "seconds": None, "stderr": proc.stderr[-500:]}
+        runs.append(json.loads(proc.stdout.strip().splitlines()[-1])["seconds"])
+    return {"status": "ok", "seconds": round(min(runs), 4), "runs": [round(r, 4) for r in runs]}
+
+
+def _git_rev() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True
+        ).stdout.strip()
+    except OSError:
+        return ""
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """Regressions: slower than baseline by more than `threshold` (fraction), or newly failing."""
+    base = {(r["tool"], r["size"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for r in current["results"]:
+        old = base.get((r["tool"], r["size"]))
+        if not old or old["status"] != "ok":
+            continue
+        label = f"{r['tool']}@{r['size']}"
+        if r["status"] != "ok":
+            regressions.append(f"{label}: {r['status']} (baseline {old['seconds']}s)")
+        elif r["seconds"] > old["seconds"] * (1 + threshold):
+            pct = 100 * (r["seconds"] / old["seconds"] - 1)
+            regressions.append(f"{label}: {old['seconds']}s -> {r['seconds']}s (+{pct:.0f}%)")
+    return regressions
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Benchmark the content toolchain on synthetic corpora")
+    p.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="Card counts")
+    p.add_argument("--tools", default=",".join(TOOLS), help="Subset of: " + ", ".join(TOOLS))
+    p.add_argument("--repeat", type=int, default=3, help="Runs per measurement (min is kept)")
+    p.add_argument("--timeout", type=float, default=300.0, help="Seconds before a run is abandoned")
+    p.add_argument("--workdir", type=Path, default=None, help="Corpus cache (default: temp dir)")
+    p.add_argument("--out", type=Path, default=None, help="Results JSON path")
+    p.add_argument("--compare", type=Path, default=None, help="Baseline results JSON")
+    p.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown fraction")
+    p.add_argument("--child", nargs=2, metavar=("TOOL", "CORPUS"), help=argparse.SUPPRESS)
+    return p.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    if args.child:
+        tool, corpus = args.child
+        print(json.dumps({"seconds": _run_tool_inprocess(tool, Path(corpus))}))
+        return 0
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    tools = [t for t in args.tools.split(",") if t]
+    unknown = set(tools) - set(TOOLS)
+    if unknown:
+        print(f"[ERROR] Unknown tools: {', '.join(sorted(unknown))}")
+        return 2
+
+    with contextlib.ExitStack() as stack:
+        workdir = args.workdir or Path(stack.enter_context(tempfile.TemporaryDirectory()))
+        results = []
+        timed_out: set[str] = set()
+        for size in sizes:
+            started = time.perf_counter()
+            corpus = build_corpus(size, workdir)
+            print(f"== {size:,} cards (corpus ready in {time.perf_counter() - started:.1f}s)")
+            for tool in tools:
+                if tool in timed_out:  # a larger corpus cannot finish faster
+                    r = {"tool": tool, "size": size, "status": "skipped", "seconds": None}
+                else:
+                    r = {
+                        "tool": tool,
+                        "size": size,
+                        **measure(tool, corpus, args.repeat, args.timeout),
+                    }
+                if r["status"] == "timeout":
+                    timed_out.add(tool)
+                results.append(r)
+                shown = f"{r['seconds']:.3f}s" if r["status"] == "ok" else r["status"].upper()
+                print(f"   {tool:<20} {shown}")
+
+    report = {
+        "meta": {
+            "commit": _git_rev(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    out = args.out or OUT_DIR / f"content_bench_{report['meta']['commit'] or 'local'}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"[OK] Wrote {out}")
+
+    if args.compare:
+        regressions = compare(report, json.loads(args.compare.read_text()), args.threshold)
+        if regressions:
+            print(f"[FAIL] {len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print(f"[OK] No regressions over {args.threshold:.0%} vs {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Per-phase timing and memory instrumentation for the HELLDECK content tools.
+
+A tool wraps its passes in `prof.phase(...)`; with `--profile` on the command line it
+records wall time, tracemalloc peak memory and item counts per phase and writes a JSON
+trace (optionally also Chrome trace-event format, viewable in chrome://tracing or
+Perfetto). Without the flag every phase is a no-op, so tools pay nothing by default.
+
+Flags understood by every instrumented tool:
+  --profile[=PATH]      JSON trace to PATH (default: stderr)
+  --chrome-trace PATH   additionally write Chrome trace events to PATH
+
+Usage in a tool:
+  prof = Profiler.from_argv("lint_deck")      # strips the flags from sys.argv
+  with prof.phase("parse", deck=name) as ph:
+      cards = ...
+      ph.items = len(cards)
+  prof.finish()
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import sys
+import time
+import tracemalloc
+from typing import Iterator
+
+
+class Phase:
+    """One timed span. `items` is settable inside the `with` block."""
+
+    __slots__ = ("name", "depth", "start", "wall", "peak", "items", "tags")
+
+    def __init__(self, name: str, depth: int, start: float, tags: dict):
+        self.name = name
+        self.depth = depth
+        self.start = start
+        self.wall = 0.0
+        self.peak = 0
+        self.items: int | None = None
+        self.tags = tags
+
+    def to_dict(self, origin: float) -> dict:
+        d = {
+            "name": self.name,
+            "depth": self.depth,
+            "start_ms": round((self.start - origin) * 1000, 3),
+            "wall_ms": round(self.wall * 1000, 3),
+            "peak_bytes": self.peak,
+        }
+        if self.items is not None:
+            d["items"] = self.items
+            d["items_per_s"] = round(self.items / self.wall, 1) if self.wall > 0 else None
+        if self.tags:
+            d["tags"] = self.tags
+        return d
+
+
+class _NullPhase:
+    items = None
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class Profiler:
+    def __init__(
+        self, tool: str, out: str | None = None, chrome: str | None = None, enabled: bool = False
+    ):
+        self.tool = tool
+        self.out = out
+        self.chrome = chrome
+        self.enabled = enabled or chrome is not None
+        self.phases: list[Phase] = []
+        self.counters: dict[str, int] = {}
+        self._stack: list[Phase] = []
+        self._origin = time.perf_counter()
+        # Only stop tracemalloc in finish() if this profiler was the one to start it
+        self._started_tracing = self.enabled and not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+
+    # -- construction from the command line ---------------------------------
+
+    @classmethod
+    def from_argv(cls, tool: str, argv: list[str] | None = None) -> Profiler:
+        """Pop --profile/--chrome-trace from argv (default sys.argv) for tools without argparse."""
+        argv = sys.argv if argv is None else argv
+        out, chrome, enabled = None, None, False
+        rest = [argv[0]] if argv else []
+        i = 1
+        while i < len(argv):
+            arg = argv[i]
+            if arg == "--profile":
+                enabled = True
+            elif arg.startswith("--profile="):
+                enabled, out = True, arg.split("=", 1)[1]
+            elif arg == "--chrome-trace" and i + 1 < len(argv):
+                chrome = argv[i + 1]
+                i += 1
+            elif arg.startswith("--chrome-trace="):
+                chrome = arg.split("=", 1)[1]
+            else:
+                rest.append(arg)
+            i += 1
+        argv[:] = rest
+        return cls(tool, out, chrome, enabled)
+
+    @staticmethod
+    def add_arguments(parser: argparse.ArgumentParser) -> None:
+        parser.add_argument(
+            "--profile",
+            nargs="?",
+            const="-",
+            default=None,
+            metavar="PATH",
+            help="Write a per-phase timing/memory trace (JSON; default stderr)",
+        )
+        parser.add_argument(
+            "--chrome-trace",
+            default=None,
+            metavar="PATH",
+            help="Also write Chrome trace-event JSON",
+        )
+
+    @classmethod
+    def from_args(cls, tool: str, args: argparse.Namespace) -> Profiler:
+        out = None if args.profile in (None, "-") else args.profile
+        return cls(tool, out, args.chrome_trace, enabled=args.profile is not None)
+
+    # -- recording ------------------------------------------------------------
+
+    @contextlib.contextmanager
+    def phase(self, name: str, items: int | None = None, **tags) -> Iterator[Phase]:
+        if not self.enabled:
+            yield _NULL_PHASE
+            return
+        parent = self._stack[-1] if self._stack else None
+        if parent is not None:
+            # reset_peak below would lose the parent's high-water mark; bank it first.
+            parent.peak = max(parent.peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        ph = Phase(name, len(self._stack), time.perf_counter(), tags)
+        ph.items = items
+        self._stack.append(ph)
+        try:
+            yield ph
+        finally:
+            ph.wall = time.perf_counter() - ph.start
+            ph.peak = max(ph.peak, tracemalloc.get_traced_memory()[1])
+            self._stack.pop()
+            if parent is not None:
+                parent.peak = max(parent.peak, ph.peak)
+            self.phases.append(ph)
+
+    def count(self, name: str, n: int = 1) -> None:
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    # -- output -----------------------------------------------------------------
+
+    def report(self) -> dict:
+        phases = sorted(self.phases, key=lambda p: p.start)
+        return {
+            "tool": self.tool,
+            "argv": sys.argv[1:],
+            "wall_ms": round((time.perf_counter() - self._origin) * 1000, 3),
+            "peak_bytes": max((p.peak for p in phases), default=0),
+            "phases": [p.to_dict(self._origin) for p in phases],
+            "counters": self.counters,
+        }
+
+    def chrome_events(self) -> dict:
+        events = [
+            {
+                "name": p.name,
+                "cat": self.tool,
+                "ph": "X",
+                "ts": round((p.start - self._origin) * 1e6, 1),
+                "dur": round(p.wall * 1e6, 1),
+                "pid": 1,
+                "tid": 1,
+                "args": {"items": p.items, "peak_bytes": p.peak, **p.tags},
+            }
+            for p in sorted(self.phases, key=lambda p: p.start)
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def finish(self) -> None:
+        """Write the trace(s). Safe to call on a disabled profiler."""
+        if not self.enabled:
+            return
+        report = json.dumps(self.report(), indent=2)
+        if self.out:
+            with open(self.out, "w", encoding="utf-8") as f:
+                f.write(report)
+        else:
+            print(report, file=sys.stderr)
+        if self.chrome:
+            with open(self.chrome, "w", encoding="utf-8") as f:
+                json.dump(self.chrome_events(), f)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
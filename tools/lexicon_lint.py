@@ -9,7 +9,7 @@ Scans app/src/main/assets/lexicons_v2/*.json and reports:
  - article collisions (text begins with a/an/the/some but needs_article != none)
 
 Usage:
-  python tools/lexicon_lint.py
+  python tools/lexicon_lint.py [--profile[=PATH]] [--chrome-trace PATH]
 """
 
 from __future__ import annotations
@@ -20,6 +20,8 @@ import sys
 from pathlib import Path
 from typing import Iterable
 
+from instrument import Profiler
+
 LEX_DIR = Path("app/src/main/assets/lexicons_v2")
 ARTICLES = ("a ", "an ", "the ", "some ")
 EMOJI_RE = re.compile(r"[\U0001F300-\U0001FAFF\U00002600-\U000026FF\U00002700-\U000027BF]")
@@ -33,14 +35,29 @@ def is_ascii(s: str) -> bool:
         return False
 
 
-def lint_file(path: Path) -> list[str]:
+def lint_file(path: Path, prof: Profiler | None = None) -> list[str]:
+    # A caller-supplied profiler is finished by the caller; one made here is ours to finish
+    own = prof is None
+    if own:
+        prof = Profiler("lexicon_lint")
     msgs: list[str] = []
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except Exception as ex:
-        return [f"[ERROR] {path.name}: cannot parse JSON ({ex})"]
+        try:
+            with prof.phase("parse", path=path.name):
+                data = json.loads(path.read_text(encoding="utf-8"))
+        except Exception as ex:
+            return [f"[ERROR] {path.name}: cannot parse JSON ({ex})"]
+
+        entries = data.get("entries", [])
+        with prof.phase("check", items=len(entries), path=path.name):
+            _check_entries(path, entries, msgs)
+    finally:
+        if own:
+            prof.finish()
+    return msgs
+
 
-    entries = data.get("entries", [])
+def _check_entries(path: Path, entries: list, msgs: list[str]) -> None:
     for i, e in enumerate(entries):
         txt = (e.get("text") or "").strip()
         if not txt:
@@ -62,24 +79,26 @@ def lint_file(path: Path) -> list[str]:
                 f"[WARN] {path.name}#{i}: article collision (needs_article={needs}) -> '{txt}'"
             )
 
-    return msgs
-
 
 def main(argv: Iterable[str] | None = None) -> int:
-    if not LEX_DIR.is_dir():
-        print(f"[ERROR] Lexicon dir not found: {LEX_DIR}")
-        return 2
-    files = sorted(LEX_DIR.glob("*.json"))
-    total = 0
-    warn_count = 0
-    error_count = 0
-    for f in files:
-        total += 1
-        msgs = lint_file(f)
-        for m in msgs:
-            print(m)
-        warn_count += sum(m.startswith("[WARN]") for m in msgs)
-        error_count += sum(m.startswith("[ERROR]") for m in msgs)
+    prof = Profiler.from_argv("lexicon_lint", None if argv is None else ["lexicon_lint", *argv])
+    try:
+        if not LEX_DIR.is_dir():
+            print(f"[ERROR] Lexicon dir not found: {LEX_DIR}")
+            return 2
+        files = sorted(LEX_DIR.glob("*.json"))
+        total = 0
+        warn_count = 0
+        error_count = 0
+        for f in files:
+            total += 1
+            msgs = lint_file(f, prof)
+            for m in msgs:
+                print(m)
+            warn_count += sum(m.startswith("[WARN]") for m in msgs)
+            error_count += sum(m.startswith("[ERROR]") for m in msgs)
+    finally:
+        prof.finish()
     if warn_count == 0 and error_count == 0:
         print(f"[OK] {total} lexicons checked, no issues found.")
         return 0
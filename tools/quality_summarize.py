@@ -3,7 +3,7 @@
 Aggregate quality sweep JSONs into a compact Markdown summary per game.
 
 Usage:
-  python tools/quality_summarize.py
+  python tools/quality_summarize.py [--profile[=PATH]] [--chrome-trace PATH]
 Writes docs/quality_summary.md
 """
 
@@ -13,31 +13,49 @@ import json
 from collections import Counter, defaultdict
 from pathlib import Path
 
+from instrument import Profiler
+
 IN_DIR = Path("app/app/build/reports/cardlab/quality")
 OUT_MD = Path("docs/quality_summary.md")
 
 
 def main() -> int:
-    if not IN_DIR.is_dir():
-        print(f"[WARN] Input directory not found: {IN_DIR}")
-        return 0
+    prof = Profiler.from_argv("quality_summarize")
+    try:
+        if not IN_DIR.is_dir():
+            print(f"[WARN] Input directory not found: {IN_DIR}")
+            return 0
 
-    games = defaultdict(list)
-    for p in sorted(IN_DIR.glob("quality_*.json")):
-        try:
-            data = json.loads(p.read_text(encoding="utf-8"))
-        except Exception:
-            continue
-        summary = data.get("summary") or {}
-        game = summary.get("game") or p.stem.split("_")[1]
-        games[game].append(data)
+        games = defaultdict(list)
+        with prof.phase("load") as ph:
+            for p in sorted(IN_DIR.glob("quality_*.json")):
+                try:
+                    data = json.loads(p.read_text(encoding="utf-8"))
+                except Exception:
+                    continue
+                summary = data.get("summary") or {}
+                game = summary.get("game") or p.stem.split("_")[1]
+                games[game].append(data)
+            ph.items = sum(len(runs) for runs in games.values())
+
+        lines: list[str] = []
+        lines.append("# HELLDECK Card Quality Summary\n")
+        lines.append(
+            "Aggregated across all available sweeps in app/app/build/reports/cardlab/quality.\n"
+        )
+
+        with prof.phase("aggregate", items=len(games)):
+            _aggregate(games, lines)
+
+        with prof.phase("write"):
+            OUT_MD.write_text("\n".join(lines), encoding="utf-8")
+    finally:
+        prof.finish()
+    print(f"[OK] Wrote {OUT_MD}")
+    return 0
 
-    lines: list[str] = []
-    lines.append("# HELLDECK Card Quality Summary\n")
-    lines.append(
-        "Aggregated across all available sweeps in app/app/build/reports/cardlab/quality.\n"
-    )
 
+def _aggregate(games: dict, lines: list[str]) -> None:
     for game in sorted(games.keys()):
         runs = games[game]
         if not runs:
@@ -61,10 +79,6 @@ def main() -> int:
         lines.append(f"- Average score: {avg_score:.3f}\n")
         lines.append(f"- Top issues: {top_issues}\n\n")
 
-    OUT_MD.write_text("\n".join(lines), encoding="utf-8")
-    print(f"[OK] Wrote {OUT_MD}")
-    return 0
-
 
 if __name__ == "__main__":
     raise SystemExit(main())
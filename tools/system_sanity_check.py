@@ -2,60 +2,63 @@
 """
 Full System Sanity Check for HELLDECK
 Verifies all systems are aligned with HDRealRules.md
+
+Every check is a query over the shared asset graph (tools/asset_graph.py), which
+parses each source once and caches the result by content hash.
 """
 
-import json
 from pathlib import Path
 
+import asset_graph
+
+# Icons are product decisions (HDRealRules.md), so they stay spelled out here.
+REQUIRED_ICONS = {
+    "ROAST_CONS": "🎯",
+    "CONFESS_CAP": "🤥",
+    "POISON_PITCH": "💀",
+    "FILLIN": "✍️",
+    "RED_FLAG": "🚩",
+    "HOTSEAT_IMP": "🎭",
+    "TEXT_TRAP": "📱",
+    "TABOO": "⏱️",
+    "UNIFYING_THEORY": "📐",
+    "TITLE_FIGHT": "🥊",
+    "ALIBI": "🕵️",
+    "REALITY_CHECK": "🪞",
+    "SCATTER": "💣",
+    "OVER_UNDER": "📉",
+}
+
 
 class SystemSanityCheck:
     def __init__(self, base_path="."):
         self.base_path = Path(base_path)
+        self.graph = asset_graph.load(self.base_path)
         self.issues = []
         self.warnings = []
         self.passed_checks = []
 
     def check_1_game_metadata(self):
-        """Check GameMetadata.kt has all 14 games"""
+        """Check GameMetadata.kt registers every official game"""
         print("\n🔍 CHECK 1: GameMetadata.kt Validation")
         print("=" * 60)
 
-        file_path = self.base_path / "app/src/main/java/com/helldeck/engine/GameMetadata.kt"
-        with open(file_path) as f:
-            content = f.read()
-
-        required_games = {
-            "ROAST_CONSENSUS": "ROAST_CONS",
-            "CONFESSION_OR_CAP": "CONFESS_CAP",
-            "POISON_PITCH": "POISON_PITCH",
-            "FILL_IN_FINISHER": "FILLIN",
-            "RED_FLAG_RALLY": "RED_FLAG",
-            "HOT_SEAT_IMPOSTER": "HOTSEAT_IMP",
-            "TEXT_THREAD_TRAP": "TEXT_TRAP",
-            "TABOO_TIMER": "TABOO",
-            "THE_UNIFYING_THEORY": "UNIFYING_THEORY",
-            "TITLE_FIGHT": "TITLE_FIGHT",
-            "ALIBI_DROP": "ALIBI",
-            "REALITY_CHECK": "REALITY_CHECK",
-            "SCATTERBLAST": "SCATTER",
-            "OVER_UNDER": "OVER_UNDER",
-        }
-
-        for full_name, short_name in required_games.items():
-            if f"GameIds.{short_name}" in content or full_name in content:
+        registered = set(self.graph.registered)
+        for short_name, full_name in self.graph.games():
+            if short_name in registered:
                 print(f"  ✓ {full_name}")
             else:
                 self.issues.append(f"GameMetadata.kt missing {full_name}")
                 print(f"  ✗ {full_name}")
 
         # Check for legacy games
-        legacy_games = ["MAJORITY_REPORT", "ODD_ONE_OUT", "HYPE_OR_YIKE"]
-        for legacy in legacy_games:
-            if (
-                legacy in content
-                and "// REMOVED" not in content[content.find(legacy) : content.find(legacy) + 100]
-            ):
-                self.issues.append(f"GameMetadata.kt still has active reference to {legacy}")
+        for _, lineno, token, comment, _ in self.graph.legacy_hits(
+            asset_graph.METADATA_KT.as_posix()
+        ):
+            if not comment and token in asset_graph.LEGACY_GAMES:
+                self.issues.append(
+                    f"GameMetadata.kt:{lineno} still has active reference to {token}"
+                )
 
         if not self.issues:
             self.passed_checks.append("GameMetadata.kt validation")
@@ -64,50 +67,30 @@ class SystemSanityCheck:
             print("  ❌ GameMetadata.kt FAILED")
 
     def check_2_gold_cards(self):
-        """Check gold_cards.json has all 14 games with 50 cards each"""
+        """Check the gold bank has every official game with 50 cards each"""
         print("\n🔍 CHECK 2: Gold Cards Validation")
         print("=" * 60)
 
-        file_path = self.base_path / "app/src/main/assets/gold_cards.json"
-        with open(file_path) as f:
-            data = json.load(f)
-
-        required_games = [
-            "roast_consensus",
-            "confession_or_cap",
-            "poison_pitch",
-            "fill_in_finisher",
-            "red_flag_rally",
-            "hot_seat_imposter",
-            "text_thread_trap",
-            "taboo_timer",
-            "the_unifying_theory",
-            "title_fight",
-            "alibi_drop",
-            "reality_check",
-            "scatterblast",
-            "over_under",
-        ]
-
-        games = data.get("games", {})
-
-        for game in required_games:
-            if game in games:
-                card_count = len(games[game].get("cards", []))
+        counts = self.graph.gold_counts
+        if not counts:
+            self.issues.append(f"gold_cards: {asset_graph.GOLD_JSON} missing or empty")
+
+        for _, game in self.graph.games():
+            if game in counts:
+                card_count = counts[game]
                 if card_count >= 50:
                     print(f"  ✓ {game}: {card_count} cards")
                 else:
-                    self.issues.append(f"{game} has only {card_count} cards (need 50)")
+                    self.issues.append(f"gold_cards: {game} has only {card_count} cards (need 50)")
                     print(f"  ✗ {game}: {card_count} cards (need 50)")
             else:
-                self.issues.append(f"gold_cards.json missing {game}")
+                self.issues.append(f"gold_cards: missing {game}")
                 print(f"  ✗ {game}: MISSING")
 
         # Check for legacy games
-        legacy_games = ["majority_report", "odd_one_out", "hype_or_yike"]
-        for legacy in legacy_games:
-            if legacy in games:
-                self.issues.append(f"gold_cards.json still has {legacy}")
+        for legacy in asset_graph.LEGACY_GAMES:
+            if legacy in counts:
+                self.issues.append(f"gold_cards: still has {legacy}")
                 print(f"  ✗ Found legacy game: {legacy}")
 
         if not any(issue.startswith("gold_cards") for issue in self.issues):
@@ -117,44 +100,23 @@ class SystemSanityCheck:
             print("  ❌ Gold Cards FAILED")
 
     def check_3_template_files(self):
-        """Check all 14 games have template files"""
+        """Check every official game has v3 templates"""
         print("\n🔍 CHECK 3: Template Files Validation")
         print("=" * 60)
 
-        template_dir = self.base_path / "app/src/main/assets/templates_v3"
-
-        required_templates = [
-            "roast_consensus.json",
-            "confession_or_cap.json",
-            "poison_pitch.json",
-            "fill_in_finisher.json",
-            "red_flag.json",
-            "hot_seat_imposter.json",
-            "text_trap.json",
-            "taboo_timer.json",
-            "the_unifying_theory.json",
-            "title_fight.json",
-            "alibi_drop.json",
-            "reality_check.json",
-            "scatterblast.json",
-            "over_under.json",
-        ]
-
-        for template in required_templates:
-            file_path = template_dir / template
-            if file_path.exists():
-                print(f"  ✓ {template}")
+        templates = self.graph.templates_by_game
+        for _, game in self.graph.games():
+            if game in templates:
+                print(f"  ✓ {game}: {', '.join(sorted(templates[game]))}")
             else:
-                self.issues.append(f"Missing template: {template}")
-                print(f"  ✗ {template}")
+                self.issues.append(f"Missing template for {game}")
+                print(f"  ✗ {game}")
 
         # Check for legacy templates
-        legacy_templates = ["hype_or_yike.json", "odd_one_out.json", "majority_report.json"]
-        for legacy in legacy_templates:
-            file_path = template_dir / legacy
-            if file_path.exists():
-                self.issues.append(f"Legacy template still exists: {legacy}")
-                print(f"  ✗ Found legacy template: {legacy}")
+        for legacy in asset_graph.LEGACY_GAMES:
+            for file_name in templates.get(legacy, []):
+                self.issues.append(f"Legacy template still exists: {file_name}")
+                print(f"  ✗ Found legacy template: {file_name}")
 
         if not any("template" in issue.lower() for issue in self.issues):
             self.passed_checks.append("Template files validation")
@@ -167,37 +129,15 @@ class SystemSanityCheck:
         print("\n🔍 CHECK 4: Legacy Reference Check")
         print("=" * 60)
 
-        # Search for legacy references in Kotlin files
-        kt_files = list(self.base_path.glob("app/src/main/java/**/*.kt"))
-
-        legacy_patterns = [
-            "MAJORITY_REPORT",
-            "ODD_ONE_OUT",
-            "HYPE_OR_YIKE",
-            "GameIds.MAJORITY",
-            "GameIds.ODD_ONE",
-            "GameIds.HYPE_YIKE",
-        ]
-
         active_references = 0
         comment_references = 0
 
-        for kt_file in kt_files:
-            with open(kt_file) as f:
-                lines = f.readlines()
-
-            for i, line in enumerate(lines):
-                for pattern in legacy_patterns:
-                    if pattern in line:
-                        # Check if it's a comment
-                        stripped = line.strip()
-                        if stripped.startswith("//") or "/*" in line or "*/" in line:
-                            comment_references += 1
-                        else:
-                            active_references += 1
-                            self.warnings.append(
-                                f"{kt_file.name}:{i + 1} - Active reference: {pattern}"
-                            )
+        for path, lineno, token, comment, _ in self.graph.legacy_hits():
+            if comment:
+                comment_references += 1
+            else:
+                active_references += 1
+                self.warnings.append(f"{Path(path).name}:{lineno} - Active reference: {token}")
 
         print(f"  Active references: {active_references}")
         print(f"  Comment references: {comment_references}")
@@ -213,29 +153,8 @@ class SystemSanityCheck:
         print("\n🔍 CHECK 5: Game Icons Validation")
         print("=" * 60)
 
-        file_path = self.base_path / "app/src/main/java/com/helldeck/ui/GameIcons.kt"
-        with open(file_path) as f:
-            content = f.read()
-
-        required_icons = {
-            "ROAST_CONS": "🎯",
-            "CONFESS_CAP": "🤥",
-            "POISON_PITCH": "💀",
-            "FILLIN": "✍️",
-            "RED_FLAG": "🚩",
-            "HOTSEAT_IMP": "🎭",
-            "TEXT_TRAP": "📱",
-            "TABOO": "⏱️",
-            "UNIFYING_THEORY": "📐",
-            "TITLE_FIGHT": "🥊",
-            "ALIBI": "🕵️",
-            "REALITY_CHECK": "🪞",
-            "SCATTER": "💣",
-            "OVER_UNDER": "📉",
-        }
-
-        for game_id, expected_icon in required_icons.items():
-            if f"GameIds.{game_id}" in content and expected_icon in content:
+        for game_id, expected_icon in REQUIRED_ICONS.items():
+            if self.graph.icons.get(game_id) == expected_icon:
                 print(f"  ✓ {game_id}: {expected_icon}")
             else:
                 self.warnings.append(f"GameIcons.kt may have wrong icon for {game_id}")
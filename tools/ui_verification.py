@@ -1,95 +1,83 @@
 #!/usr/bin/env python3
 """
 UI Verification Script
-Checks that all 14 official games are properly integrated in the UI
+Checks that all 14 official games are properly integrated in the UI.
+The official game list comes from GamesRegistry.kt via the shared asset graph.
 """
 
 import os
 from pathlib import Path
 
-# Official 14 games from HDRealRules.md
-OFFICIAL_GAMES = [
-    "ROAST_CONS",  # Roast Consensus
-    "POISON_PITCH",  # Poison Pitch
-    "HOTSEAT_IMP",  # Hot Seat Imposter
-    "CONFESS_CAP",  # Confession or Cap
-    "FILLIN",  # Fill-In Finisher
-    "TEXT_TRAP",  # Text Thread Trap
-    "TABOO",  # Taboo Timer
-    "SCATTER",  # Scatterblast
-    "ALIBI",  # Alibi Drop
-    "TITLE_FIGHT",  # Title Fight
-    "RED_FLAG",  # Red Flag Rally
-    "OVER_UNDER",  # Over/Under
-    "REALITY_CHECK",  # Reality Check
-    "UNIFYING_THEORY",  # The Unifying Theory
+import asset_graph
+
+PICKER_KT = asset_graph.KOTLIN_ROOT / "com/helldeck/ui/components/GamePickerSheet.kt"
+RENDERER_KT = asset_graph.KOTLIN_ROOT / "com/helldeck/ui/interactions/InteractionRenderer.kt"
+
+# Key interaction types the renderer must route
+INTERACTION_TYPES = [
+    "VOTE_PLAYER",
+    "TRUE_FALSE",
+    "A_B_CHOICE",
+    "JUDGE_PICK",
+    "REPLY_TONE",
+    "TABOO_GUESS",
+    "SPEED_LIST",
+    "HIDE_WORDS",
+    "MINI_DUEL",
+    "ODD_EXPLAIN",
+    "PREDICT_VOTE",
 ]
 
 
-def check_game_metadata():
-    """Check GameMetadata.kt has all 14 games"""
+def check_game_metadata(graph):
+    """Check GameMetadata.kt has every official game"""
     print("✓ Checking GameMetadata.kt...")
-    metadata_file = Path("app/src/main/java/com/helldeck/engine/GameMetadata.kt")
 
-    if not metadata_file.exists():
+    if not graph.has_file(asset_graph.METADATA_KT):
         print("  ✗ GameMetadata.kt not found!")
         return False
 
-    content = metadata_file.read_text()
-    found_games = []
+    official = [short for short, _ in graph.games()]
+    missing = set(official) - set(graph.registered)
 
-    for game in OFFICIAL_GAMES:
-        if f"GameIds.{game}" in content:
-            found_games.append(game)
-
-    if len(found_games) == 14:
-        print("  ✓ All 14 games found in GameMetadata.kt")
+    if not missing:
+        print(f"  ✓ All {len(official)} games found in GameMetadata.kt")
         return True
     else:
-        print(f"  ✗ Only {len(found_games)}/14 games found")
-        missing = set(OFFICIAL_GAMES) - set(found_games)
+        print(f"  ✗ Only {len(official) - len(missing)}/{len(official)} games found")
         print(f"    Missing: {missing}")
         return False
 
 
-def check_game_icons():
-    """Check GameIcons.kt has icons for all 14 games"""
+def check_game_icons(graph):
+    """Check GameIcons.kt has icons for every official game"""
     print("✓ Checking GameIcons.kt...")
-    icons_file = Path("app/src/main/java/com/helldeck/ui/GameIcons.kt")
 
-    if not icons_file.exists():
+    if not graph.has_file(asset_graph.ICONS_KT):
         print("  ✗ GameIcons.kt not found!")
         return False
 
-    content = icons_file.read_text()
-    found_games = []
-
-    for game in OFFICIAL_GAMES:
-        if f'"{game}"' in content or f"GameIds.{game}" in content:
-            found_games.append(game)
+    official = [short for short, _ in graph.games()]
+    missing = set(official) - set(graph.icons)
 
-    if len(found_games) == 14:
-        print("  ✓ All 14 games have icons defined")
+    if not missing:
+        print(f"  ✓ All {len(official)} games have icons defined")
         return True
     else:
-        print(f"  ✗ Only {len(found_games)}/14 games have icons")
-        missing = set(OFFICIAL_GAMES) - set(found_games)
+        print(f"  ✗ Only {len(official) - len(missing)}/{len(official)} games have icons")
         print(f"    Missing: {missing}")
         return False
 
 
-def check_game_picker():
+def check_game_picker(graph):
     """Check GamePickerSheet uses getAllGameIds()"""
     print("✓ Checking GamePickerSheet.kt...")
-    picker_file = Path("app/src/main/java/com/helldeck/ui/components/GamePickerSheet.kt")
 
-    if not picker_file.exists():
+    if not graph.has_file(PICKER_KT):
         print("  ✗ GamePickerSheet.kt not found!")
         return False
 
-    content = picker_file.read_text()
-
-    if "getAllGameIds()" in content:
+    if "getAllGameIds" in graph.file_calls(PICKER_KT):
         print("  ✓ GamePickerSheet uses getAllGameIds() - all games accessible")
         return True
     else:
@@ -97,33 +85,15 @@ def check_game_picker():
         return False
 
 
-def check_interaction_renderer():
+def check_interaction_renderer(graph):
     """Check InteractionRenderer handles all interaction types"""
     print("✓ Checking InteractionRenderer.kt...")
-    renderer_file = Path("app/src/main/java/com/helldeck/ui/interactions/InteractionRenderer.kt")
 
-    if not renderer_file.exists():
+    if not graph.has_file(RENDERER_KT):
         print("  ✗ InteractionRenderer.kt not found!")
         return False
 
-    content = renderer_file.read_text()
-
-    # Check for key interaction types
-    interaction_types = [
-        "VOTE_PLAYER",
-        "TRUE_FALSE",
-        "A_B_CHOICE",
-        "JUDGE_PICK",
-        "REPLY_TONE",
-        "TABOO_GUESS",
-        "SPEED_LIST",
-        "HIDE_WORDS",
-        "MINI_DUEL",
-        "ODD_EXPLAIN",
-        "PREDICT_VOTE",
-    ]
-
-    found = sum(1 for it in interaction_types if it in content)
+    found = len(set(INTERACTION_TYPES) & graph.file_idents(RENDERER_KT))
 
     if found >= 10:
         print(f"  ✓ InteractionRenderer handles {found} interaction types")
@@ -140,12 +110,13 @@ def main():
     print()
 
     os.chdir(Path(__file__).parent.parent)
+    graph = asset_graph.load()
 
     checks = [
-        check_game_metadata(),
-        check_game_icons(),
-        check_game_picker(),
-        check_interaction_renderer(),
+        check_game_metadata(graph),
+        check_game_icons(graph),
+        check_game_picker(graph),
+        check_interaction_renderer(graph),
     ]
 
     print()
@@ -153,7 +124,7 @@ def main():
 
     if all(checks):
         print("✅ ALL UI CHECKS PASSED!")
-        print("All 14 games are properly integrated in the UI")
+        print(f"All {len(graph.games())} games are properly integrated in the UI")
         return 0
     else:
         print("❌ SOME UI CHECKS FAILED")